@@ -4,12 +4,19 @@ Uses SQLite for persistent storage of bot settings, admin list, and other data.
 """
 
 import aiosqlite
+import logging
 import os
 from datetime import datetime
 
+logger = logging.getLogger("bot.database")
+
 # Database file path (stored in the bot directory)
 DB_PATH = os.path.join(os.path.dirname(__file__), 'bot_data.db')
 
+# Admin user IDs, read from the admins table once and then kept in step by
+# add_admin/remove_admin, so admin checks don't query the database
+_admin_ids = None
+
 
 async def init_db():
     """
@@ -86,7 +93,9 @@ async def init_db():
         ''')
 
         await db.commit()
-        print(f"[DEBUG] Database initialized at {DB_PATH}")
+        logger.debug("Database initialized at %s", DB_PATH)
+
+    await load_admin_ids()
 
 
 # =============================================================================
@@ -124,7 +133,7 @@ async def set_setting(key: str, value: str, user_id: int = None, username: str =
                 updated_by_username = excluded.updated_by_username
         ''', (key, value, datetime.now().isoformat(), user_id, username))
         await db.commit()
-        print(f"[DEBUG] Setting '{key}' updated to '{value}' by {username} ({user_id})")
+        logger.debug("Setting '%s' updated to '%s' by %s (%s)", key, value, username, user_id)
 
 
 async def delete_setting(key: str):
@@ -132,7 +141,7 @@ async def delete_setting(key: str):
     async with aiosqlite.connect(DB_PATH) as db:
         await db.execute('DELETE FROM bot_settings WHERE key = ?', (key,))
         await db.commit()
-        print(f"[DEBUG] Setting '{key}' deleted")
+        logger.debug("Setting '%s' deleted", key)
 
 
 async def get_setting_info(key: str):
@@ -254,14 +263,20 @@ async def get_status_info():
 # ADMIN MANAGEMENT FUNCTIONS
 # =============================================================================
 
+async def load_admin_ids():
+    """(Re)load the in-memory set of admin user IDs from the database."""
+    global _admin_ids
+    async with aiosqlite.connect(DB_PATH) as db:
+        async with db.execute('SELECT user_id FROM admins') as cursor:
+            rows = await cursor.fetchall()
+    _admin_ids = {row[0] for row in rows}
+    return _admin_ids
+
+
 async def is_admin(user_id: int) -> bool:
     """Check if a user is an admin."""
-    async with aiosqlite.connect(DB_PATH) as db:
-        async with db.execute(
-            'SELECT 1 FROM admins WHERE user_id = ?', (user_id,)
-        ) as cursor:
-            row = await cursor.fetchone()
-            return row is not None
+    admin_ids = _admin_ids if _admin_ids is not None else await load_admin_ids()
+    return user_id in admin_ids
 
 
 async def add_admin(user_id: int, username: str, added_by_user_id: int = None, added_by_username: str = None):
@@ -274,7 +289,9 @@ async def add_admin(user_id: int, username: str, added_by_user_id: int = None, a
                 username = excluded.username
         ''', (user_id, username, datetime.now().isoformat(), added_by_user_id, added_by_username))
         await db.commit()
-        print(f"[DEBUG] Admin added: {username} ({user_id}) by {added_by_username}")
+        if _admin_ids is not None:
+            _admin_ids.add(user_id)
+        logger.debug("Admin added: %s (%s) by %s", username, user_id, added_by_username)
 
 
 async def remove_admin(user_id: int):
@@ -282,7 +299,9 @@ async def remove_admin(user_id: int):
     async with aiosqlite.connect(DB_PATH) as db:
         await db.execute('DELETE FROM admins WHERE user_id = ?', (user_id,))
         await db.commit()
-        print(f"[DEBUG] Admin removed: {user_id}")
+        if _admin_ids is not None:
+            _admin_ids.discard(user_id)
+        logger.debug("Admin removed: %s", user_id)
 
 
 async def get_all_admins():
@@ -443,7 +462,7 @@ async def add_form_to_list(form_id: str, form_title: str, user_id: int = None, u
                 added_by_username = excluded.added_by_username
         ''', (form_id, form_title, datetime.now().isoformat(), user_id, username))
         await db.commit()
-        print(f"[DEBUG] Form added to list: {form_title} ({form_id}) by {username}")
+        logger.debug("Form added to list: %s (%s) by %s", form_title, form_id, username)
 
 
 async def remove_form_from_list(form_id: str):
@@ -451,7 +470,7 @@ async def remove_form_from_list(form_id: str):
     async with aiosqlite.connect(DB_PATH) as db:
         await db.execute('DELETE FROM forms_list WHERE form_id = ?', (form_id,))
         await db.commit()
-        print(f"[DEBUG] Form removed from list: {form_id}")
+        logger.debug("Form removed from list: %s", form_id)
 
 
 async def get_forms_list():
@@ -498,7 +517,7 @@ async def subscribe_to_reminders(user_id: int, chat_id: int, username: str = Non
                 enabled = 1
         ''', (user_id, chat_id, username, datetime.now().isoformat()))
         await db.commit()
-        print(f"[DEBUG] User {username} ({user_id}) subscribed to reminders")
+        logger.debug("User %s (%s) subscribed to reminders", username, user_id)
 
 
 async def unsubscribe_from_reminders(user_id: int):
@@ -509,7 +528,7 @@ async def unsubscribe_from_reminders(user_id: int):
             (user_id,)
         )
         await db.commit()
-        print(f"[DEBUG] User {user_id} unsubscribed from reminders")
+        logger.debug("User %s unsubscribed from reminders", user_id)
 
 
 async def is_subscribed_to_reminders(user_id: int) -> bool:
@@ -1,13 +1,41 @@
 import os
 import time
+import random
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from urllib.parse import urlparse
 import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
-from openai import OpenAI
+import httpx
+from openai import OpenAI, AsyncOpenAI, APIStatusError
 from jotform import JotformAPIClient
 from telegram import Update, BotCommand, InlineKeyboardButton, InlineKeyboardMarkup
-from telegram.ext import Application, CommandHandler, MessageHandler, filters, ContextTypes, ConversationHandler, CallbackQueryHandler
+from telegram.constants import ChatAction, ChatType
+from telegram.ext import Application, CommandHandler, MessageHandler, filters, ContextTypes, ConversationHandler, CallbackQueryHandler, AIORateLimiter
 import json
+import pickle
+try:
+    import orjson  # optional C-accelerated JSON encoder for cache fingerprints
+except ImportError:
+    orjson = None
+try:
+    import ahocorasick  # optional C implementation of KeywordAutomaton (pyahocorasick)
+except ImportError:
+    ahocorasick = None
+try:
+    from rapidfuzz import fuzz, process as fuzz_process  # optional C++ fuzzy matching for /products search
+    from rapidfuzz.distance import Levenshtein  # and edit distances for the FAQ typo fallback
+except ImportError:
+    fuzz = fuzz_process = Levenshtein = None
+import difflib
 import re
+import hashlib
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
 
 # Import database module
 from database import (
@@ -28,11 +56,68 @@ from dateutil import parser as date_parser
 
 load_dotenv()
 
+logger = logging.getLogger("bot")
+
+# Log verbosity for the bot's own loggers (DEBUG shows every lookup step)
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO').upper()
+
 # Cache TTL configuration (default: 5 minutes)
 CACHE_TTL_SECONDS = int(os.getenv('CACHE_TTL_SECONDS', 300))
 OPENAI_TIMEOUT_SECONDS = int(os.getenv('OPENAI_TIMEOUT_SECONDS', 30))
 OPENAI_MAX_RETRIES = int(os.getenv('OPENAI_MAX_RETRIES', 3))
 OPENAI_BACKOFF_SECONDS = float(os.getenv('OPENAI_BACKOFF_SECONDS', 1))
+# Fail fast when OpenAI can't be reached; OPENAI_TIMEOUT_SECONDS still bounds the full request
+OPENAI_CONNECT_TIMEOUT_SECONDS = float(os.getenv('OPENAI_CONNECT_TIMEOUT_SECONDS', 3))
+# Size of the shared OpenAI connection pool (half of it kept alive between calls)
+OPENAI_MAX_CONNECTIONS = int(os.getenv('OPENAI_MAX_CONNECTIONS', 100))
+# Max OpenAI requests in flight at once; extra requests wait in-process instead of piling
+# onto the API and coming back as 429s
+OPENAI_MAX_CONCURRENCY = int(os.getenv('OPENAI_MAX_CONCURRENCY', 20))
+# Retries wait as long as a rate-limited response's Retry-After header asks, up to this
+# many seconds (so a long server-side wait can't hold a user's request indefinitely)
+MAX_RETRY_AFTER_SECONDS = 30
+# Stale-while-revalidate: past CACHE_TTL_SECONDS (but within this age) cached JotForm data
+# is served immediately while a background refresh runs; older data is refetched inline
+CACHE_STALE_TTL_SECONDS = int(os.getenv('CACHE_STALE_TTL_SECONDS', CACHE_TTL_SECONDS * 2))
+# Prefetch: every PREFETCH_INTERVAL_SECONDS, products read at least PREFETCH_MIN_HITS times
+# since their last refresh are refetched in the background once PREFETCH_AGE_FRACTION of
+# the TTL has passed, so busy forms never expire in front of a user (0 disables it)
+PREFETCH_INTERVAL_SECONDS = int(os.getenv('PREFETCH_INTERVAL_SECONDS', 30))
+PREFETCH_MIN_HITS = 3
+PREFETCH_AGE_FRACTION = 0.8
+# A form's products and its metadata both come from its properties; a refresh of one
+# reuses properties fetched this recently by the other instead of calling JotForm again
+FORM_PROPERTIES_REUSE_SECONDS = 30
+# Max JotForm API calls in flight at once across all users and background refreshes
+JOTFORM_MAX_CONCURRENCY = int(os.getenv('JOTFORM_MAX_CONCURRENCY', 4))
+# Worker threads that run blocking JotForm lookups for the async handlers
+JOTFORM_MAX_WORKERS = int(os.getenv('JOTFORM_MAX_WORKERS', 8))
+# File the JotForm caches are saved to so a restart starts warm (empty disables it)
+JOTFORM_CACHE_PATH = os.getenv('JOTFORM_CACHE_PATH', os.path.join(os.path.dirname(__file__), 'jotform_cache.pkl'))
+# Max entries kept in the in-process message caches (form classification, answers)
+MESSAGE_CACHE_MAX_ENTRIES = int(os.getenv('MESSAGE_CACHE_MAX_ENTRIES', 1024))
+# How long a generated answer is reused for the same question. Answer cache keys include
+# the form data in the prompt, so a catalog change is never answered from the cache and
+# this can be much longer than CACHE_TTL_SECONDS
+ANSWER_CACHE_TTL_SECONDS = int(os.getenv('ANSWER_CACHE_TTL_SECONDS', 3600))
+# How long the admin-set current GB read from the database is reused
+CURRENT_GB_CACHE_SECONDS = int(os.getenv('CURRENT_GB_CACHE_SECONDS', 30))
+# /products <search> falls back to typo-tolerant matching when no name contains the
+# search term: names scoring at least this (0-100) are listed, best first
+PRODUCT_SEARCH_MIN_SCORE = 70
+PRODUCT_SEARCH_MAX_RESULTS = 25
+# Messages with no exact FAQ keyword still get the FAQ answer when they contain a
+# keyword of at least FAQ_FUZZY_MIN_KEYWORD_LENGTH characters with one letter missing
+# ("shippng", "refnd"), or two for keywords of FAQ_FUZZY_TWO_EDIT_LENGTH+ characters.
+# Only unknown words of FAQ_FUZZY_MIN_WORD_LENGTH+ characters count as typos: shorter
+# words are too often a different real word ("same" / "safe")
+FAQ_FUZZY_MIN_KEYWORD_LENGTH = 5
+FAQ_FUZZY_TWO_EDIT_LENGTH = 8
+FAQ_FUZZY_MIN_WORD_LENGTH = 5
+# Earlier form choices compared against each new message embedding (a linear scan,
+# so kept small) and the cosine similarity at which a paraphrase reuses the choice
+SEMANTIC_CACHE_MAX_ENTRIES = int(os.getenv('SEMANTIC_CACHE_MAX_ENTRIES', 256))
+FORM_CHOICE_SIMILARITY_THRESHOLD = float(os.getenv('FORM_CHOICE_SIMILARITY_THRESHOLD', 0.93))
 
 # Admin contact for problem reports
 ADMIN_USERNAME = os.getenv('ADMIN_USERNAME', 'Emilycarolinemarch')
@@ -43,6 +128,18 @@ REPORT_WAITING_INVOICE, REPORT_WAITING_DESCRIPTION, REPORT_WAITING_PHOTO = range
 # Check status conversation states
 STATUS_WAITING_FORM, STATUS_WAITING_IDENTIFIER = range(10, 12)
 
+# Outgoing Telegram rate limits (Bot API: ~30 msg/s overall, 20 msg/min per group)
+TELEGRAM_MAX_MESSAGES_PER_SECOND = float(os.getenv('TELEGRAM_MAX_MESSAGES_PER_SECOND', 30))
+TELEGRAM_GROUP_MAX_MESSAGES_PER_MINUTE = float(os.getenv('TELEGRAM_GROUP_MAX_MESSAGES_PER_MINUTE', 20))
+TELEGRAM_RATE_LIMIT_RETRIES = int(os.getenv('TELEGRAM_RATE_LIMIT_RETRIES', 3))
+
+# Webhook mode: when WEBHOOK_URL is set, Telegram pushes updates to this public HTTPS URL
+# instead of the bot long-polling getUpdates; the local server listens on WEBHOOK_LISTEN:PORT
+WEBHOOK_URL = os.getenv('WEBHOOK_URL')
+WEBHOOK_LISTEN = os.getenv('WEBHOOK_LISTEN', '0.0.0.0')
+WEBHOOK_PORT = int(os.getenv('PORT', 8443))
+WEBHOOK_SECRET_TOKEN = os.getenv('WEBHOOK_SECRET_TOKEN')
+
 # Conversation timeout (in seconds) - conversations expire after this time
 CONVERSATION_TIMEOUT = int(os.getenv('CONVERSATION_TIMEOUT_SECONDS', 300))  # 5 minutes default
 
@@ -81,7 +178,7 @@ def get_conversation_context(context):
     if ctx and 'timestamp' in ctx:
         age = time.time() - ctx['timestamp']
         if age > CONVERSATION_CONTEXT_TTL:
-            print(f"[DEBUG] get_conversation_context - Context expired (age: {age:.0f}s)")
+            logger.debug("get_conversation_context - Context expired (age: %.0fs)", age)
             context.user_data[CONTEXT_KEY_CONVERSATION] = {}
             return {}
 
@@ -106,14 +203,14 @@ def update_conversation_context(context, **kwargs):
     ctx.update(kwargs)
     ctx['timestamp'] = time.time()
     context.user_data[CONTEXT_KEY_CONVERSATION] = ctx
-    print(f"[DEBUG] update_conversation_context - Updated: {list(kwargs.keys())}")
+    logger.debug("update_conversation_context - Updated: %s", list(kwargs.keys()))
     return ctx
 
 
 def clear_conversation_context(context):
     """Clear only the conversation context, preserving other user data."""
     context.user_data.pop(CONTEXT_KEY_CONVERSATION, None)
-    print(f"[DEBUG] clear_conversation_context - Cleared")
+    logger.debug("clear_conversation_context - Cleared")
 
 
 def extract_topic_from_message(message_text):
@@ -223,7 +320,7 @@ async def track_event(event_type: str, user=None, data: dict = None):
         event_data = json.dumps(data) if data else None
         await log_event(event_type, event_data, user_id, username)
     except Exception as e:
-        print(f"[DEBUG] track_event failed: {e}")
+        logger.debug("track_event failed: %s", e)
 
 
 async def notify_admins(context, message: str, photo_file_id: str = None):
@@ -241,7 +338,7 @@ async def notify_admins(context, message: str, photo_file_id: str = None):
                 await context.bot.send_photo(chat_id=int(ADMIN_CHAT_ID), photo=photo_file_id)
             sent_count += 1
         except Exception as e:
-            print(f"[ERROR] notify_admins - Failed to send to ADMIN_CHAT_ID: {e}")
+            logger.error("notify_admins - Failed to send to ADMIN_CHAT_ID: %s", e)
 
     # Also notify all registered admins
     try:
@@ -256,9 +353,9 @@ async def notify_admins(context, message: str, photo_file_id: str = None):
                     await context.bot.send_photo(chat_id=admin['user_id'], photo=photo_file_id)
                 sent_count += 1
             except Exception as e:
-                print(f"[DEBUG] notify_admins - Failed to send to admin {admin['user_id']}: {e}")
+                logger.debug("notify_admins - Failed to send to admin %s: %s", admin['user_id'], e)
     except Exception as e:
-        print(f"[ERROR] notify_admins - Failed to get admins: {e}")
+        logger.error("notify_admins - Failed to get admins: %s", e)
 
     return sent_count
 
@@ -291,19 +388,41 @@ def validate_form_id(form_id: str, available_forms: dict):
         return form_id, available_forms[form_id].get('title', 'Unknown'), None
 
     # Try to find by title
-    form_id_lower = form_id.lower()
-    for fid, fdata in available_forms.items():
-        if form_id_lower in fdata.get('title', '').lower():
-            return fid, fdata.get('title', 'Unknown'), None
+    fid, title = jotform_helper.find_form_by_title(form_id, available_forms)
+    if fid:
+        return fid, title, None
 
     return None, None, f"Could not find a form matching '{form_id}'."
 
 
-def log_error(context, error, extra=None):
-    print(f"[ERROR] {context} - {error}")
+def log_error(context, error, extra=None, exc_info=False):
+    """Log an error with optional context values; exc_info=True includes the traceback."""
+    logger.error("%s - %s", context, error, exc_info=exc_info)
     if extra:
         for key, value in extra.items():
-            print(f"[ERROR] {context} - {key}: {value}")
+            logger.error("%s - %s: %s", context, key, value)
+
+
+# MOQ phrasings in product descriptions, ordered by specificity (most specific first)
+_MOQ_UNIT = r'(?:units?|vials?|bottles?|pieces?|pcs?|kits?)'
+MOQ_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    # MOQ explicit patterns
+    rf'moq[:\s]*(\d+(?:\s*{_MOQ_UNIT})?)',
+    rf'minimum\s+order\s+(?:quantity|qty)?[:\s]*(\d+(?:\s*{_MOQ_UNIT})?)',
+    rf'min(?:imum)?\s+order[:\s]*(\d+(?:\s*{_MOQ_UNIT})?)',
+    rf'min(?:imum)?\s+qty[:\s]*(\d+(?:\s*{_MOQ_UNIT})?)',
+    rf'min[:\s]+(\d+(?:\s*{_MOQ_UNIT})?)',
+    # Reverse patterns: "10 unit minimum"
+    rf'(\d+)\s*{_MOQ_UNIT}?\s+min(?:imum)?(?:\s+order)?',
+    # Simple "minimum X" at word boundary
+    r'\bminimum[:\s]*(\d+)',
+))
+# One "Name (x2) - $30" style line of a payment field's prettyFormat text
+PRETTY_ITEM_LINE_RE = re.compile(
+    r'^(?P<name>.+?)(?:\s*\(x(?P<qty>\d+)\))?(?:\s*x(?P<qty_alt>\d+))?(?:\s*-\s*\$?(?P<price>[\d.,]+))?$'
+)
+# HTML markup JotForm leaves in submitted product names
+HTML_TAG_RE = re.compile(r'<[^>]+>')
 
 
 def extract_moq_from_description(description):
@@ -324,22 +443,8 @@ def extract_moq_from_description(description):
 
     description_lower = description.lower()
 
-    # Pattern list - ordered by specificity (most specific first)
-    patterns = [
-        # MOQ explicit patterns
-        r'moq[:\s]*(\d+(?:\s*(?:units?|vials?|bottles?|pieces?|pcs?|kits?))?)',
-        r'minimum\s+order\s+(?:quantity|qty)?[:\s]*(\d+(?:\s*(?:units?|vials?|bottles?|pieces?|pcs?|kits?))?)',
-        r'min(?:imum)?\s+order[:\s]*(\d+(?:\s*(?:units?|vials?|bottles?|pieces?|pcs?|kits?))?)',
-        r'min(?:imum)?\s+qty[:\s]*(\d+(?:\s*(?:units?|vials?|bottles?|pieces?|pcs?|kits?))?)',
-        r'min[:\s]+(\d+(?:\s*(?:units?|vials?|bottles?|pieces?|pcs?|kits?))?)',
-        # Reverse patterns: "10 unit minimum"
-        r'(\d+)\s*(?:units?|vials?|bottles?|pieces?|pcs?|kits?)?\s+min(?:imum)?(?:\s+order)?',
-        # Simple "minimum X" at word boundary
-        r'\bminimum[:\s]*(\d+)',
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, description_lower)
+    for pattern in MOQ_PATTERNS:
+        match = pattern.search(description_lower)
         if match:
             moq_value = match.group(1).strip()
             # Clean up and format the result
@@ -347,35 +452,158 @@ def extract_moq_from_description(description):
                 # If it's just a number, add "units"
                 if moq_value.isdigit():
                     moq_value = f"{moq_value} units"
-                print(f"[DEBUG] extract_moq_from_description - Found MOQ: '{moq_value}' using pattern: {pattern}")
+                logger.debug("extract_moq_from_description - Found MOQ: '%s' using pattern: %s", moq_value, pattern.pattern)
                 return moq_value
 
     return None
 
 
+# Shared OpenAI client - reuses one HTTP connection pool (keep-alive) across all calls
+_openai_client = None
+_openai_client_lock = threading.Lock()
+
+
+def get_openai_client():
+    """
+    Return the process-wide OpenAI client, creating it on first use.
+    Created lazily so a missing OPENAI_API_KEY only fails the calls that need it,
+    not the bot's startup.
+    """
+    global _openai_client
+    if _openai_client is None:
+        with _openai_client_lock:
+            if _openai_client is None:
+                http_client = httpx.Client(
+                    limits=httpx.Limits(
+                        max_connections=OPENAI_MAX_CONNECTIONS,
+                        max_keepalive_connections=max(1, OPENAI_MAX_CONNECTIONS // 2)
+                    ),
+                    timeout=get_openai_timeout()
+                )
+                # Retries are handled by call_openai_with_retry(_async), so the SDK's own
+                # retry loop is disabled to avoid multiplying attempts
+                _openai_client = OpenAI(
+                    api_key=os.getenv('OPENAI_API_KEY'),
+                    http_client=http_client,
+                    max_retries=0
+                )
+    return _openai_client
+
+
+# Async OpenAI client for calls made directly from handlers (form selection, embeddings
+# and answers), so a slow completion only parks a coroutine instead of holding a worker thread
+_async_openai_client = None
+
+
+def get_async_openai_client():
+    """Return the process-wide AsyncOpenAI client, creating it on first use (see get_openai_client)."""
+    global _async_openai_client
+    if _async_openai_client is None:
+        http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=OPENAI_MAX_CONNECTIONS,
+                max_keepalive_connections=max(1, OPENAI_MAX_CONNECTIONS // 2)
+            ),
+            timeout=get_openai_timeout()
+        )
+        _async_openai_client = AsyncOpenAI(
+            api_key=os.getenv('OPENAI_API_KEY'),
+            http_client=http_client,
+            max_retries=0
+        )
+    return _async_openai_client
+
+
+# Caps concurrent OpenAI requests from worker threads (sync client) and from
+# coroutines (async client); each path gets OPENAI_MAX_CONCURRENCY slots
+_openai_semaphore = threading.BoundedSemaphore(OPENAI_MAX_CONCURRENCY)
+_async_openai_semaphore = None
+
+
+def get_async_openai_semaphore():
+    """Created on first use so it belongs to the running event loop."""
+    global _async_openai_semaphore
+    if _async_openai_semaphore is None:
+        _async_openai_semaphore = asyncio.Semaphore(OPENAI_MAX_CONCURRENCY)
+    return _async_openai_semaphore
+
+
+def is_retryable_openai_error(error):
+    """Rate limits (429), server errors (5xx), timeouts and connection errors are worth retrying;
+    other 4xx responses (bad request, auth, not found) will fail the same way again."""
+    if isinstance(error, APIStatusError):
+        return error.status_code == 429 or error.status_code >= 500
+    return True
+
+
+def get_retry_after_seconds(error):
+    """
+    Seconds the server asked us to wait before retrying, from the retry-after-ms or
+    Retry-After header of the error's HTTP response, capped at MAX_RETRY_AFTER_SECONDS.
+    Returns None when the error carries no usable header (e.g. an HTTP-date value).
+    """
+    response = getattr(error, 'response', None)
+    headers = getattr(response, 'headers', None) or getattr(error, 'headers', None)
+    if not headers:
+        return None
+    try:
+        retry_after_ms = headers.get('retry-after-ms')
+        if retry_after_ms is not None:
+            seconds = float(retry_after_ms) / 1000
+        else:
+            retry_after = headers.get('retry-after')
+            if retry_after is None:
+                return None
+            seconds = float(retry_after)
+    except (TypeError, ValueError):
+        return None
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER_SECONDS)
+
+
+def get_openai_backoff(backoff_seconds, attempt, error=None):
+    """
+    The wait the server asked for (see get_retry_after_seconds), otherwise exponential
+    backoff with full jitter so retries from concurrent users don't line up.
+    """
+    retry_after = get_retry_after_seconds(error)
+    if retry_after is not None:
+        return retry_after
+    return random.uniform(0, backoff_seconds * (2 ** (attempt - 1)))
+
+
+def call_openai_limited(call_fn, timeout_seconds):
+    """Make one OpenAI request while holding a concurrency slot."""
+    with _openai_semaphore:
+        return call_fn(timeout=get_openai_timeout(timeout_seconds))
+
+
+def get_openai_timeout(timeout_seconds=OPENAI_TIMEOUT_SECONDS):
+    """Request timeout for OpenAI calls: bounded overall, with a short connect phase."""
+    return httpx.Timeout(timeout_seconds, connect=min(OPENAI_CONNECT_TIMEOUT_SECONDS, timeout_seconds))
+
+
 async def call_openai_with_retry_async(operation_name, call_fn, max_retries=OPENAI_MAX_RETRIES,
                                         backoff_seconds=OPENAI_BACKOFF_SECONDS,
                                         timeout_seconds=OPENAI_TIMEOUT_SECONDS):
     """
     Async version of OpenAI retry logic that doesn't block the event loop.
-    Uses asyncio.sleep() for backoff instead of time.sleep().
+    call_fn(timeout) must return an awaitable request on the AsyncOpenAI client
+    (get_async_openai_client()). Uses asyncio.sleep() for backoff instead of time.sleep().
     """
     last_error = None
     for attempt in range(1, max_retries + 1):
         try:
-            # Run the sync OpenAI call in a thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(None, lambda: call_fn(timeout=timeout_seconds))
-            return result
+            async with get_async_openai_semaphore():
+                return await call_fn(timeout=get_openai_timeout(timeout_seconds))
         except Exception as e:
             last_error = e
             log_error(f"{operation_name} attempt {attempt}/{max_retries}", e)
-            if attempt >= max_retries:
+            if attempt >= max_retries or not is_retryable_openai_error(e):
                 raise ExternalServiceError(
-                    f"{operation_name} failed after {max_retries} attempts"
+                    f"{operation_name} failed after {attempt} attempts"
                 ) from e
-            sleep_seconds = backoff_seconds * (2 ** (attempt - 1))
-            print(f"[DEBUG] {operation_name} - retrying in {sleep_seconds:.1f}s")
+            sleep_seconds = get_openai_backoff(backoff_seconds, attempt, e)
+            logger.debug("%s - retrying in %.1fs", operation_name, sleep_seconds)
             await asyncio.sleep(sleep_seconds)
 
     raise ExternalServiceError(f"{operation_name} failed after retries") from last_error
@@ -390,20 +618,443 @@ def call_openai_with_retry(operation_name, call_fn, max_retries=OPENAI_MAX_RETRI
     last_error = None
     for attempt in range(1, max_retries + 1):
         try:
-            return call_fn(timeout=timeout_seconds)
+            return call_openai_limited(call_fn, timeout_seconds)
         except Exception as e:
             last_error = e
             log_error(f"{operation_name} attempt {attempt}/{max_retries}", e)
-            if attempt >= max_retries:
+            if attempt >= max_retries or not is_retryable_openai_error(e):
                 raise ExternalServiceError(
-                    f"{operation_name} failed after {max_retries} attempts"
+                    f"{operation_name} failed after {attempt} attempts"
                 ) from e
-            sleep_seconds = backoff_seconds * (2 ** (attempt - 1))
-            print(f"[DEBUG] {operation_name} - retrying in {sleep_seconds:.1f}s")
+            sleep_seconds = get_openai_backoff(backoff_seconds, attempt, e)
+            logger.debug("%s - retrying in %.1fs", operation_name, sleep_seconds)
             time.sleep(sleep_seconds)
 
     raise ExternalServiceError(f"{operation_name} failed after retries") from last_error
 
+async def stream_openai_with_retry_async(operation_name, call_fn, on_text, max_retries=OPENAI_MAX_RETRIES,
+                                         backoff_seconds=OPENAI_BACKOFF_SECONDS,
+                                         timeout_seconds=OPENAI_TIMEOUT_SECONDS):
+    """
+    Streaming variant of call_openai_with_retry_async. call_fn(timeout) must create a
+    stream=True completion on the AsyncOpenAI client; on_text(text) is called with the
+    text received so far after each chunk and must not block (it runs while holding an
+    OpenAI concurrency slot). Returns the full text.
+    Only failures before the first chunk are retried (the user may already see the rest).
+    """
+    last_error = None
+    for attempt in range(1, max_retries + 1):
+        text = ''
+        try:
+            async with get_async_openai_semaphore():
+                stream = await call_fn(timeout=get_openai_timeout(timeout_seconds))
+                async for chunk in stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        text += chunk.choices[0].delta.content
+                        on_text(text)
+            return text
+        except Exception as e:
+            last_error = e
+            log_error(f"{operation_name} attempt {attempt}/{max_retries}", e)
+            if text or attempt >= max_retries or not is_retryable_openai_error(e):
+                raise ExternalServiceError(
+                    f"{operation_name} failed after {attempt} attempts"
+                ) from e
+            sleep_seconds = get_openai_backoff(backoff_seconds, attempt, e)
+            logger.debug("%s - retrying in %.1fs", operation_name, sleep_seconds)
+            await asyncio.sleep(sleep_seconds)
+
+    raise ExternalServiceError(f"{operation_name} failed after retries") from last_error
+
+# =============================================================================
+# MESSAGE NORMALIZATION
+# =============================================================================
+# Question lead-ins stripped before FAQ matching ("can you explain shipping" -> "shipping")
+FAQ_FILLER_PHRASES = ('can you tell me', 'could you tell me', 'please tell me', 'i want to know',
+                      'i need to know', 'can you explain', 'please explain')
+FAQ_FILLER_RE = re.compile('|'.join(re.escape(phrase) for phrase in FAQ_FILLER_PHRASES))
+
+_WORD_RE = re.compile(r'\w+')
+_DIGITS_RE = re.compile(r'\d+')
+
+
+@dataclass(frozen=True)
+class MessageContext:
+    """
+    A user message normalized once per request and shared by all matchers.
+
+    - raw: the original message text
+    - lower: lowercased text
+    - clean: lowercased, stripped text with FAQ filler phrases removed
+    - tokens: set of word tokens in the lowercased text
+    - digits: set of digit runs in the text (dosages like "30", "50")
+    """
+    raw: str
+    lower: str
+    clean: str
+    tokens: frozenset
+    digits: frozenset
+
+    @cached_property
+    def token_initials(self):
+        """First character of every word token (a cheap pre-check for word-start matches)."""
+        return frozenset(token[0] for token in self.tokens)
+
+    @cached_property
+    def abbreviations(self):
+        """
+        Every 1-5 character run that starts at a word boundary and is followed by
+        whitespace, a digit or the end of the text - i.e. every string P for which
+        re.search(r'\\bP(?:\\s|\\d|$)', lower) succeeds ("r30" -> "r", "reta 30" -> "reta").
+        """
+        text = self.lower
+        length = len(text)
+        found = set()
+        previous_is_word = False
+        for start, char in enumerate(text):
+            is_word = char.isalnum() or char == '_'
+            if is_word != previous_is_word:  # \b before this character
+                for end in range(start + 1, min(start + 5, length) + 1):
+                    if end == length or text[end].isspace() or text[end].isdecimal():
+                        found.add(text[start:end])
+            previous_is_word = is_word
+        return frozenset(found)
+
+    @cached_property
+    def keyword_hits(self):
+        """Routing keyword matches (COA, FAQ, timeline) from one scan, computed on first use."""
+        return scan_routing_keywords(self)
+
+
+# Group chats repeat the same short questions ("shipping?", "how to pay"), so a repeat
+# reuses the earlier context - and with it the keyword scan and FAQ match it cached
+MESSAGE_CONTEXT_CACHE_SIZE = 2048
+
+
+@lru_cache(maxsize=MESSAGE_CONTEXT_CACHE_SIZE)
+def build_message_context(message_text):
+    """
+    Normalize a message once so downstream matchers don't re-lowercase and re-scan it.
+    Contexts are immutable, so identical messages share one cached instance.
+    """
+    message_lower = message_text.lower()
+
+    clean_message = FAQ_FILLER_RE.sub('', message_lower).strip()
+
+    return MessageContext(
+        raw=message_text,
+        lower=message_lower,
+        clean=clean_message,
+        tokens=frozenset(_WORD_RE.findall(message_lower)),
+        digits=frozenset(_DIGITS_RE.findall(message_lower)),
+    )
+
+
+def as_message_context(message):
+    """Accept either a raw message string or an already-built MessageContext."""
+    if isinstance(message, MessageContext):
+        return message
+    return build_message_context(message or '')
+
+
+class KeywordAutomaton:
+    """
+    Aho-Corasick matcher: finds every occurrence of many keywords in a single
+    left-to-right pass over the text, instead of one substring scan per keyword.
+
+    Usage: add() each keyword with a payload, build() once, then iter(text).
+    Uses the pyahocorasick C extension when it is installed, otherwise the
+    pure-Python automaton below; both yield the same matches.
+    """
+
+    def __init__(self):
+        self._goto = [{}]  # state -> {char: next_state}
+        self._fail = [0]  # state -> fallback state on mismatch
+        self._out = [[]]  # state -> [(keyword, payload), ...] ending at this state
+        self._entries = {}  # keyword -> [(keyword, payload), ...], for the native automaton
+        self._native = None
+        self.min_length = None  # shortest keyword; shorter texts cannot match anything
+
+    def add(self, keyword, payload=None):
+        self._entries.setdefault(keyword, []).append((keyword, payload))
+        if self.min_length is None or len(keyword) < self.min_length:
+            self.min_length = len(keyword)
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = next_state
+        self._out[state].append((keyword, payload))
+
+    def build(self):
+        """Compute failure links breadth-first and merge outputs along them."""
+        if ahocorasick is not None and self._entries:
+            native = ahocorasick.Automaton()
+            for keyword, entries in self._entries.items():
+                native.add_word(keyword, tuple(entries))
+            native.make_automaton()
+            self._native = native
+            return self
+
+        queue = list(self._goto[0].values())
+        head = 0
+        while head < len(queue):
+            state = queue[head]
+            head += 1
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._out[next_state] = self._out[next_state] + self._out[self._fail[next_state]]
+        return self
+
+    def iter(self, text):
+        """Yield (end_index, keyword, payload) for every keyword occurrence in text."""
+        if self._native is not None:
+            for index, entries in self._native.iter(text):
+                for keyword, payload in entries:
+                    yield index, keyword, payload
+            return
+
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for keyword, payload in out[state]:
+                yield index, keyword, payload
+
+# =============================================================================
+# IN-PROCESS RESULT CACHES
+# =============================================================================
+
+class TTLCache:
+    """
+    Small thread-safe LRU cache with a per-entry TTL.
+    Used to memoize repeat questions so they skip the OpenAI round-trip.
+    """
+
+    MISSING = object()  # sentinel for get() so cached None values still count as hits
+
+    def __init__(self, max_entries=MESSAGE_CACHE_MAX_ENTRIES, ttl_seconds=CACHE_TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()  # key -> (stored_at, value)
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key, self.MISSING)
+            if entry is self.MISSING:
+                return default
+            stored_at, value = entry
+            if (time.time() - stored_at) > self.ttl_seconds:
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = (time.time(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class SemanticCache:
+    """
+    Small thread-safe cache looked up by embedding similarity instead of exact key.
+    Entries are (namespace, unit vector, value); get() returns the value of the most
+    similar stored vector in the namespace when its cosine similarity reaches the
+    threshold. Used so paraphrases of an already answered question ("which gb has
+    reta" / "what gb is reta in") reuse the answer.
+    """
+
+    def __init__(self, threshold, max_entries=SEMANTIC_CACHE_MAX_ENTRIES, ttl_seconds=CACHE_TTL_SECONDS):
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self._entries = deque(maxlen=max_entries)  # (stored_at, namespace, vector, value)
+        self._lock = threading.Lock()
+
+    def get(self, namespace, vector, default=None):
+        now = time.time()
+        with self._lock:
+            entries = list(self._entries)
+        best_score, best_value = self.threshold, default
+        for stored_at, entry_namespace, entry_vector, value in entries:
+            if entry_namespace != namespace or (now - stored_at) > self.ttl_seconds:
+                continue
+            score = sum(a * b for a, b in zip(vector, entry_vector))
+            if score >= best_score:
+                best_score, best_value = score, value
+        return best_value
+
+    def set(self, namespace, vector, value):
+        with self._lock:
+            self._entries.append((time.time(), namespace, vector, value))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def normalize_cache_text(message_text):
+    """
+    Normalize a message for use in a cache key.
+    Only case and surrounding whitespace are folded: punctuation and inner spacing
+    change what the fuzzy product matcher sees ("reta?" vs "reta", "bpc-157" vs "bpc157"),
+    so folding them could return a cached decision the message wouldn't get on its own.
+    """
+    return as_message_context(message_text).lower.strip()
+
+
+def fingerprint(value):
+    """Short stable hash of JSON-serializable data, for cache keys."""
+    if orjson is not None:
+        encoded = orjson.dumps(value, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str)
+    else:
+        encoded = json.dumps(value, sort_keys=True, separators=(',', ':'), default=str).encode('utf-8')
+    return hashlib.blake2b(encoded, digest_size=8).hexdigest()
+
+
+# (normalized message, forms catalog version) -> form selection result
+gb_analysis_cache = TTLCache()
+# gb_analysis_cache key -> task computing that form selection, so identical messages
+# arriving together share one product scan / ChatGPT call. Only touched on the event loop
+_gb_analysis_inflight = {}
+# Message embedding -> form ChatGPT picked for it, per set of forms (ids and titles) and
+# the numbers/months the message names (embeddings barely tell "11/5 gb" from "11/15 gb")
+form_choice_semantic_cache = SemanticCache(FORM_CHOICE_SIMILARITY_THRESHOLD)
+# Raw message -> embedding, so one message is embedded at most once
+message_embedding_cache = TTLCache()
+# (answer kind, normalized question, form data key) -> temperature-0 answer text. The
+# form data key is the form's prompt block (title, vendor info and products) or, for
+# multi-form answers, per-form IDs, titles, vendor info and products fingerprints, so
+# new catalog data means a new key
+answer_cache = TTLCache(ttl_seconds=ANSWER_CACHE_TTL_SECONDS)
+
+# =============================================================================
+# CANNED REPLIES
+# =============================================================================
+# Fixed reply texts, built once at import instead of on every command/message
+
+START_TEXT = (
+    "Hello! I'm Bohemia's Steward, your Group Buy assistant.\n\n"
+    "I can help you with:\n"
+    "- Product information from current GBs\n"
+    "- Common questions (how to order, shipping, etc.)\n"
+    "- Finding the right Group Buy form\n\n"
+    "Just ask me a question, or use /help to see available commands!"
+)
+
+# Help sections shown to everyone
+_HELP_COMMANDS_TEXT = (
+    "Available Commands:\n\n"
+    "General:\n"
+    "/start - Welcome message\n"
+    "/help - Show this message\n"
+    "/faq - Show frequently asked questions\n\n"
+    "Group Buy Info:\n"
+    "/currentgb - Show current GB details\n"
+    "/products - List products in current GB\n"
+    "/products <search> - Search products\n"
+    "/deadline - Show current GB deadline\n"
+    "/vendors - Show current GB vendors\n"
+    "/status - Show current GB status\n"
+    "/jotform - Get link to order form\n"
+    "/listforms - List available order forms\n\n"
+    "Order Support:\n"
+    "/getorderstatus - Look up your order status\n"
+    "/reportproblem - Report an issue with your order\n\n"
+)
+_HELP_REMINDERS_TEXT = (
+    "Reminders:\n"
+    "/subscribe - Subscribe to deadline reminders\n"
+    "/unsubscribe - Unsubscribe from reminders\n\n"
+    "Or just ask me questions like:\n"
+    "- 'What's the price of Retatrutide?'\n"
+    "- 'How do I place an order?'"
+)
+# Help sections shown only to admins
+_HELP_ADMIN_TEXT = (
+    "Admin Commands:\n"
+    "/setcurrentgb <id or name> - Set current GB\n"
+    "/clearcurrentgb - Clear GB setting\n"
+    "/setdeadline <date> - Set deadline\n"
+    "/cleardeadline - Clear deadline\n"
+    "/setvendors <names> - Set vendors\n"
+    "/clearvendors - Clear vendors\n"
+    "/setstatus <text> - Set status\n"
+    "/clearstatus - Clear status\n"
+    "/refresh - Refresh cached data\n"
+    "/refreshform <id> - Refresh one form's data\n"
+    "/addadmin - Add a bot admin\n"
+    "/removeadmin <id> - Remove an admin\n"
+    "/listadmins - List all admins\n"
+    "/listallforms - List all JotForm forms\n"
+    "/addformtolist <id> - Add form to public list\n"
+    "/removeformfromlist <id> - Remove form from list\n\n"
+)
+_HELP_ANALYTICS_TEXT = (
+    "Analytics:\n"
+    "/analytics - View bot usage statistics\n"
+    "/broadcast <msg> - Send message to all subscribers\n\n"
+)
+HELP_TEXT = _HELP_COMMANDS_TEXT + _HELP_REMINDERS_TEXT
+ADMIN_HELP_TEXT = _HELP_COMMANDS_TEXT + _HELP_ADMIN_TEXT + _HELP_ANALYTICS_TEXT + _HELP_REMINDERS_TEXT
+
+FAQ_TOPICS = (
+    "- What is a Group Buy?",
+    "- How do I place an order?",
+    "- How do I pay?",
+    "- How long does shipping take?",
+    "- What if my package is seized?",
+    "- What's the refund policy?",
+    "- What's the minimum order?",
+    "- How do I contact an admin?",
+    "- What are the group rules?",
+    "- When is the next GB?"
+)
+FAQ_TOPICS_TEXT = (
+    "Frequently Asked Questions:\n\n" +
+    "\n".join(FAQ_TOPICS) +
+    "\n\nJust ask me any of these questions for more details!"
+)
+
+TIMELINE_TEXT = (
+    "Due to the volume of GBs, standard production times, shipping speeds, and custom processing timeframes, we estimate that you will receive your items in 4-8 weeks. This timeframe is subject to change if any of the following scenarios apply:\n"
+    "- Custom made batches\n"
+    "- Package Seizures/Reships\n"
+    "- International Shipping\n\n"
+    "Please DM an admin if you have any further questions."
+)
+
+ADMIN_REDIRECT_TEXT = """I don't have access to external links or vendor test reports. Please DM an admin:
+- @Emilycarolinemarch
+- @Davesauce
+
+Or post your question in the Telegram group for further support."""
+
 # =============================================================================
 # STATIC FAQ SYSTEM
 # =============================================================================
@@ -479,39 +1130,287 @@ FAQ_DATABASE = {
     }
 }
 
+@dataclass(frozen=True)
+class FaqEntry:
+    """
+    One FAQ_DATABASE entry, built once at import.
+
+    - keywords: trigger phrases, lowercased and stripped (messages are matched lowercased)
+    - answer: the canned reply
+    """
+    __slots__ = ('keywords', 'answer')
+    keywords: tuple
+    answer: str
+
+
+FAQ_ENTRIES = tuple(
+    FaqEntry(tuple(keyword.lower().strip() for keyword in faq_data['keywords']), faq_data['answer'])
+    for faq_data in FAQ_DATABASE.values()
+)
+
+
+def _build_faq_keyword_index(faq_entries):
+    """
+    Flatten FAQ keywords into (score, keyword, answer) tuples, longest keyword first.
+    The score is the keyword length. Duplicate keywords keep their first entry, and the
+    stable sort keeps FAQ_DATABASE order among equal lengths, so the first hit while
+    scanning is the same match the longest-keyword scoring would pick.
+    """
+    seen = set()
+    index = []
+    for entry in faq_entries:
+        for keyword in entry.keywords:
+            if keyword in seen:
+                continue
+            seen.add(keyword)
+            index.append((len(keyword), keyword, entry.answer))
+    index.sort(key=lambda item: item[0], reverse=True)
+    return tuple(index)
+
+
+FAQ_KEYWORD_INDEX = _build_faq_keyword_index(FAQ_ENTRIES)
+
+
+def _build_faq_fuzzy_index(keyword_index):
+    """
+    Group the keywords tried by the typo-tolerant FAQ pass by word count, as
+    {word_count: ((keyword_words, max_edits, answer), ...)}, longest keyword first
+    within a group. Keywords shorter than FAQ_FUZZY_MIN_KEYWORD_LENGTH are left out:
+    a single typo in them is indistinguishable from noise.
+    """
+    index = {}
+    seen = set()
+    for score, keyword, answer in keyword_index:
+        words = tuple(_WORD_RE.findall(keyword))
+        if score < FAQ_FUZZY_MIN_KEYWORD_LENGTH or words in seen:
+            continue
+        seen.add(words)
+        max_edits = 2 if score >= FAQ_FUZZY_TWO_EDIT_LENGTH else 1
+        index.setdefault(len(words), []).append((words, max_edits, answer))
+    # Phrases with more words are tried first (more specific)
+    return {count: tuple(index[count]) for count in sorted(index, reverse=True)}
+
+
+FAQ_FUZZY_INDEX = _build_faq_fuzzy_index(FAQ_KEYWORD_INDEX)
+
+# Words that are never read as a misspelling (the catalog's title and product words
+# are checked too)
+FAQ_FUZZY_KNOWN_WORDS = frozenset(
+    word for entries in FAQ_FUZZY_INDEX.values() for words, _, _ in entries for word in words
+)
+# Levenshtein weights (insertion, deletion, substitution) for message word -> keyword
+# word: only letters missing from the message word are counted as typos. Extra or
+# changed letters cost more than any allowance, since that is how real words near a
+# keyword differ from it ("contract" / "contact", "shopping" / "shipping")
+FAQ_FUZZY_EDIT_WEIGHTS = (1, FAQ_FUZZY_TWO_EDIT_LENGTH, FAQ_FUZZY_TWO_EDIT_LENGTH)
+
+
+# =============================================================================
+# KEYWORD ROUTING
+# =============================================================================
+# Keywords that indicate COA/test questions (redirected to admins)
+COA_KEYWORDS = (
+    'coa', 'certificate of analysis', 'test result', 'test report',
+    'lab test', 'lab result', 'testing', 'purity test', 'quality test',
+    'third party test', 'janoshik', 'jano test'
+)
+
+# Keywords that indicate delivery timeline questions (answered with a canned estimate)
+TIMELINE_KEYWORDS = ('how long', 'timeline', 'timeframe')
+
+ROUTE_COA = 'coa'
+ROUTE_FAQ = 'faq'
+ROUTE_TIMELINE = 'timeline'
+
+
+# Small-talk triggers handled before any lookup (matched against the lowercased message)
+GREETINGS = frozenset(['hello', 'hi', 'hey', 'howdy', 'hola', 'yo', 'sup', 'whats up', "what's up",
+                       'good morning', 'good afternoon', 'good evening', 'greetings'])
+# A greeting followed by a space, '!' or ',' also counts ("hi there", "hey!", "hello, ...")
+GREETING_PREFIXES = tuple(greeting + sep for greeting in sorted(GREETINGS) for sep in (' ', '!', ','))
+THANKS_PHRASES = ('thanks', 'thank you', 'thx', 'ty', 'appreciate it', 'appreciated')
+GOODBYES = frozenset(['bye', 'goodbye', 'see ya', 'later', 'cya'])
+
+# Keywords that indicate a request for the order form (JotForm) link
+JOTFORM_LINK_KEYWORDS = (
+    'jotform', 'jot form', 'order form', 'ordering form', 'form link',
+    'where is the form', "where's the form", 'link to form', 'link to order',
+    'get the form', 'give me the form', 'send me the form', 'need the form',
+    'where can i order', 'where do i order', 'where to order',
+    'form for the gb', 'form for the current', 'form for current gb',
+    'current gb form', 'gb form', 'group buy form'
+)
+
+
+def _build_routing_automaton():
+    """One automaton over every COA, FAQ and timeline keyword, tagged by route."""
+    automaton = KeywordAutomaton()
+    for keyword in COA_KEYWORDS:
+        automaton.add(keyword, (ROUTE_COA, None))
+    # FAQ payloads carry the keyword's rank in FAQ_KEYWORD_INDEX (lower = better match)
+    for rank, (score, keyword, answer) in enumerate(FAQ_KEYWORD_INDEX):
+        automaton.add(keyword, (ROUTE_FAQ, (rank, score, answer)))
+    for keyword in TIMELINE_KEYWORDS:
+        automaton.add(keyword, (ROUTE_TIMELINE, None))
+    return automaton.build()
+
+
+ROUTING_AUTOMATON = _build_routing_automaton()
+
+
+def scan_routing_keywords(msg):
+    """
+    Scan a message once for all routing keywords.
+
+    The probe is the lowercased message plus, when different, the FAQ-cleaned
+    message after a \x00 sentinel (no keyword can match across it). COA and
+    timeline keywords only count in the lowercased part; FAQ keywords count in
+    either part. Returns {route: [(keyword, payload), ...]}.
+    """
+    message_lower = msg.lower.strip()
+    # "ok", "hi" and the like are shorter than every keyword (the cleaned
+    # message is never longer than the lowercased one)
+    if len(message_lower) < ROUTING_AUTOMATON.min_length:
+        return {}
+    if message_lower == msg.clean:
+        probe = message_lower
+    else:
+        probe = message_lower + "\x00" + msg.clean
+    lower_end = len(message_lower)
+
+    hits = {}
+    for end_index, keyword, (route, payload) in ROUTING_AUTOMATON.iter(probe):
+        if route != ROUTE_FAQ and end_index >= lower_end:
+            continue
+        hits.setdefault(route, []).append((keyword, payload))
+    return hits
+
+
 def check_faq_match(message_text):
     """
     Check if the user's message matches any FAQ entry.
+    Accepts a raw message string or a MessageContext.
     Returns the FAQ answer if matched, None otherwise.
     """
-    message_lower = message_text.lower().strip()
+    msg = as_message_context(message_text)
+    faq_hits = msg.keyword_hits.get(ROUTE_FAQ)
+    if not faq_hits:
+        # A message that hit another route (e.g. a timeline question) is left to it
+        return None if msg.keyword_hits else fuzzy_faq_match(msg)
+
+    # Longer keyword = more specific = better match (lowest rank in FAQ_KEYWORD_INDEX)
+    keyword, (rank, score, answer) = min(faq_hits, key=lambda hit: hit[1][0])
+    logger.debug("check_faq_match - FAQ match found with score %s", score)
+    return answer
+
+
+def fuzzy_faq_match(msg):
+    """
+    Typo-tolerant FAQ lookup for messages with no exact keyword hit.
+
+    Every run of N consecutive words in the cleaned message is compared word by word
+    with the N-word keywords; phrases with more words are tried first. A run matches
+    when the words that differ are all typo candidates and their missing letters add
+    up to at most the keyword's allowance (see FAQ_FUZZY_TWO_EDIT_LENGTH). Typo
+    candidates are words of FAQ_FUZZY_MIN_WORD_LENGTH+ characters that are not known
+    words (FAQ_FUZZY_KNOWN_WORDS or the catalog's title/product words). A word that is
+    the start of the keyword word ("custom" / "customs") is another form of it, not a
+    typo. Messages that name a product or form are left to form routing.
+    Returns the FAQ answer or None (always None without rapidfuzz).
+
+    Real words that are a keyword word with letters taken out of the middle still
+    read as typos; no dictionary is kept to tell them apart.
+    """
+    if Levenshtein is None:
+        return None
+    catalog_words = jotform_helper.get_catalog_words()
+    if any(token in catalog_words and token not in GENERIC_TITLE_TOKENS for token in msg.tokens):
+        return None
+
+    words = _WORD_RE.findall(msg.clean)
+    typos = {
+        word for word in words
+        if len(word) >= FAQ_FUZZY_MIN_WORD_LENGTH and word not in FAQ_FUZZY_KNOWN_WORDS
+        and word not in catalog_words
+    }
+    if not typos:
+        return None
+
+    for word_count, entries in FAQ_FUZZY_INDEX.items():
+        for start in range(len(words) - word_count + 1):
+            phrase = words[start:start + word_count]
+            if typos.isdisjoint(phrase):
+                continue
+            for keyword_words, max_edits, answer in entries:
+                edits = 0
+                for word, keyword_word in zip(phrase, keyword_words):
+                    if word == keyword_word:
+                        continue
+                    if word not in typos or keyword_word.startswith(word):
+                        break
+                    edits += Levenshtein.distance(word, keyword_word, weights=FAQ_FUZZY_EDIT_WEIGHTS,
+                                                  score_cutoff=max_edits - edits)
+                    if edits > max_edits:
+                        break
+                else:
+                    logger.debug("fuzzy_faq_match - '%s' matched FAQ keyword '%s'",
+                                 ' '.join(phrase), ' '.join(keyword_words))
+                    return answer
+    return None
+
+
+def is_timeline_question(message_text):
+    """Detect delivery timeline questions ("how long", "timeline", "timeframe")."""
+    return ROUTE_TIMELINE in as_message_context(message_text).keyword_hits
 
-    # Remove common question words for better matching
-    clean_message = message_lower
-    for word in ['can you tell me', 'could you tell me', 'please tell me', 'i want to know', 'i need to know', 'can you explain', 'please explain']:
-        clean_message = clean_message.replace(word, '')
-    clean_message = clean_message.strip()
-
-    best_match = None
-    best_score = 0
-
-    for faq_key, faq_data in FAQ_DATABASE.items():
-        for keyword in faq_data['keywords']:
-            # Check for exact keyword match
-            if keyword in message_lower or keyword in clean_message:
-                # Score based on keyword length (longer = more specific = better match)
-                score = len(keyword)
-                if score > best_score:
-                    best_score = score
-                    best_match = faq_data['answer']
-
-    if best_match:
-        print(f"[DEBUG] check_faq_match - FAQ match found with score {best_score}")
-
-    return best_match
-jotform = JotformAPIClient(os.getenv('JOTFORM_API_KEY'))
 TOKEN = os.getenv('TELEGRAM_BOT_TOKEN')
 
+MONTH_NAMES = (
+    'january', 'february', 'march', 'april', 'may', 'june',
+    'july', 'august', 'september', 'october', 'november', 'december'
+)
+MONTH_ABBREVIATIONS = {
+    'jan': 'january', 'feb': 'february', 'mar': 'march',
+    'apr': 'april', 'jun': 'june', 'jul': 'july',
+    'aug': 'august', 'sep': 'september', 'oct': 'october',
+    'nov': 'november', 'dec': 'december'
+}
+# Full month names anywhere in a form title (e.g. the "January" in "GB - January")
+MONTH_NAME_RE = re.compile(r'\b(?:' + '|'.join(MONTH_NAMES) + r')\b', re.IGNORECASE)
+# Full or abbreviated month names in an already lowercased message
+MONTH_MENTION_RE = re.compile(r'\b(' + '|'.join(MONTH_NAMES + tuple(MONTH_ABBREVIATIONS)) + r')\b')
+# Checking order for detect_month_in_message: full names first, then abbreviations
+MONTH_MENTION_ORDER = {month: rank for rank, month in enumerate(MONTH_NAMES + tuple(MONTH_ABBREVIATIONS))}
+TITLE_WORD_RE = re.compile(r'\w+')
+
+# What a form question's text/name says it holds. 'info' only counts in the question
+# text; one question may match several groups. The lookahead makes every match
+# zero-width so overlapping keywords ("notend date") are all found.
+QUESTION_FIELD_RE = re.compile(
+    r'(?=(?P<vendor>vendor|supplier)|(?P<deadline>deadline|close|closing|end date|due date)'
+    r'|(?P<notes>note)|(?P<info>info))',
+    re.IGNORECASE
+)
+
+# Title words that never identify a single form on their own: generic GB wording
+# and month names (months are matched separately, and may cover several forms)
+GENERIC_TITLE_TOKENS = frozenset([
+    'gb', 'group', 'buy', 'groupbuy', 'order', 'orders', 'form', 'the', 'and', 'for', 'of',
+    'january', 'february', 'march', 'april', 'may', 'june', 'july', 'august',
+    'september', 'october', 'november', 'december',
+    'jan', 'feb', 'mar', 'apr', 'jun', 'jul', 'aug', 'sep', 'sept', 'oct', 'nov', 'dec'
+])
+# Status and descriptor words that titles carry ("... (CLOSED)", "Halloween Special GB",
+# "Round 2") but that users mostly write about something else ("when is the gb closed",
+# "any special deals"), so they never name a form on their own
+TITLE_STATUS_TOKENS = frozenset([
+    'closed', 'close', 'closing', 'open', 'opened', 'opening', 'ended', 'live', 'active',
+    'special', 'new', 'old', 'round', 'final', 'last', 'next', 'sale', 'deal', 'deals',
+    'edition', 'batch', 'update', 'updated', 'limited', 'mini', 'main', 'part',
+    'copy', 'clone', 'test', 'current', 'latest'
+])
+
+
 class JotFormHelper:
     def __init__(self):
         self.client = JotformAPIClient(os.getenv('JOTFORM_API_KEY'))
@@ -522,14 +1421,43 @@ class JotFormHelper:
         self.forms_cache_timestamp = 0
         self.products_cache_timestamps = {}  # per-form timestamps
         self.form_metadata_cache_timestamps = {}  # per-form timestamps
+        # Derived views of forms_cache, rebuilt lazily after each forms refresh
+        self.sorted_forms = None  # [(form_id, form_data), ...] newest activity first
+        self.forms_list_text = None  # forms listing embedded in the form-selection prompt
+        self.forms_version = None  # hash of form ids + latest activity, for cache keys
+        self.form_set_version = None  # hash of form ids + titles (ignores activity)
+        self.title_token_index = None  # distinctive title word -> the one form_id containing it
+        self.form_titles = None  # ((form_id, title, title_lower), ...) in catalog order
+        self.products_prompt_blocks = {}  # form_id -> (products, title, vendor key, prompt block)
+        self.product_indexes = {}  # form_id -> (products, ProductCandidateIndex)
+        self.product_names = {}  # form_id -> (products, ((product, lowercased name), ...))
+        self.products_hits = {}  # form_id -> cached reads since the last refresh (for prefetch)
+        # Title and product-name words, kept up to date where forms_cache and
+        # products_cache are written so readers never iterate those dicts themselves
+        self.catalog_word_sets = {}  # None (titles) or form_id -> frozenset of words
+        self.catalog_words = frozenset()  # union of catalog_word_sets
+        self._catalog_words_lock = threading.Lock()
+        self.form_properties = {}  # form_id -> (fetched_at, properties), shared by the two refreshes
         self.max_retries = int(os.getenv('JOTFORM_MAX_RETRIES', 3))
         self.backoff_seconds = float(os.getenv('JOTFORM_BACKOFF_SECONDS', 1))
+        # Caps concurrent JotForm API calls so bursts don't hammer the API
+        self._api_semaphore = threading.BoundedSemaphore(JOTFORM_MAX_CONCURRENCY)
+        # Single-flight refreshes: one lock per cache key, one background refresh per key
+        self._locks_guard = threading.Lock()
+        self._key_locks = {}
+        self._background_refreshes = set()
+        self._refresh_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='jotform-refresh')
+        # Disk copy of the caches: loaded once here, rewritten after every successful fetch
+        self.cache_path = JOTFORM_CACHE_PATH
+        self._persist_lock = threading.Lock()
+        self.load_disk_cache()
 
     def _call_with_retry(self, operation_name, call_fn):
         last_error = None
         for attempt in range(1, self.max_retries + 1):
             try:
-                return call_fn()
+                with self._api_semaphore:
+                    return call_fn()
             except Exception as e:
                 last_error = e
                 log_error(f"JotFormHelper.{operation_name} attempt {attempt}/{self.max_retries}", e)
@@ -537,8 +1465,10 @@ class JotFormHelper:
                     raise ExternalServiceError(
                         f"JotFormHelper.{operation_name} failed after {self.max_retries} attempts"
                     ) from e
-                sleep_seconds = self.backoff_seconds * (2 ** (attempt - 1))
-                print(f"[DEBUG] JotFormHelper.{operation_name} - retrying in {sleep_seconds:.1f}s")
+                sleep_seconds = get_retry_after_seconds(e)
+                if sleep_seconds is None:
+                    sleep_seconds = self.backoff_seconds * (2 ** (attempt - 1))
+                logger.debug("JotFormHelper.%s - retrying in %.1fs", operation_name, sleep_seconds)
                 time.sleep(sleep_seconds)
 
         raise ExternalServiceError(
@@ -549,6 +1479,36 @@ class JotFormHelper:
         """Check if a cache entry has expired based on TTL."""
         return (time.time() - timestamp) > CACHE_TTL_SECONDS
 
+    def is_cache_servable_stale(self, timestamp):
+        """Check if an expired cache entry is still young enough to serve while refreshing."""
+        return (time.time() - timestamp) <= CACHE_STALE_TTL_SECONDS
+
+    def _key_lock(self, key):
+        """Get the lock that serializes refreshes of one cache key."""
+        with self._locks_guard:
+            lock = self._key_locks.get(key)
+            if lock is None:
+                lock = self._key_locks[key] = threading.Lock()
+            return lock
+
+    def _refresh_in_background(self, key, refresh_fn):
+        """Run refresh_fn on the refresh pool unless a refresh of this key is already queued."""
+        with self._locks_guard:
+            if key in self._background_refreshes:
+                return
+            self._background_refreshes.add(key)
+
+        def run():
+            try:
+                refresh_fn()
+            except Exception as e:
+                log_error(f"JotFormHelper background refresh failed for {key}", e)
+            finally:
+                with self._locks_guard:
+                    self._background_refreshes.discard(key)
+
+        self._refresh_executor.submit(run)
+
     def clear_all_caches(self):
         """Force clear all caches - useful for admin refresh commands."""
         self.forms_cache = {}
@@ -557,229 +1517,637 @@ class JotFormHelper:
         self.forms_cache_timestamp = 0
         self.products_cache_timestamps = {}
         self.form_metadata_cache_timestamps = {}
-        print(f"[DEBUG] JotFormHelper.clear_all_caches - All caches cleared")
+        self.sorted_forms = None
+        self.forms_list_text = None
+        self.forms_version = None
+        self.form_set_version = None
+        self.title_token_index = None
+        self.form_titles = None
+        self.products_prompt_blocks = {}
+        self.product_indexes = {}
+        self.product_names = {}
+        self.products_hits = {}
+        self.form_properties = {}
+        with self._catalog_words_lock:
+            self.catalog_word_sets = {}
+            self.catalog_words = frozenset()
+        if self.cache_path:
+            try:
+                os.remove(self.cache_path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                log_error("JotFormHelper.clear_all_caches - Could not delete cache file", e, {"path": self.cache_path})
+        logger.debug("JotFormHelper.clear_all_caches - All caches cleared")
 
-    def get_all_forms(self, force_refresh=False):
-        """Get list of all forms with TTL-based caching."""
-        # Check if cache is valid
-        cache_valid = (
-            self.forms_cache and
-            not self.is_cache_expired(self.forms_cache_timestamp) and
-            not force_refresh
+    def load_disk_cache(self):
+        """
+        Restore the caches saved by save_disk_cache, keeping their original timestamps:
+        entries still within the TTL are used as-is, older ones go through the usual
+        stale-while-revalidate/refetch path.
+        """
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return
+        try:
+            with open(self.cache_path, 'rb') as cache_file:
+                state = pickle.load(cache_file)
+            if state.get('version') != 1:
+                return
+            self.forms_cache = state['forms_cache']
+            self.forms_cache_timestamp = state['forms_cache_timestamp']
+            self.products_cache = state['products_cache']
+            self.products_cache_timestamps = state['products_cache_timestamps']
+            self.form_metadata_cache = state['form_metadata_cache']
+            self.form_metadata_cache_timestamps = state['form_metadata_cache_timestamps']
+            self._set_catalog_words(None, [form_data.get('title', '') for form_data in self.forms_cache.values()])
+            for form_id, products in self.products_cache.items():
+                self._set_catalog_words(form_id, [product.get('name', '') for product in products])
+            logger.info("JotFormHelper - Loaded cache from %s (%s forms, %s product lists)",
+                        self.cache_path, len(self.forms_cache), len(self.products_cache))
+        except Exception as e:
+            log_error("JotFormHelper.load_disk_cache - Ignoring unreadable cache file", e, {"path": self.cache_path})
+
+    def save_disk_cache(self):
+        """Write the caches to disk atomically (temp file + rename) so a crash never leaves a torn file."""
+        if not self.cache_path:
+            return
+        with self._persist_lock:
+            state = {
+                'version': 1,
+                'forms_cache': self.forms_cache,
+                'forms_cache_timestamp': self.forms_cache_timestamp,
+                'products_cache': dict(self.products_cache),
+                'products_cache_timestamps': dict(self.products_cache_timestamps),
+                'form_metadata_cache': dict(self.form_metadata_cache),
+                'form_metadata_cache_timestamps': dict(self.form_metadata_cache_timestamps),
+            }
+            temp_path = f"{self.cache_path}.tmp"
+            try:
+                with open(temp_path, 'wb') as cache_file:
+                    pickle.dump(state, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(temp_path, self.cache_path)
+            except Exception as e:
+                log_error("JotFormHelper.save_disk_cache - Could not write cache file", e, {"path": self.cache_path})
+
+    def _stale_timestamp(self, timestamp):
+        """Backdate a cache timestamp to just past the TTL (never making it newer)."""
+        return min(timestamp, time.time() - CACHE_TTL_SECONDS - 1)
+
+    def mark_all_stale(self):
+        """
+        Expire every cached entry without dropping it. The next read of each key serves
+        the old data once and refreshes that key in the background (one fetch per key),
+        so a refresh doesn't send every form's users to JotForm at the same moment.
+        """
+        self.forms_cache_timestamp = self._stale_timestamp(self.forms_cache_timestamp)
+        for timestamps in (self.products_cache_timestamps, self.form_metadata_cache_timestamps):
+            for form_id, timestamp in list(timestamps.items()):
+                timestamps[form_id] = self._stale_timestamp(timestamp)
+        self.form_properties = {}
+        logger.debug("JotFormHelper.mark_all_stale - All cache entries marked stale")
+
+    def invalidate_form(self, form_id):
+        """Expire one form's cached products and metadata; other forms stay warm."""
+        for timestamps in (self.products_cache_timestamps, self.form_metadata_cache_timestamps):
+            if form_id in timestamps:
+                timestamps[form_id] = self._stale_timestamp(timestamps[form_id])
+        self.form_properties.pop(form_id, None)
+        logger.debug("JotFormHelper.invalidate_form - Form %s marked stale", form_id)
+
+    @staticmethod
+    def sort_forms_by_activity(forms):
+        """Sort forms by latest submission date (falling back to creation date), newest first."""
+        return sorted(
+            forms.items(),
+            key=lambda x: x[1].get('latest_submission', x[1].get('created', '')),
+            reverse=True
         )
 
-        if cache_valid:
-            print(f"[DEBUG] JotFormHelper.get_all_forms - Using cached forms ({len(self.forms_cache)} forms, age: {int(time.time() - self.forms_cache_timestamp)}s)")
-            return self.forms_cache
+    def get_sorted_forms(self, forms=None):
+        """
+        Get forms sorted by latest activity, newest first.
+        The sort of the cached forms is computed once per refresh; any other
+        forms dict passed in is sorted on the fly.
+        """
+        if forms is None:
+            forms = self.get_all_forms()
+        if forms is not self.forms_cache:
+            return self.sort_forms_by_activity(forms)
+        if self.sorted_forms is None:
+            self.sorted_forms = self.sort_forms_by_activity(forms)
+        return self.sorted_forms
+
+    def get_forms_list_text(self, forms=None):
+        """Get the forms listing used in the form-selection prompt, cached per refresh."""
+        if forms is None:
+            forms = self.get_all_forms()
+        if forms is not self.forms_cache:
+            return self.format_forms_list(self.sort_forms_by_activity(forms))
+        if self.forms_list_text is None:
+            self.forms_list_text = self.format_forms_list(self.get_sorted_forms(forms))
+        return self.forms_list_text
 
-        # Cache expired or empty - fetch fresh data
-        print(f"[DEBUG] JotFormHelper.get_all_forms - Fetching forms from JotForm API (cache expired or forced refresh)")
-        try:
-            forms = self._call_with_retry("get_forms", self.client.get_forms)
-            print(f"[DEBUG] JotFormHelper.get_all_forms - Retrieved {len(forms)} forms from API")
+    def get_forms_version(self, forms=None):
+        """
+        Hash of the form ids and their latest activity, cached per refresh.
+        Changes whenever the catalog changes, so it can key caches derived from it.
+        """
+        if forms is None:
+            forms = self.get_all_forms()
+        if forms is self.forms_cache and self.forms_version is not None:
+            return self.forms_version
+        version = fingerprint(sorted(
+            (form_id, form_data.get('latest_submission', '')) for form_id, form_data in forms.items()
+        ))
+        if forms is self.forms_cache:
+            self.forms_version = version
+        return version
+
+    def get_form_set_version(self, forms=None):
+        """
+        Hash of the form ids and titles, cached per refresh. Unlike get_forms_version it
+        ignores submission activity, so it only changes when forms or titles change.
+        """
+        if forms is None:
+            forms = self.get_all_forms()
+        if forms is self.forms_cache and self.form_set_version is not None:
+            return self.form_set_version
+        version = fingerprint(sorted(
+            (form_id, form_data.get('title', '')) for form_id, form_data in forms.items()
+        ))
+        if forms is self.forms_cache:
+            self.form_set_version = version
+        return version
+
+    def get_title_token_index(self, forms=None):
+        """
+        Map each distinctive title word (e.g. "halloween", a vendor name) to the single
+        form whose title contains it. Words shared by several titles, generic GB words,
+        month names, status words (TITLE_STATUS_TOKENS) and short/numeric tokens are
+        left out. Cached per forms refresh.
+        """
+        if forms is None:
+            forms = self.get_all_forms()
+        if forms is self.forms_cache and self.title_token_index is not None:
+            return self.title_token_index
 
-            # Clear old cache
-            self.forms_cache = {}
+        token_forms = {}
+        for form_id, form_data in forms.items():
+            for token in set(_WORD_RE.findall(form_data.get('title', '').lower())):
+                if (len(token) < 3 or token.isdigit() or token in GENERIC_TITLE_TOKENS
+                        or token in TITLE_STATUS_TOKENS):
+                    continue
+                token_forms.setdefault(token, set()).add(form_id)
+        index = {token: next(iter(ids)) for token, ids in token_forms.items() if len(ids) == 1}
 
-            for form in forms:
-                # Get latest submission date for each form
-                latest_submission = None
-                try:
-                    submissions = self._call_with_retry(
-                        f"get_form_submissions:{form['id']}",
-                        lambda: self.client.get_form_submissions(form['id'], limit=1, order_by='created_at')
-                    )
-                    if submissions and len(submissions) > 0:
-                        latest_submission = submissions[0].get('created_at', '')
-                        print(f"[DEBUG] JotFormHelper.get_all_forms - Form {form['id']} latest submission: {latest_submission}")
-                except ExternalServiceError as e:
-                    log_error(
-                        "JotFormHelper.get_all_forms - Failed to fetch submissions",
-                        e,
-                        {"form_id": form.get('id')}
-                    )
-                except Exception as e:
-                    log_error(
-                        "JotFormHelper.get_all_forms - Could not fetch submissions",
-                        e,
-                        {"form_id": form.get('id')}
-                    )
+        if forms is self.forms_cache:
+            self.title_token_index = index
+        return index
 
-                self.forms_cache[form['id']] = {
-                    'id': form['id'],
-                    'title': form['title'],
-                    'created': form.get('created_at', ''),
-                    'latest_submission': latest_submission or form.get('created_at', '')
-                }
-                print(f"[DEBUG] JotFormHelper.get_all_forms - Added form: {form['id']} - {form['title']}")
+    def _set_catalog_words(self, source, texts):
+        """
+        Replace the catalog words taken from one source (None for the form titles, or a
+        form_id for its product names) and rebuild the union that get_catalog_words returns.
+        Words are 3+ characters and not purely numeric.
+        """
+        words = frozenset(
+            token for text in texts for token in _WORD_RE.findall(str(text).lower())
+            if len(token) >= 3 and not token.isdigit()
+        )
+        with self._catalog_words_lock:
+            self.catalog_word_sets[source] = words
+            self.catalog_words = frozenset().union(*self.catalog_word_sets.values())
 
-            # Update cache timestamp
-            self.forms_cache_timestamp = time.time()
-            print(f"[DEBUG] JotFormHelper.get_all_forms - Cache refreshed at {self.forms_cache_timestamp}")
+    def get_catalog_words(self):
+        """Words of the cached form titles and product names; never fetches anything."""
+        return self.catalog_words
 
-        except ExternalServiceError as e:
-            log_error("JotFormHelper.get_all_forms - Error fetching forms", e)
-            # If we have stale cache data, return it rather than nothing
-            if self.forms_cache:
-                print(f"[DEBUG] JotFormHelper.get_all_forms - Returning stale cache due to error")
+    def get_form_titles(self, forms=None):
+        """
+        Get (form_id, title, lowercased title) for every form, in catalog order.
+        Title searches scan this instead of re-reading and lowercasing each form dict;
+        cached per forms refresh.
+        """
+        if forms is None:
+            forms = self.get_all_forms()
+        if forms is self.forms_cache and self.form_titles is not None:
+            return self.form_titles
+        titles = tuple(
+            (form_id, form_data.get('title', 'Unknown'), form_data.get('title', '').lower())
+            for form_id, form_data in forms.items()
+        )
+        if forms is self.forms_cache:
+            self.form_titles = titles
+        return titles
+
+    def find_form_by_title(self, search_term, forms=None):
+        """Return (form_id, title) of the first form whose title contains search_term, else (None, None)."""
+        search_lower = search_term.lower()
+        for form_id, title, title_lower in self.get_form_titles(forms):
+            if search_lower in title_lower:
+                return form_id, title
+        return None, None
+
+    @staticmethod
+    def format_forms_list(sorted_forms):
+        """Render sorted forms as one '- Title (ID: ..., Latest Activity: ...)' line each."""
+        return "\n".join([
+            f"- {form_data['title']} (ID: {form_id}, Latest Activity: {form_data.get('latest_submission', 'Unknown')})"
+            for form_id, form_data in sorted_forms
+        ])
+
+    def get_all_forms(self, force_refresh=False):
+        """Get list of all forms with TTL-based caching (stale-while-revalidate)."""
+        if self.forms_cache and not force_refresh:
+            if not self.is_cache_expired(self.forms_cache_timestamp):
+                logger.debug("JotFormHelper.get_all_forms - Using cached forms (%s forms, age: %ss)", len(self.forms_cache), int(time.time() - self.forms_cache_timestamp))
                 return self.forms_cache
-            raise
-        except Exception as e:
-            log_error("JotFormHelper.get_all_forms - Error fetching forms", e)
-            if self.forms_cache:
-                print(f"[DEBUG] JotFormHelper.get_all_forms - Returning stale cache due to error")
+            if self.is_cache_servable_stale(self.forms_cache_timestamp):
+                logger.debug("JotFormHelper.get_all_forms - Serving stale forms (age: %ss), refreshing in background", int(time.time() - self.forms_cache_timestamp))
+                self._refresh_in_background('forms', self._refresh_all_forms)
                 return self.forms_cache
-            raise
 
-        return self.forms_cache
+        return self._refresh_all_forms(force_refresh)
 
-    def get_form_metadata(self, form_id, force_refresh=False):
-        """Get full form metadata including vendor, questions, and other properties with TTL-based caching."""
-        # Check if cache is valid for this form
-        cache_timestamp = self.form_metadata_cache_timestamps.get(form_id, 0)
-        cache_valid = (
-            form_id in self.form_metadata_cache and
-            not self.is_cache_expired(cache_timestamp) and
-            not force_refresh
-        )
+    def _refresh_all_forms(self, force_refresh=False):
+        """Fetch all forms from JotForm and swap them into the cache; one fetch at a time."""
+        with self._key_lock('forms'):
+            # Another caller may have refreshed while we waited for the lock
+            if self.forms_cache and not force_refresh and not self.is_cache_expired(self.forms_cache_timestamp):
+                return self.forms_cache
 
-        if cache_valid:
-            print(f"[DEBUG] JotFormHelper.get_form_metadata - Using cached metadata for form {form_id} (age: {int(time.time() - cache_timestamp)}s)")
-            return self.form_metadata_cache[form_id]
+            # Cache expired or empty - fetch fresh data
+            logger.debug("JotFormHelper.get_all_forms - Fetching forms from JotForm API (cache expired or forced refresh)")
+            try:
+                forms = self._call_with_retry("get_forms", self.client.get_forms)
+                logger.debug("JotFormHelper.get_all_forms - Retrieved %s forms from API", len(forms))
+
+                # Get the latest submission date for every form - one independent request per
+                # form, so they run in parallel (still capped by JOTFORM_MAX_CONCURRENCY)
+                with ThreadPoolExecutor(max_workers=JOTFORM_MAX_CONCURRENCY, thread_name_prefix='jotform-forms') as executor:
+                    latest_submissions = list(executor.map(self._fetch_latest_submission, forms))
+
+                # Build into a new dict so readers never see a half-filled cache
+                fresh_forms = {}
+
+                for form, latest_submission in zip(forms, latest_submissions):
+                    fresh_forms[form['id']] = {
+                        'id': form['id'],
+                        'title': form['title'],
+                        'created': form.get('created_at', ''),
+                        'latest_submission': latest_submission or form.get('created_at', '')
+                    }
+                    logger.debug("JotFormHelper.get_all_forms - Added form: %s - %s", form['id'], form['title'])
+
+                # Swap in the new forms (and drop the views derived from the old ones)
+                self.forms_cache = fresh_forms
+                self._set_catalog_words(None, [form_data['title'] for form_data in fresh_forms.values()])
+                self.sorted_forms = None
+                self.forms_list_text = None
+                self.forms_version = None
+                self.form_set_version = None
+                self.title_token_index = None
+                self.form_titles = None
+
+                # Update cache timestamp
+                self.forms_cache_timestamp = time.time()
+                logger.debug("JotFormHelper.get_all_forms - Cache refreshed at %s", self.forms_cache_timestamp)
+                self.save_disk_cache()
+
+            except ExternalServiceError as e:
+                log_error("JotFormHelper.get_all_forms - Error fetching forms", e)
+                # If we have stale cache data, return it rather than nothing
+                if self.forms_cache:
+                    logger.debug("JotFormHelper.get_all_forms - Returning stale cache due to error")
+                    return self.forms_cache
+                raise
+            except Exception as e:
+                log_error("JotFormHelper.get_all_forms - Error fetching forms", e)
+                if self.forms_cache:
+                    logger.debug("JotFormHelper.get_all_forms - Returning stale cache due to error")
+                    return self.forms_cache
+                raise
 
-        try:
-            print(f"[DEBUG] JotFormHelper.get_form_metadata - Fetching full metadata for form {form_id}")
+            return self.forms_cache
 
-            # Get form properties
-            properties = self.client.get_form_properties(form_id)
+    def _fetch_latest_submission(self, form):
+        """Return the created_at of a form's newest submission, or None if it has none or the lookup fails."""
+        try:
+            submissions = self._call_with_retry(
+                f"get_form_submissions:{form['id']}",
+                lambda: self.client.get_form_submissions(form['id'], limit=1, order_by='created_at')
+            )
+            if submissions and len(submissions) > 0:
+                latest_submission = submissions[0].get('created_at', '')
+                logger.debug("JotFormHelper.get_all_forms - Form %s latest submission: %s", form['id'], latest_submission)
+                return latest_submission
+        except ExternalServiceError as e:
+            log_error(
+                "JotFormHelper.get_all_forms - Failed to fetch submissions",
+                e,
+                {"form_id": form.get('id')}
+            )
+        except Exception as e:
+            log_error(
+                "JotFormHelper.get_all_forms - Could not fetch submissions",
+                e,
+                {"form_id": form.get('id')}
+            )
+        return None
 
-            # Get form questions to find vendor info
-            questions = self.client.get_form_questions(form_id)
+    def _fetch_form_properties(self, form_id, force_refresh=False):
+        """
+        Fetch a form's properties, the source of both its products and its metadata.
+        The two refreshes usually run together, so properties fetched less than
+        FORM_PROPERTIES_REUSE_SECONDS ago are reused unless force_refresh is set.
+        """
+        with self._key_lock(('properties', form_id)):
+            entry = self.form_properties.get(form_id)
+            if entry is not None and not force_refresh and time.time() - entry[0] < FORM_PROPERTIES_REUSE_SECONDS:
+                logger.debug("JotFormHelper._fetch_form_properties - Reusing properties for form %s", form_id)
+                return entry[1]
+            properties = self._call_with_retry(
+                f"get_form_properties:{form_id}",
+                lambda: self.client.get_form_properties(form_id)
+            )
+            self.form_properties[form_id] = (time.time(), properties)
+            return properties
 
-            metadata = {
-                'properties': properties,
-                'vendor': None,
-                'suppliers': [],
-                'notes': None,
-                'deadline': None,
-                'closing_date': None
-            }
+    def get_form_metadata(self, form_id, force_refresh=False):
+        """Get full form metadata including vendor, questions, and other properties with TTL-based caching (stale-while-revalidate)."""
+        cache_timestamp = self.form_metadata_cache_timestamps.get(form_id, 0)
+        if form_id in self.form_metadata_cache and not force_refresh:
+            if not self.is_cache_expired(cache_timestamp):
+                logger.debug("JotFormHelper.get_form_metadata - Using cached metadata for form %s (age: %ss)", form_id, int(time.time() - cache_timestamp))
+                return self.form_metadata_cache[form_id]
+            if self.is_cache_servable_stale(cache_timestamp):
+                logger.debug("JotFormHelper.get_form_metadata - Serving stale metadata for form %s, refreshing in background", form_id)
+                self._refresh_in_background(('metadata', form_id), lambda: self._refresh_form_metadata(form_id))
+                return self.form_metadata_cache[form_id]
 
-            # Try to extract vendor/supplier information and deadline from questions
-            for q_id, question in questions.items():
-                q_text = question.get('text', '').lower()
-                q_name = question.get('name', '').lower()
-
-                # Look for vendor/supplier fields
-                if 'vendor' in q_text or 'vendor' in q_name or 'supplier' in q_text or 'supplier' in q_name:
-                    # Check if it has a default value or text
-                    vendor_value = question.get('text', '') or question.get('defaultValue', '')
-                    if vendor_value and 'vendor' not in vendor_value.lower():
-                        metadata['vendor'] = vendor_value
-                        metadata['suppliers'].append(vendor_value)
-                        print(f"[DEBUG] JotFormHelper.get_form_metadata - Found vendor: {vendor_value}")
-
-                # Look for deadline/closing date
-                if any(keyword in q_text or keyword in q_name for keyword in ['deadline', 'close', 'closing', 'end date', 'due date']):
-                    deadline_value = question.get('text', '') or question.get('defaultValue', '')
-                    if deadline_value:
-                        metadata['deadline'] = deadline_value
-                        metadata['closing_date'] = deadline_value
-                        print(f"[DEBUG] JotFormHelper.get_form_metadata - Found deadline: {deadline_value}")
-
-                # Look for notes or additional info
-                if 'note' in q_text or 'note' in q_name or 'info' in q_text:
-                    metadata['notes'] = question.get('text', '')
-
-            # Also check form title for vendor info (sometimes included there)
-            form_title = properties.get('title', '')
-            if '-' in form_title or '|' in form_title:
-                # Sometimes vendors are in the title like "January GB - VendorName"
-                parts = form_title.replace('|', '-').split('-')
-                if len(parts) > 1:
-                    potential_vendor = parts[-1].strip()
-                    if potential_vendor and not any(month in potential_vendor.lower() for month in
-                        ['january', 'february', 'march', 'april', 'may', 'june',
-                         'july', 'august', 'september', 'october', 'november', 'december']):
-                        if not metadata['vendor']:
-                            metadata['vendor'] = potential_vendor
-                        if potential_vendor not in metadata['suppliers']:
-                            metadata['suppliers'].append(potential_vendor)
-
-            # Update cache and timestamp
-            self.form_metadata_cache[form_id] = metadata
-            self.form_metadata_cache_timestamps[form_id] = time.time()
-            print(f"[DEBUG] JotFormHelper.get_form_metadata - Cached metadata for {form_id}: vendor={metadata['vendor']}, suppliers={metadata['suppliers']}, deadline={metadata['deadline']}")
-            return metadata
+        return self._refresh_form_metadata(form_id, force_refresh)
 
-        except Exception as e:
-            print(f"[ERROR] JotFormHelper.get_form_metadata - Error: {e}")
-            import traceback
-            traceback.print_exc()
-            # Return stale cache if available
-            if form_id in self.form_metadata_cache:
-                print(f"[DEBUG] JotFormHelper.get_form_metadata - Returning stale cache due to error")
+    def _refresh_form_metadata(self, form_id, force_refresh=False):
+        """Fetch one form's metadata from JotForm and update the cache; one fetch per form at a time."""
+        with self._key_lock(('metadata', form_id)):
+            # Another caller may have refreshed while we waited for the lock
+            cache_timestamp = self.form_metadata_cache_timestamps.get(form_id, 0)
+            if form_id in self.form_metadata_cache and not force_refresh and not self.is_cache_expired(cache_timestamp):
                 return self.form_metadata_cache[form_id]
-            return {'properties': {}, 'vendor': None, 'suppliers': [], 'notes': None, 'deadline': None, 'closing_date': None}
+
+            try:
+                logger.debug("JotFormHelper.get_form_metadata - Fetching full metadata for form %s", form_id)
+
+                # Get form properties and questions (questions carry vendor info)
+                properties = self._fetch_form_properties(form_id, force_refresh)
+                with self._api_semaphore:
+                    questions = self.client.get_form_questions(form_id)
+
+                metadata = {
+                    'properties': properties,
+                    'vendor': None,
+                    'suppliers': [],
+                    'notes': None,
+                    'deadline': None,
+                    'closing_date': None
+                }
+
+                # Try to extract vendor/supplier information and deadline from questions
+                for q_id, question in questions.items():
+                    fields = {match.lastgroup for match in QUESTION_FIELD_RE.finditer(question.get('text', ''))}
+                    name_fields = {match.lastgroup for match in QUESTION_FIELD_RE.finditer(question.get('name', ''))}
+                    name_fields.discard('info')
+                    fields |= name_fields
+
+                    # Look for vendor/supplier fields
+                    if 'vendor' in fields:
+                        # Check if it has a default value or text
+                        vendor_value = question.get('text', '') or question.get('defaultValue', '')
+                        if vendor_value and 'vendor' not in vendor_value.lower():
+                            metadata['vendor'] = vendor_value
+                            metadata['suppliers'].append(vendor_value)
+                            logger.debug("JotFormHelper.get_form_metadata - Found vendor: %s", vendor_value)
+
+                    # Look for deadline/closing date
+                    if 'deadline' in fields:
+                        deadline_value = question.get('text', '') or question.get('defaultValue', '')
+                        if deadline_value:
+                            metadata['deadline'] = deadline_value
+                            metadata['closing_date'] = deadline_value
+                            logger.debug("JotFormHelper.get_form_metadata - Found deadline: %s", deadline_value)
+
+                    # Look for notes or additional info
+                    if 'notes' in fields or 'info' in fields:
+                        metadata['notes'] = question.get('text', '')
+
+                # Also check form title for vendor info (sometimes included there)
+                form_title = properties.get('title', '')
+                if '-' in form_title or '|' in form_title:
+                    # Sometimes vendors are in the title like "January GB - VendorName"
+                    parts = form_title.replace('|', '-').split('-')
+                    if len(parts) > 1:
+                        potential_vendor = parts[-1].strip()
+                        if potential_vendor and not MONTH_NAME_RE.search(potential_vendor):
+                            if not metadata['vendor']:
+                                metadata['vendor'] = potential_vendor
+                            if potential_vendor not in metadata['suppliers']:
+                                metadata['suppliers'].append(potential_vendor)
+
+                # Update cache and timestamp
+                self.form_metadata_cache[form_id] = metadata
+                self.form_metadata_cache_timestamps[form_id] = time.time()
+                logger.debug("JotFormHelper.get_form_metadata - Cached metadata for %s: vendor=%s, suppliers=%s, deadline=%s", form_id, metadata['vendor'], metadata['suppliers'], metadata['deadline'])
+                self.save_disk_cache()
+                return metadata
+
+            except Exception as e:
+                logger.exception("JotFormHelper.get_form_metadata - Error: %s", e)
+                # Return stale cache if available
+                if form_id in self.form_metadata_cache:
+                    logger.debug("JotFormHelper.get_form_metadata - Returning stale cache due to error")
+                    return self.form_metadata_cache[form_id]
+                return {'properties': {}, 'vendor': None, 'suppliers': [], 'notes': None, 'deadline': None, 'closing_date': None}
     def find_form_by_month(self, month):
         # Find a form that matches a month name
-        forms = self.get_all_forms()
         month_lower = month.lower()
 
-        for form_id, form_data in forms.items():
-            title_lower = form_data['title'].lower()
-            if month_lower in title_lower and 'order' in title_lower:
+        for form_id, _, title_lower in self.get_form_titles():
+            if 'order' in title_lower and month_lower in TITLE_WORD_RE.findall(title_lower):
                 return form_id
         return None
     def get_products(self, form_id, force_refresh=False):
-        """Get products from a specific form with TTL-based caching."""
-        # Check if cache is valid for this form
+        """Get products from a specific form with TTL-based caching (stale-while-revalidate)."""
         cache_timestamp = self.products_cache_timestamps.get(form_id, 0)
-        cache_valid = (
-            form_id in self.products_cache and
-            not self.is_cache_expired(cache_timestamp) and
-            not force_refresh
-        )
+        if form_id in self.products_cache and not force_refresh:
+            self.products_hits[form_id] = self.products_hits.get(form_id, 0) + 1
+            if not self.is_cache_expired(cache_timestamp):
+                logger.debug("JotFormHelper.get_products - Using cached products for form %s (age: %ss)", form_id, int(time.time() - cache_timestamp))
+                return self.products_cache[form_id]
+            if self.is_cache_servable_stale(cache_timestamp):
+                logger.debug("JotFormHelper.get_products - Serving stale products for form %s, refreshing in background", form_id)
+                self._refresh_in_background(('products', form_id), lambda: self._refresh_products(form_id))
+                return self.products_cache[form_id]
 
-        if cache_valid:
-            print(f"[DEBUG] JotFormHelper.get_products - Using cached products for form {form_id} (age: {int(time.time() - cache_timestamp)}s)")
-            return self.products_cache[form_id]
+        return self._refresh_products(form_id, force_refresh)
 
-        try:
-            print(f"[DEBUG] JotFormHelper.get_products - Fetching properties for form {form_id} (cache expired or forced refresh)")
-            properties = self._call_with_retry(
-                f"get_form_properties:{form_id}",
-                lambda: self.client.get_form_properties(form_id)
+    def prefetch_hot_products(self):
+        """
+        Queue background refreshes for the products of busy forms (read at least
+        PREFETCH_MIN_HITS times since their last refresh) that are past
+        PREFETCH_AGE_FRACTION of the TTL, before any reader finds them expired.
+        Returns the number of forms queued.
+        """
+        refresh_after = CACHE_TTL_SECONDS * PREFETCH_AGE_FRACTION
+        now = time.time()
+        queued = 0
+        for form_id, hits in list(self.products_hits.items()):
+            if hits < PREFETCH_MIN_HITS or form_id not in self.products_cache:
+                continue
+            if now - self.products_cache_timestamps.get(form_id, 0) < refresh_after:
+                continue
+            self._refresh_in_background(
+                ('products', form_id), lambda fid=form_id: self._refresh_products(fid, force_refresh=True)
+            )
+            queued += 1
+        return queued
+
+    def get_products_prompt_block(self, form_id, form_title, products=None, vendor_info=None):
+        """
+        Get the form/vendor/products block embedded in answer prompts, built once per form.
+        Rebuilt only when the products list (or title/vendor info) changes, so repeat questions
+        about a form reuse the same string and send OpenAI an identical prompt prefix.
+        """
+        if products is None:
+            products = self.get_products(form_id)
+        vendor_key = prompt_vendor_key(vendor_info)
+        entry = self.products_prompt_blocks.get(form_id)
+        if entry is not None:
+            cached_products, cached_title, cached_vendor_key, block = entry
+            if (cached_title == form_title and cached_vendor_key == vendor_key
+                    and (cached_products is products or cached_products == products)):
+                return block
+
+        block = build_form_prompt_block(form_title, products, vendor_info)
+        self.products_prompt_blocks[form_id] = (products, form_title, vendor_key, block)
+        return block
+
+    def get_product_index(self, form_id, products=None):
+        """
+        Get the fuzzy-matching index for a form's products (see ProductCandidateIndex),
+        built once per products refresh instead of re-deriving it for every message.
+        Products without a usable name are left out.
+        """
+        if products is None:
+            products = self.get_products(form_id)
+        entry = self.product_indexes.get(form_id)
+        if entry is not None and entry[0] is products:
+            return entry[1]
+
+        index = ProductCandidateIndex(tuple(
+            build_product_match_key(product.get('name', ''))
+            for product in products
+            if product.get('name', '') and product.get('name') != 'N/A'
+        ))
+        self.product_indexes[form_id] = (products, index)
+        return index
+
+    def get_product_names(self, form_id, products=None):
+        """Get (product, lowercased name) for a form's products, built once per products refresh."""
+        if products is None:
+            products = self.get_products(form_id)
+        entry = self.product_names.get(form_id)
+        if entry is not None and entry[0] is products:
+            return entry[1]
+
+        names = tuple((product, product.get('name', '').lower()) for product in products)
+        self.product_names[form_id] = (products, names)
+        return names
+
+    def search_products(self, form_id, search_term, products=None):
+        """Return the form's products whose name contains search_term (case-insensitive), in order."""
+        search_lower = search_term.lower()
+        return [
+            product for product, name_lower in self.get_product_names(form_id, products)
+            if search_lower in name_lower
+        ]
+
+    def fuzzy_search_products(self, form_id, search_term, products=None):
+        """
+        Return the form's products whose name is similar to search_term, best match first,
+        for searches with typos or words in another order ("retatrutid", "10mg reta").
+        Uses rapidfuzz's token set ratio when installed; otherwise each search word is
+        scored by its difflib similarity to the closest word of the name, and the
+        product's score is the average over the search words.
+        """
+        names = self.get_product_names(form_id, products)
+        search_lower = search_term.lower()
+        if fuzz_process is not None:
+            matches = fuzz_process.extract(
+                search_lower, [name_lower for _, name_lower in names], scorer=fuzz.token_set_ratio,
+                score_cutoff=PRODUCT_SEARCH_MIN_SCORE, limit=PRODUCT_SEARCH_MAX_RESULTS
             )
-            raw_products = properties.get('products', [])
-            print(f"[DEBUG] JotFormHelper.get_products - Raw products count: {len(raw_products)}")
-            clean_products = self.clean_products(raw_products)
-            print(f"[DEBUG] JotFormHelper.get_products - Clean products count: {len(clean_products)}")
+            return [names[index][0] for _, _, index in matches]
+
+        # difflib caches its analysis of the second sequence, so each search word is set there once
+        matchers = [difflib.SequenceMatcher(None, b=word) for word in _WORD_RE.findall(search_lower) or [search_lower]]
+        scored = []
+        for position, (product, name_lower) in enumerate(names):
+            name_words = _WORD_RE.findall(name_lower) + [name_lower]
+            total = 0.0
+            for matcher in matchers:
+                best = 0.0
+                for word in name_words:
+                    matcher.set_seq1(word)
+                    best = max(best, matcher.ratio())
+                total += best
+            score = total / len(matchers) * 100
+            if score >= PRODUCT_SEARCH_MIN_SCORE:
+                scored.append((-score, position, product))
+        scored.sort(key=lambda item: item[:2])
+        return [product for _, _, product in scored[:PRODUCT_SEARCH_MAX_RESULTS]]
+
+    def _refresh_products(self, form_id, force_refresh=False):
+        """Fetch one form's products from JotForm and update the cache; one fetch per form at a time."""
+        with self._key_lock(('products', form_id)):
+            # Another caller may have refreshed while we waited for the lock
+            cache_timestamp = self.products_cache_timestamps.get(form_id, 0)
+            if form_id in self.products_cache and not force_refresh and not self.is_cache_expired(cache_timestamp):
+                return self.products_cache[form_id]
 
-            # Update cache and timestamp
-            self.products_cache[form_id] = clean_products
-            self.products_cache_timestamps[form_id] = time.time()
-            print(f"[DEBUG] JotFormHelper.get_products - Cache refreshed for form {form_id}")
+            try:
+                logger.debug("JotFormHelper.get_products - Fetching properties for form %s (cache expired or forced refresh)", form_id)
+                properties = self._fetch_form_properties(form_id, force_refresh)
+                raw_products = properties.get('products', [])
+                logger.debug("JotFormHelper.get_products - Raw products count: %s", len(raw_products))
+                clean_products = self.clean_products(raw_products)
+                logger.debug("JotFormHelper.get_products - Clean products count: %s", len(clean_products))
+
+                # Update cache and timestamp
+                self.products_cache[form_id] = clean_products
+                self.products_cache_timestamps[form_id] = time.time()
+                self._set_catalog_words(form_id, [product.get('name', '') for product in clean_products])
+                self.products_prompt_blocks.pop(form_id, None)
+                self.product_indexes.pop(form_id, None)
+                self.product_names.pop(form_id, None)
+                self.products_hits.pop(form_id, None)
+                logger.debug("JotFormHelper.get_products - Cache refreshed for form %s", form_id)
+                self.save_disk_cache()
+
+                return clean_products
+            except ExternalServiceError as e:
+                log_error("JotFormHelper.get_products - Error fetching products", e, {"form_id": form_id}, exc_info=True)
+                # Return stale cache if available
+                if form_id in self.products_cache:
+                    logger.debug("JotFormHelper.get_products - Returning stale cache due to error")
+                    return self.products_cache[form_id]
+                raise
+            except Exception as e:
+                log_error("JotFormHelper.get_products - Error fetching products", e, {"form_id": form_id}, exc_info=True)
+                if form_id in self.products_cache:
+                    logger.debug("JotFormHelper.get_products - Returning stale cache due to error")
+                    return self.products_cache[form_id]
+                return []
 
-            return clean_products
-        except ExternalServiceError as e:
-            log_error("JotFormHelper.get_products - Error fetching products", e, {"form_id": form_id})
-            import traceback
-            traceback.print_exc()
-            # Return stale cache if available
-            if form_id in self.products_cache:
-                print(f"[DEBUG] JotFormHelper.get_products - Returning stale cache due to error")
-                return self.products_cache[form_id]
-            raise
-        except Exception as e:
-            log_error("JotFormHelper.get_products - Error fetching products", e, {"form_id": form_id})
-            import traceback
-            traceback.print_exc()
-            if form_id in self.products_cache:
-                print(f"[DEBUG] JotFormHelper.get_products - Returning stale cache due to error")
-                return self.products_cache[form_id]
-            return []
-        
     def clean_products(self, products):
         clean_products_list = []
         for product in products:
@@ -849,10 +2217,7 @@ class JotFormHelper:
         if pretty_format:
             lines = [line.strip() for line in str(pretty_format).splitlines() if line.strip()]
             for line in lines:
-                match = re.match(
-                    r'^(?P<name>.+?)(?:\s*\(x(?P<qty>\d+)\))?(?:\s*x(?P<qty_alt>\d+))?(?:\s*-\s*\$?(?P<price>[\d.,]+))?$',
-                    line
-                )
+                match = PRETTY_ITEM_LINE_RE.match(line)
                 if match:
                     name = match.group('name').strip()
                     quantity = match.group('qty') or match.group('qty_alt') or ''
@@ -894,7 +2259,7 @@ class JotFormHelper:
         Returns:
             dict with submission info or None if not found
         """
-        print(f"[DEBUG] search_submission_by_invoice - Searching for invoice: {invoice_id}")
+        logger.debug("search_submission_by_invoice - Searching for invoice: %s", invoice_id)
 
         # Normalize the invoice ID (remove spaces, make uppercase for comparison)
         invoice_normalized = str(invoice_id).strip().upper()
@@ -928,7 +2293,7 @@ class JotFormHelper:
                                                                    'reference', 'confirmation'])
 
                             if is_invoice_field and answer == invoice_normalized:
-                                print(f"[DEBUG] search_submission_by_invoice - Found match in form {form_id}")
+                                logger.debug("search_submission_by_invoice - Found match in form %s", form_id)
 
                                 # Extract useful information from the submission
                                 result = {
@@ -952,14 +2317,14 @@ class JotFormHelper:
                                 return result
 
                 except Exception as e:
-                    print(f"[DEBUG] search_submission_by_invoice - Error searching form {form_id}: {e}")
+                    logger.debug("search_submission_by_invoice - Error searching form %s: %s", form_id, e)
                     continue
 
-            print(f"[DEBUG] search_submission_by_invoice - No match found for invoice: {invoice_id}")
+            logger.debug("search_submission_by_invoice - No match found for invoice: %s", invoice_id)
             return None
 
         except Exception as e:
-            print(f"[ERROR] search_submission_by_invoice - Error: {e}")
+            logger.error("search_submission_by_invoice - Error: %s", e)
             return None
 
     def search_submission_in_form(self, form_id, search_value, form_title=None):
@@ -975,7 +2340,7 @@ class JotFormHelper:
         Returns:
             dict with full submission info or None if not found
         """
-        print(f"[DEBUG] search_submission_in_form - Searching form {form_id} for: {search_value}")
+        logger.debug("search_submission_in_form - Searching form %s for: %s", form_id, search_value)
 
         search_normalized = str(search_value).strip().lower()
         search_parts = search_normalized.split()  # Split for partial matching (e.g., "Emily March" -> ["emily", "march"])
@@ -988,10 +2353,10 @@ class JotFormHelper:
             )
 
             if not submissions:
-                print(f"[DEBUG] search_submission_in_form - No submissions found in form {form_id}")
+                logger.debug("search_submission_in_form - No submissions found in form %s", form_id)
                 return None
 
-            print(f"[DEBUG] search_submission_in_form - Found {len(submissions)} submissions to search")
+            logger.debug("search_submission_in_form - Found %s submissions to search", len(submissions))
 
             for submission in submissions:
                 answers = submission.get('answers', {})
@@ -1055,7 +2420,7 @@ class JotFormHelper:
                     if any(kw in field_name or kw in field_text for kw in ['invoice', 'order number', 'order id', 'reference', 'confirmation', 'transaction']):
                         submission_data['invoice_id'] = answer_str
                         if search_normalized in answer_lower or answer_lower in search_normalized:
-                            print(f"[DEBUG] search_submission_in_form - Invoice match: {answer_str}")
+                            logger.debug("search_submission_in_form - Invoice match: %s", answer_str)
                             match_found = True
 
                     # Check for name fields (including JotForm's control_fullname type)
@@ -1071,7 +2436,7 @@ class JotFormHelper:
                             if (search_normalized in name_lower or
                                 name_lower in search_normalized or
                                 all(part in name_lower for part in search_parts)):
-                                print(f"[DEBUG] search_submission_in_form - Name match: {full_name}")
+                                logger.debug("search_submission_in_form - Name match: %s", full_name)
                                 match_found = True
                         else:
                             if submission_data['customer_name']:
@@ -1079,7 +2444,7 @@ class JotFormHelper:
                             else:
                                 submission_data['customer_name'] = answer_str
                             if search_normalized in answer_lower or all(part in answer_lower for part in search_parts):
-                                print(f"[DEBUG] search_submission_in_form - Name match: {answer_str}")
+                                logger.debug("search_submission_in_form - Name match: %s", answer_str)
                                 match_found = True
 
                     # Check for Telegram username
@@ -1089,14 +2454,14 @@ class JotFormHelper:
                         submission_data['telegram_username'] = tg_username
                         search_tg = search_normalized.lstrip('@')
                         if search_tg in tg_username.lower() or tg_username.lower() in search_tg:
-                            print(f"[DEBUG] search_submission_in_form - TG username match: {tg_username}")
+                            logger.debug("search_submission_in_form - TG username match: %s", tg_username)
                             match_found = True
 
                     # Check for email
                     if 'email' in field_name or 'email' in field_text or field_type == 'control_email':
                         submission_data['email'] = answer_str
                         if search_normalized == answer_lower or search_normalized in answer_lower:
-                            print(f"[DEBUG] search_submission_in_form - Email match: {answer_str}")
+                            logger.debug("search_submission_in_form - Email match: %s", answer_str)
                             match_found = True
 
                     # Check for products (payment field or product list)
@@ -1113,49 +2478,67 @@ class JotFormHelper:
                 if not match_found:
                     combined_text = ' '.join(all_text_values)
                     if search_normalized in combined_text or all(part in combined_text for part in search_parts):
-                        print(f"[DEBUG] search_submission_in_form - Broad match found in submission {submission.get('id')}")
+                        logger.debug("search_submission_in_form - Broad match found in submission %s", submission.get('id'))
                         match_found = True
 
                 if match_found:
                     submission_data['found'] = True
-                    print(f"[DEBUG] search_submission_in_form - Match found! Invoice: {submission_data['invoice_id']}, Name: {submission_data['customer_name']}")
+                    logger.debug("search_submission_in_form - Match found! Invoice: %s, Name: %s", submission_data['invoice_id'], submission_data['customer_name'])
                     return submission_data
 
-            print(f"[DEBUG] search_submission_in_form - No match found for: {search_value}")
+            logger.debug("search_submission_in_form - No match found for: %s", search_value)
             return None
 
         except Exception as e:
-            print(f"[ERROR] search_submission_in_form - Error: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("search_submission_in_form - Error: %s", e)
             return None
 
 
-def generate_answer_with_products(user_question, form_title, products, vendor_info=None):
+def format_price_for_prompt(price):
+    """Format a product price uniformly ("12" and "12.0" both become "12.00")."""
+    try:
+        return f"{float(str(price).replace(',', '').lstrip('$')):.2f}"
+    except (TypeError, ValueError):
+        return str(price)
+
+
+def format_products_for_prompt(products):
     """
-    Uses ChatGPT to generate a natural conversational answer to the user's question
-    based on the available products and form metadata.
+    Format a product list as the numbered text block embedded in ChatGPT prompts.
+    Products are listed by name with uniformly formatted prices so the same catalog
+    always produces the same text. Builds the block from a list of parts and joins once.
     """
-    client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
-
-    # Format products as a clean list for ChatGPT
-    products_text = ""
-    for idx, product in enumerate(products, 1):
+    parts = []
+    ordered = sorted(products, key=lambda product: str(product.get('name', 'N/A')).lower())
+    for idx, product in enumerate(ordered, 1):
         name = product.get('name', 'N/A')
-        price = product.get('price', 'N/A')
+        price = format_price_for_prompt(product.get('price', 'N/A'))
         description = product.get('description', 'N/A')
-        products_text += f"{idx}. {name}\n   Price: ${price}\n   Description: {description}\n"
+        parts.append(f"{idx}. {name}\n   Price: ${price}\n   Description: {description}\n")
 
         # Add MOQ and other fields if available
         if 'moq' in product:
-            products_text += f"   MOQ (Minimum Order Quantity): {product['moq']}\n"
+            parts.append(f"   MOQ (Minimum Order Quantity): {product['moq']}\n")
         if 'quantity' in product:
-            products_text += f"   Quantity: {product['quantity']}\n"
+            parts.append(f"   Quantity: {product['quantity']}\n")
         if 'stock' in product:
-            products_text += f"   Stock: {product['stock']}\n"
+            parts.append(f"   Stock: {product['stock']}\n")
+
+        parts.append("\n")
 
-        products_text += "\n"
+    return ''.join(parts)
 
+
+def prompt_vendor_key(vendor_info):
+    """The vendor_info fields that appear in answer prompts, as a comparable tuple."""
+    if not vendor_info:
+        return None
+    suppliers = vendor_info.get('suppliers')
+    return (vendor_info.get('vendor'), tuple(suppliers) if suppliers else None, vendor_info.get('deadline'))
+
+
+def build_form_prompt_block(form_title, products, vendor_info=None):
+    """Build the form title, vendor/deadline and products section of an answer prompt."""
     # Add vendor information if available
     vendor_text = ""
     if vendor_info:
@@ -1170,73 +2553,21 @@ def generate_answer_with_products(user_question, form_title, products, vendor_in
     if vendor_info and vendor_info.get('deadline'):
         deadline_text = f"\nDeadline/Closing Date: {vendor_info['deadline']}"
 
-    prompt = f"""You are Bohemia's Steward, a helpful assistant for a Group Buy community.
-
-Form: {form_title}{vendor_text}{deadline_text}
+    return f"""Form: {form_title}{vendor_text}{deadline_text}
 
 Products:
-{products_text}
-
-User asked: "{user_question}"
-
-CRITICAL INSTRUCTIONS:
-- ONLY answer the specific question asked - don't volunteer extra information
-- If they ask a vague question like "What about X GB?", ask what specifically they want to know
-- Be conversational and natural - vary your tone and style
-- Don't follow a rigid format or template - be creative with your responses
-- Match product abbreviations (Reta=Retatrutide, R30=products with 30, etc.)
-- For ambiguous product names, ask for clarification
-- For timeline questions: "4-8 weeks depending on customs, production, and shipping. Subject to delays for custom batches, seizures, or international shipping."
-
-MOQ (Minimum Order Quantity) INSTRUCTIONS:
-- If user asks about MOQ, minimum order, or minimum quantity for a product:
-  1. First check if there's an explicit "MOQ" field listed for that product
-  2. If not, search the Description field for MOQ info (look for "MOQ:", "minimum order", "min order", "X units minimum", etc.)
-  3. If MOQ is found, state it clearly: "The MOQ for [product] is [amount]"
-  4. If no MOQ info exists for the product, say: "I don't see a specific MOQ listed for [product]. Some products have no minimum - check the order form or ask an admin."
-- Be specific about which product's MOQ you're answering about
-
-GENERAL:
-- The Description field contains critical information including MOQ, lab details, testing info, and vendor specifics - ALWAYS read and use this information
-- Keep responses SHORT and direct"""
-
-    print(f"[DEBUG] generate_answer_with_products - Generating answer for: '{user_question}'")
-    print(f"[DEBUG] generate_answer_with_products - Using {len(products)} products")
-
-    response = call_openai_with_retry(
-        "generate_answer_with_products",
-        lambda timeout: client.chat.completions.create(
-            model="gpt-4o",
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.95,
-            timeout=timeout
-        )
-    )
-
-    answer = response.choices[0].message.content.strip()
-    print(f"[DEBUG] generate_answer_with_products - Generated answer length: {len(answer)} chars")
-
-    return answer
+{format_products_for_prompt(products)}"""
 
 
-def generate_answer_with_multi_form_products(user_question, forms_data):
+def format_multi_form_products_for_prompt(forms_data):
     """
-    Uses ChatGPT to generate a natural conversational answer to the user's question
-    based on products from multiple forms. This handles cases where multiple forms
-    (e.g., two January GBs) need to be searched.
-
-    Args:
-        user_question: The user's question
-        forms_data: List of dicts, each containing:
-            - 'form_id': The form ID
-            - 'form_title': The form title
-            - 'products': List of products from this form
-            - 'vendor_info': Optional vendor metadata
+    Format the products of several forms for a multi-form answer prompt.
+    Returns (forms_list_text, all_products_text): the comma-separated form titles and
+    each form's vendor/deadline and numbered products under a "=== title ===" header
+    (forms without products are listed but get no section). Products are formatted by
+    format_products_for_prompt, so they read the same as in single-form prompts.
     """
-    client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
-
-    # Format products grouped by form
-    all_products_text = ""
+    parts = []
     form_titles = []
 
     for form_info in forms_data:
@@ -1249,86 +2580,87 @@ def generate_answer_with_multi_form_products(user_question, forms_data):
         if not products:
             continue
 
-        all_products_text += f"\n=== {form_title} ===\n"
+        parts.append(f"\n=== {form_title} ===\n")
 
         # Add vendor info if available
         if vendor_info:
             if vendor_info.get('vendor'):
-                all_products_text += f"Vendor: {vendor_info['vendor']}\n"
+                parts.append(f"Vendor: {vendor_info['vendor']}\n")
             if vendor_info.get('deadline'):
-                all_products_text += f"Deadline: {vendor_info['deadline']}\n"
-
-        all_products_text += "\n"
-
-        for idx, product in enumerate(products, 1):
-            name = product.get('name', 'N/A')
-            price = product.get('price', 'N/A')
-            description = product.get('description', 'N/A')
-            all_products_text += f"{idx}. {name}\n   Price: ${price}\n   Description: {description}\n"
-
-            # Add MOQ and other fields if available
-            if 'moq' in product:
-                all_products_text += f"   MOQ (Minimum Order Quantity): {product['moq']}\n"
-            if 'quantity' in product:
-                all_products_text += f"   Quantity: {product['quantity']}\n"
-            if 'stock' in product:
-                all_products_text += f"   Stock: {product['stock']}\n"
-
-            all_products_text += "\n"
-
-    forms_list_text = ", ".join(form_titles)
+                parts.append(f"Deadline: {vendor_info['deadline']}\n")
 
-    prompt = f"""You are Bohemia's Steward, a helpful assistant for a Group Buy community.
-
-IMPORTANT: The user's question may apply to MULTIPLE Group Buy forms. I've searched the following forms and found products in each:
+        parts.append("\n")
+        parts.append(format_products_for_prompt(products))
 
-Forms searched: {forms_list_text}
+    return ", ".join(form_titles), ''.join(parts)
 
-{all_products_text}
 
-User asked: "{user_question}"
+# Fixed answer instructions. They go first in the system message, followed by the per-form
+# products block, and the user's question is sent last - so repeat questions about the same
+# form share a long identical prompt prefix that OpenAI's prompt caching can reuse.
+CONTEXT_ANSWER_INSTRUCTIONS = """You are Bohemia's Steward, a helpful assistant for a Group Buy community.
+The form and its products are listed below; the user's question (and any conversation context) is sent as the next message.
 
 CRITICAL INSTRUCTIONS:
-- Search ALL forms listed above for relevant information
-- If the product exists in multiple forms, mention BOTH/ALL occurrences with their respective form names and details
-- Clearly indicate which form each piece of information comes from (e.g., "In the January GB #1, the MOQ is X. In January GB #2, the MOQ is Y.")
-- If the product only appears in one form, specify which form it's from
 - ONLY answer the specific question asked - don't volunteer extra information
+- If they ask a vague question like "What about X GB?", ask what specifically they want to know
 - Be conversational and natural - vary your tone and style
 - Match product abbreviations (Reta=Retatrutide, R30=products with 30, etc.)
+- For ambiguous product names, ask for clarification
+
+FOLLOW-UP QUESTION HANDLING:
+- If the user asks a short/vague follow-up like "what about the price?" or "moq?" or "how much?", USE THE CONVERSATION CONTEXT to understand what they're asking about
+- If they say "what about X" where X is an attribute (price, moq, etc.), assume they're asking about the same product from the previous question
+- If context shows they were discussing a specific product, apply their new question to that product
+- If you're unsure what they're asking about, politely ask for clarification
 
 MOQ (Minimum Order Quantity) INSTRUCTIONS:
 - If user asks about MOQ, minimum order, or minimum quantity for a product:
-  1. Check ALL forms for that product
-  2. Report MOQ info from EACH form where the product appears
-  3. If MOQ differs between forms, clearly state both
-  4. If no MOQ info exists in any form, say: "I don't see a specific MOQ listed for [product] in any of the forms."
+  1. First check if there's an explicit "MOQ" field listed for that product
+  2. If not, search the Description field for MOQ info
+  3. If MOQ is found, state it clearly: "The MOQ for [product] is [amount]"
+  4. If no MOQ info exists, say: "I don't see a specific MOQ listed for [product]. Some products have no minimum - check the order form or ask an admin."
 
 GENERAL:
 - The Description field contains critical information including MOQ, lab details, testing info, and vendor specifics - ALWAYS read and use this information
-- Keep responses SHORT and direct
-- Always clarify which form information comes from"""
+- Keep responses SHORT and direct"""
+
+
+def get_form_prompt_block(form_id, form_title, products, vendor_info=None):
+    """Products block for an answer prompt, memoized per form when the form ID is known."""
+    if form_id is None:
+        return build_form_prompt_block(form_title, products, vendor_info)
+    return jotform_helper.get_products_prompt_block(form_id, form_title, products, vendor_info)
+
 
-    print(f"[DEBUG] generate_answer_with_multi_form_products - Generating answer for: '{user_question}'")
-    print(f"[DEBUG] generate_answer_with_multi_form_products - Using {len(forms_data)} forms")
+async def complete_answer_async(operation_name, client, messages, temperature, on_partial=None):
+    """Run a gpt-4o answer completion, streaming it to on_partial when a callback is given."""
+    if on_partial is None:
+        response = await call_openai_with_retry_async(
+            operation_name,
+            lambda timeout: client.chat.completions.create(
+                model="gpt-4o",
+                messages=messages,
+                temperature=temperature,
+                timeout=timeout
+            )
+        )
+        return response.choices[0].message.content
 
-    response = call_openai_with_retry(
-        "generate_answer_with_multi_form_products",
+    return await stream_openai_with_retry_async(
+        operation_name,
         lambda timeout: client.chat.completions.create(
             model="gpt-4o",
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.95,
+            messages=messages,
+            temperature=temperature,
+            stream=True,
             timeout=timeout
-        )
+        ),
+        on_partial
     )
 
-    answer = response.choices[0].message.content.strip()
-    print(f"[DEBUG] generate_answer_with_multi_form_products - Generated answer length: {len(answer)} chars")
-
-    return answer
-
 
-async def generate_answer_with_context_async(user_question, form_title, products, vendor_info=None, conversation_context=None):
+async def generate_answer_with_context_async(user_question, form_title, products, vendor_info=None, conversation_context=None, form_id=None, on_partial=None):
     """
     Async version that generates a natural conversational answer using conversation context.
     This enables proper multi-turn conversations by providing context about what was discussed before.
@@ -1339,38 +2671,12 @@ async def generate_answer_with_context_async(user_question, form_title, products
         products: List of products from the form
         vendor_info: Optional vendor metadata
         conversation_context: Dict with previous conversation context (last_product, last_topic, etc.)
+        on_partial: Optional non-blocking callback; when given the answer is streamed
+            and on_partial(text_so_far) is called as it arrives
     """
-    client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
-
-    # Format products as a clean list for ChatGPT
-    products_text = ""
-    for idx, product in enumerate(products, 1):
-        name = product.get('name', 'N/A')
-        price = product.get('price', 'N/A')
-        description = product.get('description', 'N/A')
-        products_text += f"{idx}. {name}\n   Price: ${price}\n   Description: {description}\n"
-
-        if 'moq' in product:
-            products_text += f"   MOQ (Minimum Order Quantity): {product['moq']}\n"
-        if 'quantity' in product:
-            products_text += f"   Quantity: {product['quantity']}\n"
-        if 'stock' in product:
-            products_text += f"   Stock: {product['stock']}\n"
-        products_text += "\n"
-
-    # Add vendor information if available
-    vendor_text = ""
-    if vendor_info:
-        if vendor_info.get('vendor'):
-            vendor_text += f"\nVendor/Supplier: {vendor_info['vendor']}"
-        elif vendor_info.get('suppliers'):
-            vendors_list = ', '.join(vendor_info['suppliers'])
-            vendor_text += f"\nVendors/Suppliers: {vendors_list}"
+    client = get_async_openai_client()
 
-    # Add deadline information if available
-    deadline_text = ""
-    if vendor_info and vendor_info.get('deadline'):
-        deadline_text = f"\nDeadline/Closing Date: {vendor_info['deadline']}"
+    products_block = get_form_prompt_block(form_id, form_title, products, vendor_info)
 
     # Build conversation context section
     context_text = ""
@@ -1388,104 +2694,46 @@ async def generate_answer_with_context_async(user_question, form_title, products
         if context_parts:
             context_text = "\n\nCONVERSATION CONTEXT (use this to understand follow-up questions):\n" + "\n".join(context_parts)
 
-    prompt = f"""You are Bohemia's Steward, a helpful assistant for a Group Buy community.
-
-Form: {form_title}{vendor_text}{deadline_text}
-
-Products:
-{products_text}
-{context_text}
-
-User asked: "{user_question}"
-
-CRITICAL INSTRUCTIONS:
-- ONLY answer the specific question asked - don't volunteer extra information
-- If they ask a vague question like "What about X GB?", ask what specifically they want to know
-- Be conversational and natural - vary your tone and style
-- Match product abbreviations (Reta=Retatrutide, R30=products with 30, etc.)
-- For ambiguous product names, ask for clarification
-
-FOLLOW-UP QUESTION HANDLING:
-- If the user asks a short/vague follow-up like "what about the price?" or "moq?" or "how much?", USE THE CONVERSATION CONTEXT to understand what they're asking about
-- If they say "what about X" where X is an attribute (price, moq, etc.), assume they're asking about the same product from the previous question
-- If context shows they were discussing a specific product, apply their new question to that product
-- If you're unsure what they're asking about, politely ask for clarification
-
-MOQ (Minimum Order Quantity) INSTRUCTIONS:
-- If user asks about MOQ, minimum order, or minimum quantity for a product:
-  1. First check if there's an explicit "MOQ" field listed for that product
-  2. If not, search the Description field for MOQ info
-  3. If MOQ is found, state it clearly: "The MOQ for [product] is [amount]"
-  4. If no MOQ info exists, say: "I don't see a specific MOQ listed for [product]. Some products have no minimum - check the order form or ask an admin."
-
-GENERAL:
-- The Description field contains critical information including MOQ, lab details, testing info, and vendor specifics - ALWAYS read and use this information
-- Keep responses SHORT and direct"""
-
-    print(f"[DEBUG] generate_answer_with_context_async - Generating answer for: '{user_question}'")
-    print(f"[DEBUG] generate_answer_with_context_async - Using {len(products)} products, context: {bool(conversation_context)}")
-
-    response = await call_openai_with_retry_async(
+    question_text = f'{context_text.lstrip()}\n\nUser asked: "{user_question}"' if context_text else f'User asked: "{user_question}"'
+
+    # Without conversation context the prompt depends only on the question and the form's
+    # prompt block, so repeat questions about a form are answered from the cache. Cached
+    # answers are generated at temperature 0: a cached sample is reused as-is anyway
+    cache_key = None
+    if not context_text:
+        cache_key = ('context', normalize_cache_text(user_question), products_block)
+        cached_answer = answer_cache.get(cache_key)
+        if cached_answer is not None:
+            logger.debug("generate_answer_with_context_async - Cache hit for: '%s'", user_question)
+            return cached_answer
+
+    logger.debug("generate_answer_with_context_async - Generating answer for: '%s'", user_question)
+    logger.debug("generate_answer_with_context_async - Using %s products, context: %s", len(products), bool(conversation_context))
+
+    messages = [
+        {"role": "system", "content": f"{CONTEXT_ANSWER_INSTRUCTIONS}\n\n{products_block}"},
+        {"role": "user", "content": question_text}
+    ]
+    answer = (await complete_answer_async(
         "generate_answer_with_context_async",
-        lambda timeout: client.chat.completions.create(
-            model="gpt-4o",
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.7,  # Slightly lower for more consistent follow-ups
-            timeout=timeout
-        )
-    )
-
-    answer = response.choices[0].message.content.strip()
-    print(f"[DEBUG] generate_answer_with_context_async - Generated answer length: {len(answer)} chars")
-
+        client,
+        messages,
+        temperature=0 if cache_key is not None else 0.7,  # Slightly lower for more consistent follow-ups
+        on_partial=on_partial
+    )).strip()
+    logger.debug("generate_answer_with_context_async - Generated answer length: %s chars", len(answer))
+
+    if cache_key is not None:
+        answer_cache.set(cache_key, answer)
     return answer
 
 
-async def generate_answer_with_multi_form_context_async(user_question, forms_data, conversation_context=None):
+async def generate_answer_with_multi_form_context_async(user_question, forms_data, conversation_context=None, on_partial=None):
     """
     Async version that generates answers from multiple forms with conversation context support.
+    When on_partial is given the answer is streamed to it (see generate_answer_with_context_async).
     """
-    client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
-
-    # Format products grouped by form
-    all_products_text = ""
-    form_titles = []
-
-    for form_info in forms_data:
-        form_title = form_info.get('form_title', 'Unknown Form')
-        products = form_info.get('products', [])
-        vendor_info = form_info.get('vendor_info', {})
-
-        form_titles.append(form_title)
-
-        if not products:
-            continue
-
-        all_products_text += f"\n=== {form_title} ===\n"
-
-        if vendor_info:
-            if vendor_info.get('vendor'):
-                all_products_text += f"Vendor: {vendor_info['vendor']}\n"
-            if vendor_info.get('deadline'):
-                all_products_text += f"Deadline: {vendor_info['deadline']}\n"
-
-        all_products_text += "\n"
-
-        for idx, product in enumerate(products, 1):
-            name = product.get('name', 'N/A')
-            price = product.get('price', 'N/A')
-            description = product.get('description', 'N/A')
-            all_products_text += f"{idx}. {name}\n   Price: ${price}\n   Description: {description}\n"
-
-            if 'moq' in product:
-                all_products_text += f"   MOQ (Minimum Order Quantity): {product['moq']}\n"
-            if 'quantity' in product:
-                all_products_text += f"   Quantity: {product['quantity']}\n"
-            if 'stock' in product:
-                all_products_text += f"   Stock: {product['stock']}\n"
-            all_products_text += "\n"
-
-    forms_list_text = ", ".join(form_titles)
+    client = get_async_openai_client()
 
     # Build conversation context section
     context_text = ""
@@ -1503,6 +2751,25 @@ async def generate_answer_with_multi_form_context_async(user_question, forms_dat
         if context_parts:
             context_text = "\n\nCONVERSATION CONTEXT:\n" + "\n".join(context_parts)
 
+    # Without conversation context the prompt depends only on the question and the forms'
+    # data, so repeat questions spanning the same forms are answered from the cache (keyed
+    # by each form's ID, title, vendor info and a products fingerprint rather than the
+    # prompt text). Cached answers are generated at temperature 0, as above
+    cache_key = None
+    if not context_text:
+        forms_key = tuple(
+            (form_info.get('form_id'), form_info.get('form_title'),
+             prompt_vendor_key(form_info.get('vendor_info')), fingerprint(form_info.get('products', [])))
+            for form_info in forms_data
+        )
+        cache_key = ('multi_form', normalize_cache_text(user_question), forms_key)
+        cached_answer = answer_cache.get(cache_key)
+        if cached_answer is not None:
+            logger.debug("generate_answer_with_multi_form_context_async - Cache hit for: '%s'", user_question)
+            return cached_answer
+
+    forms_list_text, all_products_text = format_multi_form_products_for_prompt(forms_data)
+
     prompt = f"""You are Bohemia's Steward, a helpful assistant for a Group Buy community.
 
 IMPORTANT: The user's question may apply to MULTIPLE Group Buy forms.
@@ -1534,21 +2801,19 @@ GENERAL:
 - Keep responses SHORT and direct
 - Always clarify which form information comes from"""
 
-    print(f"[DEBUG] generate_answer_with_multi_form_context_async - Using {len(forms_data)} forms, context: {bool(conversation_context)}")
+    logger.debug("generate_answer_with_multi_form_context_async - Using %s forms, context: %s", len(forms_data), bool(conversation_context))
 
-    response = await call_openai_with_retry_async(
+    answer = (await complete_answer_async(
         "generate_answer_with_multi_form_context_async",
-        lambda timeout: client.chat.completions.create(
-            model="gpt-4o",
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.7,
-            timeout=timeout
-        )
-    )
-
-    answer = response.choices[0].message.content.strip()
-    print(f"[DEBUG] generate_answer_with_multi_form_context_async - Generated answer length: {len(answer)} chars")
-
+        client,
+        [{"role": "user", "content": prompt}],
+        temperature=0 if cache_key is not None else 0.7,
+        on_partial=on_partial
+    )).strip()
+    logger.debug("generate_answer_with_multi_form_context_async - Generated answer length: %s chars", len(answer))
+
+    if cache_key is not None:
+        answer_cache.set(cache_key, answer)
     return answer
 
 
@@ -1557,7 +2822,8 @@ def is_moq_question(message_text):
     Detect if user is asking about MOQ/minimum order for a specific product.
     Returns True if this appears to be a product-specific MOQ question.
     """
-    message_lower = message_text.lower()
+    msg = as_message_context(message_text)
+    message_lower = msg.lower
 
     # MOQ-related keywords
     moq_keywords = [
@@ -1571,7 +2837,7 @@ def is_moq_question(message_text):
     has_moq_keyword = any(keyword in message_lower for keyword in moq_keywords)
 
     if has_moq_keyword:
-        print(f"[DEBUG] is_moq_question - MOQ question detected in: '{message_text}'")
+        logger.debug("is_moq_question - MOQ question detected in: '%s'", msg.raw)
         return True
 
     return False
@@ -1582,20 +2848,11 @@ def check_for_coa_test_question(message_text):
     Detect if user is asking about COA, test results, or certificates of analysis.
     Returns True if this is a COA/test question that should be redirected to admins.
     """
-    message_lower = message_text.lower()
-
-    # Keywords that indicate COA/test questions
-    coa_keywords = [
-        'coa', 'certificate of analysis', 'test result', 'test report',
-        'lab test', 'lab result', 'testing', 'purity test', 'quality test',
-        'third party test', 'janoshik', 'jano test'
-    ]
-
-    # Check if message contains any COA-related keywords
-    for keyword in coa_keywords:
-        if keyword in message_lower:
-            print(f"[DEBUG] check_for_coa_test_question - COA/test question detected: keyword '{keyword}' found")
-            return True
+    # COA_KEYWORDS are matched by the shared routing scan of the message
+    coa_hits = as_message_context(message_text).keyword_hits.get(ROUTE_COA)
+    if coa_hits:
+        logger.debug("check_for_coa_test_question - COA/test question detected: keyword '%s' found", coa_hits[0][0])
+        return True
 
     return False
 
@@ -1603,89 +2860,167 @@ def get_admin_redirect_message():
     """
     Returns the standard message redirecting users to admins for COA/test questions.
     """
-    return """I don't have access to external links or vendor test reports. Please DM an admin:
-- @Emilycarolinemarch
-- @Davesauce
+    return ADMIN_REDIRECT_TEXT
+
+@dataclass(frozen=True)
+class ProductMatchKey:
+    """
+    Message-independent parts of fuzzy product matching, derived once per product.
+
+    - name: the product name as listed
+    - name_lower: lowercased name (exact-match check)
+    - numbers: digit runs in the name (dosages like "30")
+    - main_word: first word of the name (usually the compound, e.g. "retatrutide")
+    - prefixes: abbreviations of main_word checked as whole words ("r", "re", ... "retat")
+    - prefix_initial: first character of main_word when it is a word character, else None;
+      a prefix can only match where a message word starts with it
+    - variations: vowel-swapped spellings of main_word ("ritatrutide", ...), kept only
+      when longer than 3 characters since shorter ones never score
+    """
+    name: str
+    name_lower: str
+    numbers: tuple
+    main_word: str
+    prefixes: tuple
+    prefix_initial: str
+    variations: tuple
+
+
+def build_product_match_key(product_name):
+    """Precompute the ProductMatchKey for one product name."""
+    product_name_lower = product_name.lower()
+    product_words = product_name_lower.split()
+    main_word = product_words[0] if product_words else ''
+
+    # For "Retatrutide", match "Reta", "R", "Rita", "Retrograde"
+    prefixes = ()
+    if len(main_word) >= 4:
+        prefixes = tuple(main_word[:prefix_len] for prefix_len in (1, 2, 3, 4, 5) if prefix_len <= len(main_word))
+
+    # Common substitutions (l->r, etc.) - "Rita" for "Reta"
+    variations = tuple(
+        var for var in (
+            main_word.replace('e', 'i'),
+            main_word.replace('i', 'e'),
+            main_word.replace('o', 'a'),
+            main_word.replace('a', 'o'),
+        )
+        if len(var) > 3
+    )
+
+    return ProductMatchKey(
+        name=product_name,
+        name_lower=product_name_lower,
+        numbers=tuple(_DIGITS_RE.findall(product_name_lower)),
+        main_word=main_word,
+        prefixes=prefixes,
+        prefix_initial=main_word[0] if main_word and _WORD_RE.match(main_word[0]) else None,
+        variations=variations,
+    )
+
+
+class ProductCandidateIndex:
+    """
+    Finds the products of one form that can score above zero for a message, so only
+    those are fuzzy-scored. A product only scores when its main word or a vowel variant
+    appears in the message (an exact name match includes the main word), when all of its
+    dosage numbers appear, or when one of its abbreviations stands as a word - each of
+    those is looked up here instead of testing every product.
+    """
+
+    def __init__(self, keys):
+        self.keys = keys  # ProductMatchKey per product, in catalog order
+        self._by_number = {}  # first dosage number -> product positions
+        self._by_prefix = {}  # abbreviation -> product positions
+        automaton = KeywordAutomaton()  # main word and variants -> product position
+        for position, key in enumerate(keys):
+            if not key.main_word:
+                continue
+            if key.numbers:
+                self._by_number.setdefault(key.numbers[0], []).append(position)
+            for prefix in key.prefixes:
+                self._by_prefix.setdefault(prefix, []).append(position)
+            for word in {key.main_word, *key.variations}:
+                automaton.add(word, position)
+        self._automaton = automaton.build()
+
+    def candidates(self, message_text):
+        """Return the ProductMatchKeys that may match the message, in catalog order."""
+        msg = as_message_context(message_text)
+        positions = set()
+        for number in msg.digits:
+            positions.update(self._by_number.get(number, ()))
+        for abbreviation in msg.abbreviations:
+            positions.update(self._by_prefix.get(abbreviation, ()))
+        for _, _, position in self._automaton.iter(msg.lower):
+            positions.add(position)
+        return [self.keys[position] for position in sorted(positions)]
 
-Or post your question in the Telegram group for further support."""
 
 def fuzzy_match_product_name(message_lower, product_name_lower):
     """
     Fuzzy match product names to handle abbreviations and variations.
     Examples: 'Retatrutide 30' matches 'Reta 30', 'R30', 'Rita 30', etc.
-    """
-    # Extract key parts from product name (first significant word + numbers)
-    import re
 
-    # Get all numbers from the product name
-    product_numbers = re.findall(r'\d+', product_name_lower)
+    message_lower may be a lowercased message string or a MessageContext;
+    product_name_lower may be a product name or a precomputed ProductMatchKey.
+    """
+    msg = as_message_context(message_lower)
+    message_lower = msg.lower
+    if isinstance(product_name_lower, ProductMatchKey):
+        key = product_name_lower
+    else:
+        key = build_product_match_key(product_name_lower)
 
     # Get first word (usually the main product name)
-    product_words = product_name_lower.split()
-    if not product_words:
+    if not key.main_word:
         return 0
 
-    main_word = product_words[0]
-
     # Score the match
     score = 0
 
     # Check for exact match
-    if product_name_lower in message_lower:
+    if key.name_lower in message_lower:
         return 10  # Highest score
 
     # Check if numbers match (important for dosages like "30", "50", "100")
-    numbers_in_message = re.findall(r'\d+', message_lower)
-    if product_numbers and all(num in numbers_in_message for num in product_numbers):
+    numbers_in_message = msg.digits
+    if key.numbers and all(num in numbers_in_message for num in key.numbers):
         score += 3
 
-    # Check for abbreviation matches
-    # For "Retatrutide", match "Reta", "R", "Rita", "Retrograde"
-    if len(main_word) >= 4:
-        # Check for prefixes of various lengths
-        for prefix_len in [1, 2, 3, 4, 5]:
-            if prefix_len <= len(main_word):
-                prefix = main_word[:prefix_len]
-                # Match as whole word or followed by space/number
-                if re.search(r'\b' + re.escape(prefix) + r'(?:\s|\d|$)', message_lower):
-                    score += min(prefix_len, 3)  # Longer matches get higher scores
+    # Check for abbreviation matches (prefixes of various lengths), skipping the work
+    # entirely when no word in the message starts with the product's first letter
+    if key.prefixes and (key.prefix_initial is None or key.prefix_initial in msg.token_initials):
+        for prefix in key.prefixes:
+            if prefix not in message_lower:
+                break  # each longer prefix contains this one, so none of them can match
+            # Match as whole word or followed by space/number (the message's abbreviations
+            # are computed once and shared by every product scored against it)
+            if prefix in msg.abbreviations:
+                score += min(len(prefix), 3)  # Longer matches get higher scores
 
     # Check if the main word appears anywhere (fuzzy)
-    if main_word in message_lower:
+    if key.main_word in message_lower:
         score += 2
 
-    # Check for common substitutions (l->r, etc.)
-    # "Rita" for "Reta"
-    variations = [
-        main_word.replace('e', 'i'),
-        main_word.replace('i', 'e'),
-        main_word.replace('o', 'a'),
-        main_word.replace('a', 'o'),
-    ]
-    for var in variations:
-        if var in message_lower and len(var) > 3:
+    # Check for common substitutions ("Rita" for "Reta")
+    for var in key.variations:
+        if var in message_lower:
             score += 1
 
     return score
 
-def find_form_by_product_names(message_text, available_forms, return_all_matches=False):
+def score_forms_by_product_names(message_text, available_forms):
     """
-    Search through products in all forms to find which form contains
-    products mentioned in the user's message. Uses fuzzy matching for product names.
-
-    Args:
-        message_text: The user's message to search for product names
-        available_forms: Dictionary of available forms
-        return_all_matches: If True, returns all forms with matching products (not just the best)
+    Score every form by how well its products match the user's message.
 
-    Returns:
-        If return_all_matches=False: Single form_id string or None
-        If return_all_matches=True: List of form_ids with matches, sorted by score (best first)
+    Returns a dict of form_id -> {'score', 'best_product_score', 'products', 'title'}
+    containing only forms with at least one matching product.
     """
-    print(f"[DEBUG] find_form_by_product_names - Searching for products in message: '{message_text}'")
+    msg = as_message_context(message_text)
+    logger.debug("score_forms_by_product_names - Searching for products in message: '%s'", msg.raw)
 
-    message_lower = message_text.lower()
-    form_matches = {}  # form_id -> number of product matches
+    form_matches = {}  # form_id -> match details
 
     for form_id, form_data in available_forms.items():
         try:
@@ -1695,54 +3030,74 @@ def find_form_by_product_names(message_text, available_forms, return_all_matches
                 continue
 
             total_score = 0
+            best_product_score = 0
             matched_products = []
 
-            # Check if any product names appear in the user's message
-            for product in products:
-                product_name = product.get('name', '')
-                if not product_name or product_name == 'N/A':
-                    continue
-
-                product_name_lower = product_name.lower()
+            # Check if any product names appear in the user's message (only products
+            # the index says can match are scored; the rest would score 0)
+            for match_key in jotform_helper.get_product_index(form_id, products).candidates(msg):
+                product_name = match_key.name
 
                 # Use fuzzy matching
-                match_score = fuzzy_match_product_name(message_lower, product_name_lower)
+                match_score = fuzzy_match_product_name(msg, match_key)
 
                 if match_score > 0:
                     total_score += match_score
+                    best_product_score = max(best_product_score, match_score)
                     matched_products.append(product_name)
-                    print(f"[DEBUG] find_form_by_product_names - Match score {match_score}: '{product_name}' in form {form_id}")
+                    logger.debug("score_forms_by_product_names - Match score %s: '%s' in form %s", match_score, product_name, form_id)
 
             if total_score > 0:
                 form_matches[form_id] = {
                     'score': total_score,
+                    'best_product_score': best_product_score,
                     'products': matched_products,
                     'title': form_data.get('title')
                 }
-                print(f"[DEBUG] find_form_by_product_names - Form {form_id} ({form_data.get('title')}) has total score {total_score}")
+                logger.debug("score_forms_by_product_names - Form %s (%s) has total score %s", form_id, form_data.get('title'), total_score)
+
+        except Exception as e:
+            logger.debug("score_forms_by_product_names - Error checking form %s: %s", form_id, e)
+            continue
+
+    return form_matches
+
+
+def find_form_by_product_names(message_text, available_forms, return_all_matches=False, form_matches=None):
+    """
+    Search through products in all forms to find which form contains
+    products mentioned in the user's message. Uses fuzzy matching for product names.
+
+    Args:
+        message_text: The user's message to search for product names
+        available_forms: Dictionary of available forms
+        return_all_matches: If True, returns all forms with matching products (not just the best)
+        form_matches: Optional result of score_forms_by_product_names to reuse instead of rescoring
 
-        except Exception as e:
-            print(f"[DEBUG] find_form_by_product_names - Error checking form {form_id}: {e}")
-            continue
+    Returns:
+        If return_all_matches=False: Single form_id string or None
+        If return_all_matches=True: List of form_ids with matches, sorted by score (best first)
+    """
+    if form_matches is None:
+        form_matches = score_forms_by_product_names(message_text, available_forms)
 
     if not form_matches:
-        print(f"[DEBUG] find_form_by_product_names - No product matches found")
+        logger.debug("find_form_by_product_names - No product matches found")
         return [] if return_all_matches else None
 
-    # Sort matches by score (highest first)
-    sorted_matches = sorted(form_matches.items(), key=lambda x: x[1]['score'], reverse=True)
-
     if return_all_matches:
-        # Return all forms that have matching products
+        # Return all forms that have matching products, sorted by score (highest first)
+        sorted_matches = sorted(form_matches.items(), key=lambda x: x[1]['score'], reverse=True)
         form_ids = [form_id for form_id, _ in sorted_matches]
-        print(f"[DEBUG] find_form_by_product_names - Returning all {len(form_ids)} matching forms: {form_ids}")
+        logger.debug("find_form_by_product_names - Returning all %s matching forms: %s", len(form_ids), form_ids)
         return form_ids
     else:
-        # Return just the best match (original behavior)
-        best_match = sorted_matches[0]
+        # Return just the best match (original behavior) - a single max() pass, no full sort;
+        # ties resolve to the first form scored, as with the stable sort before
+        best_match = max(form_matches.items(), key=lambda x: x[1]['score'])
         form_id = best_match[0]
         match_info = best_match[1]
-        print(f"[DEBUG] find_form_by_product_names - Best match: {form_id} ({match_info['title']}) with products: {match_info['products']}")
+        logger.debug("find_form_by_product_names - Best match: %s (%s) with products: %s", form_id, match_info['title'], match_info['products'])
         return form_id
 
 def find_forms_by_month(month_name, available_forms):
@@ -1753,9 +3108,8 @@ def find_forms_by_month(month_name, available_forms):
     month_lower = month_name.lower()
     matching_forms = []
 
-    for form_id, form_data in available_forms.items():
-        title = form_data.get('title', '').lower()
-        if month_lower in title:
+    for form_id, _, title_lower in jotform_helper.get_form_titles(available_forms):
+        if month_lower in title_lower:
             matching_forms.append(form_id)
 
     return matching_forms
@@ -1766,27 +3120,16 @@ def detect_month_in_message(message_text):
     Detect if the user's message mentions a specific month.
     Returns the month name if found, None otherwise.
     """
-    months = [
-        'january', 'february', 'march', 'april', 'may', 'june',
-        'july', 'august', 'september', 'october', 'november', 'december',
-        'jan', 'feb', 'mar', 'apr', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'
-    ]
-
-    message_lower = message_text.lower()
+    message_lower = as_message_context(message_text).lower
 
-    for month in months:
-        # Check for month as a word boundary (not part of another word)
-        if re.search(rf'\b{month}\b', message_lower):
-            # Return the full month name
-            month_mapping = {
-                'jan': 'january', 'feb': 'february', 'mar': 'march',
-                'apr': 'april', 'jun': 'june', 'jul': 'july',
-                'aug': 'august', 'sep': 'september', 'oct': 'october',
-                'nov': 'november', 'dec': 'december'
-            }
-            return month_mapping.get(month, month)
+    # One pass for every month as a whole word (not part of another word)
+    mentioned = MONTH_MENTION_RE.findall(message_lower)
+    if not mentioned:
+        return None
 
-    return None
+    # Return the full month name
+    month = min(mentioned, key=MONTH_MENTION_ORDER.__getitem__)
+    return MONTH_ABBREVIATIONS.get(month, month)
 
 
 def is_form_specific_query(message_text):
@@ -1794,7 +3137,7 @@ def is_form_specific_query(message_text):
     Check if the user is explicitly asking about a specific form/GB.
     Returns True if the message mentions forms, GBs, months, or form-specific keywords.
     """
-    message_lower = message_text.lower()
+    message_lower = as_message_context(message_text).lower
 
     # Form-specific keywords
     form_keywords = [
@@ -1808,114 +3151,408 @@ def is_form_specific_query(message_text):
     return any(keyword in message_lower for keyword in form_keywords)
 
 
-def analyze_message_for_gb(message_text, available_forms):
+# Small, fast model for the form classifier - it only has to return one form ID.
+# Answer generation keeps using gpt-4o where response quality matters.
+OPENAI_ROUTER_MODEL = os.getenv('OPENAI_ROUTER_MODEL', 'gpt-4o-mini')
+# {"form_id": "253411113426040"} is ~12 tokens; a little headroom avoids truncated JSON
+ROUTER_MAX_TOKENS = 24
+
+# Fixed instructions for the ChatGPT form classifier. Kept byte-identical across calls
+# and placed before the forms listing so the prompt prefix is cacheable by OpenAI.
+FORM_SELECTION_INSTRUCTIONS = """You are helping identify which Group Buy (GB) form a user is asking about.
+The user's message is sent as the next message.
+
+Analyze the user's message and determine which form they're asking about:
+1. If they mention a specific month name (January, February, November, December, etc.), look for that month in the form title
+2. CRITICAL: If they ask about "current", "latest", "newest", or "most recent" GB, choose the FIRST form in the list (it has the most recent submission activity)
+3. If they mention a date, match it to the closest form by Latest Activity timestamp
+4. If they mention a vendor name, try to match it to a form title
+5. CRITICAL: If the user is asking about a PRODUCT (like "R30", "Retatrutide", "Tirz", etc.) and NOT mentioning a specific form, respond with "UNCLEAR" - the product should be searched across forms
+6. If the message is completely unclear or ambiguous, respond with "UNCLEAR"
+
+NOTE: Forms are sorted by latest submission date, NOT creation date. The first form is the most currently active GB.
+
+IMPORTANT: Respond with ONLY a JSON object of the form {"form_id": "<form ID>"}, using the form ID number (e.g., {"form_id": "253411113426040"}) or the word "UNCLEAR" (i.e., {"form_id": "UNCLEAR"}).
+Do not include any other text, explanation, or formatting."""
+
+# (forms_list, system_prompt) for the most recently built form-selection prompt
+_form_selection_prompt_cache = (None, None)
+
+
+def get_form_selection_system_prompt(forms_list):
+    """
+    Build the system prompt for the ChatGPT form classifier.
+    Rebuilt only when the forms listing changes (i.e. after a forms refresh).
+    """
+    global _form_selection_prompt_cache
+    cached_forms_list, cached_prompt = _form_selection_prompt_cache
+    if cached_forms_list == forms_list:
+        return cached_prompt
+
+    prompt = (
+        f"{FORM_SELECTION_INSTRUCTIONS}\n\n"
+        "Available forms (sorted by most recent submission activity - FIRST = most active/current):\n"
+        f"{forms_list}"
+    )
+    _form_selection_prompt_cache = (forms_list, prompt)
+    return prompt
+
+
+# Embedding-based form selection: cosine similarity between the message and each form
+# title; a top score at or above the threshold picks the form without a chat completion
+OPENAI_EMBEDDING_MODEL = os.getenv('OPENAI_EMBEDDING_MODEL', 'text-embedding-3-small')
+FORM_EMBEDDING_THRESHOLD = float(os.getenv('FORM_EMBEDDING_THRESHOLD', 0.55))
+
+# "Which GB is current" depends on submission activity, which titles don't encode,
+# so these queries skip the embedding match and go to ChatGPT with the sorted list
+# Matched as whole words ("currently" and "recently" describe something else)
+RECENCY_WORDS = frozenset(['current', 'latest', 'newest', 'recent'])
+RECENCY_PHRASE_RE = re.compile(r'\bthis month\b')
+
+# (form_id, title) -> title embedding. Submission activity doesn't change a title, so a
+# forms refresh only embeds new or renamed forms
+_form_title_vectors = {}
+_form_title_vectors_lock = threading.Lock()
+
+
+def _normalize_vector(vector):
+    """Scale a vector to unit length so a dot product is the cosine similarity."""
+    norm = sum(value * value for value in vector) ** 0.5
+    if not norm:
+        return vector
+    return [value / norm for value in vector]
+
+
+async def embed_texts(operation_name, texts):
+    """Embed texts with OpenAI and return unit-length vectors in input order."""
+    client = get_async_openai_client()
+    response = await call_openai_with_retry_async(
+        operation_name,
+        lambda timeout: client.embeddings.create(
+            model=OPENAI_EMBEDDING_MODEL,
+            input=texts,
+            timeout=timeout
+        )
+    )
+    return [_normalize_vector(item.embedding) for item in response.data]
+
+
+async def embed_message(message_text):
+    """Embed a message with OpenAI, reusing the vector for repeats of the same text."""
+    raw = as_message_context(message_text).raw
+    vector = message_embedding_cache.get(raw)
+    if vector is None:
+        vector = (await embed_texts("embed_message", [raw]))[0]
+        message_embedding_cache.set(raw, vector)
+    return vector
+
+
+async def get_form_title_embeddings(available_forms):
+    """
+    Get (form_ids, vectors) for the form titles. Each (form_id, title) pair is embedded
+    once; the embeddings request runs outside the lock so other analyses never wait on it.
+    """
+    form_ids = list(available_forms.keys())
+    keys = [(form_id, available_forms[form_id].get('title', '') or form_id) for form_id in form_ids]
+    with _form_title_vectors_lock:
+        vectors = {key: _form_title_vectors[key] for key in keys if key in _form_title_vectors}
+    missing = [key for key in keys if key not in vectors]
+    if missing:
+        logger.debug("get_form_title_embeddings - Embedding %s form titles", len(missing))
+        vectors.update(zip(missing, await embed_texts("embed_form_titles", [title for _, title in missing])))
+        with _form_title_vectors_lock:
+            # Keep only the current forms so removed or renamed ones don't pile up
+            _form_title_vectors.clear()
+            _form_title_vectors.update(vectors)
+    return form_ids, [vectors[key] for key in keys]
+
+
+async def find_form_by_embedding(message_text, available_forms):
+    """
+    Pick the form whose title is most similar to the message by embedding cosine similarity.
+    Returns the form_id when the best score reaches FORM_EMBEDDING_THRESHOLD, otherwise None.
+    Any OpenAI error returns None so the caller can fall back to ChatGPT.
+    """
+    msg = as_message_context(message_text)
+    if not available_forms or is_recency_query(msg):
+        return None
+
+    try:
+        form_ids, form_vectors = await get_form_title_embeddings(available_forms)
+        query_vector = await embed_message(msg)
+    except Exception as e:
+        log_error("find_form_by_embedding - Embedding lookup failed", e)
+        return None
+
+    best_form_id = None
+    best_score = 0.0
+    for form_id, form_vector in zip(form_ids, form_vectors):
+        score = sum(a * b for a, b in zip(query_vector, form_vector))
+        if score > best_score:
+            best_form_id, best_score = form_id, score
+
+    logger.debug("find_form_by_embedding - Best match %s with similarity %.3f", best_form_id, best_score)
+    if best_score >= FORM_EMBEDDING_THRESHOLD:
+        return best_form_id
+    return None
+
+
+def is_recency_query(message_text):
+    """Check if the user asks for the current/latest GB rather than a named one."""
+    msg = as_message_context(message_text)
+    return not RECENCY_WORDS.isdisjoint(msg.tokens) or RECENCY_PHRASE_RE.search(msg.lower) is not None
+
+
+def match_form_by_title_rules(message_text, available_forms):
+    """
+    Resolve a form without ChatGPT when the message makes it unambiguous:
+    - "current"/"latest"/"newest"/"recent"/"this month" -> the form with the most recent activity
+    - words that appear in exactly one form title -> that form (only if they all agree)
+    Returns a form_id or None.
+    """
+    if not available_forms:
+        return None
+    msg = as_message_context(message_text)
+
+    if is_recency_query(msg):
+        return jotform_helper.get_sorted_forms(available_forms)[0][0]
+
+    title_index = jotform_helper.get_title_token_index(available_forms)
+    matched_forms = {title_index[token] for token in msg.tokens if token in title_index}
+    if len(matched_forms) == 1:
+        return matched_forms.pop()
+    return None
+
+
+def parse_form_selection_response(raw_result):
+    """
+    Extract the form ID from the classifier's {"form_id": ...} JSON reply.
+    Falls back to the raw text (trimmed of quotes) if the reply isn't valid JSON.
+    """
+    try:
+        parsed = json.loads(raw_result)
+        if isinstance(parsed, dict) and parsed.get('form_id') is not None:
+            return str(parsed['form_id']).strip()
+    except ValueError:
+        pass
+    return raw_result.strip().strip('"')
+
+
+# Minimum single-product fuzzy score treated as an unambiguous product mention
+# (e.g. "reta 30" scores 6 against "Retatrutide 30mg"; exact names score 10)
+CONFIDENT_PRODUCT_MATCH_SCORE = 5
+
+
+async def analyze_message_for_gb(message_text, available_forms):
     """
     Analyze user message to determine which form(s) they're asking about.
+    Accepts a raw message string or a MessageContext.
 
     IMPORTANT: If the user appears to be asking about a PRODUCT (not a specific form),
     we search for the product across all forms FIRST. ChatGPT form selection is only
-    used when the user explicitly mentions a form/GB/month.
+    used when the user explicitly mentions a form/GB/month and neither the month nor
+    a confidently matched product already singles out one form.
 
     Returns:
         - A single form_id string if one form is clearly identified
         - A list of form_ids if multiple forms match (e.g., two January GBs)
         - None if no form could be identified
+
+    Results are memoized per (normalized message, forms catalog version), so repeat
+    questions skip the product scan and the ChatGPT call until the entry expires.
+    Identical messages analyzed at the same time (a burst of "what's the current GB?")
+    await the first one's task instead of each calling ChatGPT; waiting ties up no thread.
+    """
+    msg = as_message_context(message_text)
+    cache_key = (normalize_cache_text(msg), jotform_helper.get_forms_version(available_forms))
+    cached = gb_analysis_cache.get(cache_key, TTLCache.MISSING)
+    if cached is not TTLCache.MISSING:
+        logger.debug("analyze_message_for_gb - Cache hit: %s", cached)
+        return list(cached) if isinstance(cached, tuple) else cached
+
+    task = _gb_analysis_inflight.get(cache_key)
+    if task is None:
+        task = asyncio.ensure_future(_run_gb_analysis(cache_key, msg, available_forms))
+        _gb_analysis_inflight[cache_key] = task
+    else:
+        logger.debug("analyze_message_for_gb - Waiting for identical message already being analyzed")
+    # Shielded so a cancelled caller doesn't cancel the analysis others are waiting on
+    shared = await asyncio.shield(task)
+    return list(shared) if isinstance(shared, tuple) else shared
+
+
+async def _run_gb_analysis(cache_key, msg, available_forms):
+    """Compute and cache one form selection for analyze_message_for_gb (lists become tuples)."""
+    try:
+        result = await _analyze_message_for_gb_uncached(msg, available_forms)
+        shared = tuple(result) if isinstance(result, list) else result
+        gb_analysis_cache.set(cache_key, shared)
+        return shared
+    finally:
+        _gb_analysis_inflight.pop(cache_key, None)
+
+
+def _select_form_locally(msg, available_forms):
+    """
+    The form selection steps that need no OpenAI call (PRIORITY 1-4 of
+    analyze_message_for_gb). Product scoring may fetch products from JotForm, so this
+    runs on the JotForm executor. Returns (form selection or None, product scores).
     """
-    client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+    # Product scores are computed at most once and reused by every fallback below
+    product_scores = None
 
     # PRIORITY 1: If this looks like a product query (not form-specific),
     # search for the product across all forms FIRST
-    if not is_form_specific_query(message_text):
-        print(f"[DEBUG] analyze_message_for_gb - Message appears to be a product query, trying product search first")
-        product_matches = find_form_by_product_names(message_text, available_forms, return_all_matches=True)
+    if not is_form_specific_query(msg):
+        logger.debug("analyze_message_for_gb - Message appears to be a product query, trying product search first")
+        product_scores = score_forms_by_product_names(msg, available_forms)
+        product_matches = find_form_by_product_names(msg, available_forms, return_all_matches=True,
+                                                     form_matches=product_scores)
 
         if product_matches:
-            print(f"[DEBUG] analyze_message_for_gb - Product search found matches: {product_matches}")
-            return product_matches
+            logger.debug("analyze_message_for_gb - Product search found matches: %s", product_matches)
+            return product_matches, product_scores
         else:
-            print(f"[DEBUG] analyze_message_for_gb - No product matches, will try ChatGPT form identification")
+            logger.debug("analyze_message_for_gb - No product matches, will try ChatGPT form identification")
 
     # PRIORITY 2: Check if user mentions a specific month
-    mentioned_month = detect_month_in_message(message_text)
+    mentioned_month = detect_month_in_message(msg)
     if mentioned_month:
         # Find all forms matching this month
         matching_month_forms = find_forms_by_month(mentioned_month, available_forms)
-        print(f"[DEBUG] analyze_message_for_gb - User mentioned '{mentioned_month}', found {len(matching_month_forms)} matching forms")
+        logger.debug("analyze_message_for_gb - User mentioned '%s', found %s matching forms", mentioned_month, len(matching_month_forms))
 
         if len(matching_month_forms) > 1:
             # Multiple forms for this month - we'll need to check all of them
-            print(f"[DEBUG] analyze_message_for_gb - Multiple forms for {mentioned_month}: {matching_month_forms}")
-            return matching_month_forms
+            logger.debug("analyze_message_for_gb - Multiple forms for %s: %s", mentioned_month, matching_month_forms)
+            return matching_month_forms, product_scores
         elif len(matching_month_forms) == 1:
-            return matching_month_forms[0]
-
-    # PRIORITY 3: Use ChatGPT to identify the form (only for form-specific queries)
-    sorted_forms = sorted(
-        available_forms.items(),
-        key=lambda x: x[1].get('latest_submission', x[1].get('created', '')),
-        reverse=True
-    )
-
-    forms_list = "\n".join([
-        f"- {form_data['title']} (ID: {form_id}, Latest Activity: {form_data.get('latest_submission', 'Unknown')})"
-        for form_id, form_data in sorted_forms
-    ])
-
-    prompt = f"""You are helping identify which Group Buy (GB) form a user is asking about.
-
-Available forms (sorted by most recent submission activity - FIRST = most active/current):
-{forms_list}
+            return matching_month_forms[0], product_scores
+
+    # PRIORITY 3: Deterministic title rules - "current"/"latest" means the most active
+    # form (same rule the ChatGPT prompt applies), and a word found in exactly one
+    # form title (e.g. "halloween", a vendor name) names that form
+    rule_match = match_form_by_title_rules(msg, available_forms)
+    if rule_match:
+        logger.debug("analyze_message_for_gb - Title rule matched form %s, skipping ChatGPT", rule_match)
+        return rule_match, product_scores
+
+    # PRIORITY 4: A form-specific query that clearly names a product carried by
+    # exactly one form is already decided - skip the ChatGPT round-trip
+    if product_scores is None:
+        product_scores = score_forms_by_product_names(msg, available_forms)
+    confident_forms = [
+        form_id for form_id, match in product_scores.items()
+        if match['best_product_score'] >= CONFIDENT_PRODUCT_MATCH_SCORE
+    ]
+    if len(confident_forms) == 1:
+        logger.debug("analyze_message_for_gb - Product match uniquely identifies form %s, skipping ChatGPT", confident_forms[0])
+        return confident_forms[0], product_scores
 
-User message: "{message_text}"
+    return None, product_scores
 
-Analyze the user's message and determine which form they're asking about:
-1. If they mention a specific month name (January, February, November, December, etc.), look for that month in the form title
-2. CRITICAL: If they ask about "current", "latest", "newest", or "most recent" GB, choose the FIRST form in the list (it has the most recent submission activity)
-3. If they mention a date, match it to the closest form by Latest Activity timestamp
-4. If they mention a vendor name, try to match it to a form title
-5. CRITICAL: If the user is asking about a PRODUCT (like "R30", "Retatrutide", "Tirz", etc.) and NOT mentioning a specific form, respond with "UNCLEAR" - the product should be searched across forms
-6. If the message is completely unclear or ambiguous, respond with "UNCLEAR"
 
-NOTE: Forms are sorted by latest submission date, NOT creation date. The first form is the most currently active GB.
+async def _analyze_message_for_gb_uncached(msg, available_forms):
+    """
+    Form selection behind analyze_message_for_gb's cache; see that function for details.
+    The product/month/title checks may read JotForm and run on the JotForm executor;
+    the embedding and ChatGPT calls are awaited on the async OpenAI client.
+    """
+    result, product_scores = await run_jotform(_select_form_locally, msg, available_forms)
+    if result:
+        return result
 
-IMPORTANT: Respond with ONLY the form ID number (e.g., "253411113426040") or the word "UNCLEAR".
-Do not include any other text, explanation, or formatting."""
+    client = get_async_openai_client()
+    message_text = msg.raw
 
-    print(f"\n[DEBUG] User message: {message_text}")
-    print(f"[DEBUG] Available forms: {len(available_forms)}")
-    print(f"[DEBUG] Forms list sent to ChatGPT:\n{forms_list}\n")
+    # PRIORITY 5: Embedding similarity between the message and the form titles
+    # (one cheap embeddings call instead of a gpt-4o completion)
+    embedding_match = await find_form_by_embedding(msg, available_forms)
+    if embedding_match:
+        logger.debug("analyze_message_for_gb - Embedding match: %s, skipping ChatGPT", embedding_match)
+        return embedding_match
 
-    response = call_openai_with_retry(
+    # PRIORITY 6: Reuse the form ChatGPT picked for a near-identical earlier message
+    # that names the same numbers and months
+    months_named = frozenset(
+        MONTH_ABBREVIATIONS.get(month, month) for month in MONTH_MENTION_RE.findall(msg.lower)
+    )
+    choice_namespace = (jotform_helper.get_form_set_version(available_forms), msg.digits, months_named)
+    try:
+        query_vector = await embed_message(msg)
+    except Exception as e:
+        log_error("analyze_message_for_gb - Message embedding failed", e)
+        query_vector = None
+    if query_vector is not None:
+        remembered_form_id = form_choice_semantic_cache.get(choice_namespace, query_vector)
+        if remembered_form_id in available_forms:
+            logger.debug("analyze_message_for_gb - Similar message already resolved to %s, skipping ChatGPT", remembered_form_id)
+            return remembered_form_id
+
+    # PRIORITY 7: Use ChatGPT to identify the form (only for form-specific queries)
+    # Forms are sorted by latest activity; the listing is cached until the forms refresh
+    forms_list = jotform_helper.get_forms_list_text(available_forms)
+
+    system_prompt = get_form_selection_system_prompt(forms_list)
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("User message: %s", message_text)
+        logger.debug("Available forms: %s", len(available_forms))
+        logger.debug("Forms list sent to ChatGPT:\n%s", forms_list)
+
+    # Static instructions + forms listing go first so OpenAI's prefix prompt caching
+    # can reuse them; only the short user message changes between calls
+    response = await call_openai_with_retry_async(
         "analyze_message_for_gb",
         lambda timeout: client.chat.completions.create(
-            model="gpt-4o",
-            messages=[{"role": "user", "content": prompt}],
+            model=OPENAI_ROUTER_MODEL,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": message_text}
+            ],
             temperature=0,
+            max_tokens=ROUTER_MAX_TOKENS,
+            response_format={"type": "json_object"},
             timeout=timeout
         )
     )
 
-    result = response.choices[0].message.content.strip()
-    print(f"[DEBUG] ChatGPT raw response: '{result}'")
+    raw_result = response.choices[0].message.content.strip()
+    logger.debug("ChatGPT raw response: '%s'", raw_result)
+    result = parse_form_selection_response(raw_result)
 
     # Check if the result is a valid form ID
     if result != "UNCLEAR" and result in available_forms:
-        print(f"[DEBUG] ✓ Form ID '{result}' found in available forms")
+        logger.debug("✓ Form ID '%s' found in available forms", result)
+        if query_vector is not None:
+            form_choice_semantic_cache.set(choice_namespace, query_vector, result)
         return result
     elif result != "UNCLEAR":
-        print(f"[DEBUG] ✗ Form ID '{result}' NOT found in available forms")
-        print(f"[DEBUG] Available form IDs: {list(available_forms.keys())}")
+        logger.debug("✗ Form ID '%s' NOT found in available forms", result)
+        logger.debug("Available form IDs: %s", list(available_forms.keys()))
         # Try product-based search as fallback - return all matching forms
-        print(f"[DEBUG] Trying product-based search as fallback (returning all matches)...")
-        return find_form_by_product_names(message_text, available_forms, return_all_matches=True)
+        logger.debug("Trying product-based search as fallback (returning all matches)...")
+        return find_form_by_product_names(msg, available_forms, return_all_matches=True,
+                                          form_matches=product_scores)
     else:
-        print(f"[DEBUG] ChatGPT returned UNCLEAR, trying product-based search as fallback...")
+        logger.debug("ChatGPT returned UNCLEAR, trying product-based search as fallback...")
         # Try to find form by searching for product names in the message - return all matching forms
-        return find_form_by_product_names(message_text, available_forms, return_all_matches=True)
+        return find_form_by_product_names(msg, available_forms, return_all_matches=True,
+                                          form_matches=product_scores)
 
 # Initialize global JotFormHelper instance
 jotform_helper = JotFormHelper()
 
+# Shared pool for blocking JotForm lookups made from async handlers, sized separately from
+# asyncio's default executor so OpenAI work and JotForm calls don't starve each other
+jotform_executor = ThreadPoolExecutor(max_workers=JOTFORM_MAX_WORKERS, thread_name_prefix='jotform')
+
+
+async def run_jotform(fn, *args):
+    """Run a blocking JotFormHelper call on the shared JotForm executor."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(jotform_executor, fn, *args)
+
 # =============================================================================
 # BOT COMMAND HANDLERS
 # =============================================================================
@@ -1925,14 +3562,7 @@ async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
     user = update.effective_user
     await track_event(EVENT_COMMAND, user, {'command': 'start'})
 
-    await update.message.reply_text(
-        "Hello! I'm Bohemia's Steward, your Group Buy assistant.\n\n"
-        "I can help you with:\n"
-        "- Product information from current GBs\n"
-        "- Common questions (how to order, shipping, etc.)\n"
-        "- Finding the right Group Buy form\n\n"
-        "Just ask me a question, or use /help to see available commands!"
-    )
+    await update.message.reply_text(START_TEXT)
 
 async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Show available commands and how to use the bot."""
@@ -1940,129 +3570,94 @@ async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     await track_event(EVENT_COMMAND, user, {'command': 'help'})
     user_is_admin = await is_admin(user.id)
 
-    # Base help message for all users
-    help_text = (
-        "Available Commands:\n\n"
-        "General:\n"
-        "/start - Welcome message\n"
-        "/help - Show this message\n"
-        "/faq - Show frequently asked questions\n\n"
-        "Group Buy Info:\n"
-        "/currentgb - Show current GB details\n"
-        "/products - List products in current GB\n"
-        "/products <search> - Search products\n"
-        "/deadline - Show current GB deadline\n"
-        "/vendors - Show current GB vendors\n"
-        "/status - Show current GB status\n"
-        "/jotform - Get link to order form\n"
-        "/listforms - List available order forms\n\n"
-        "Order Support:\n"
-        "/getorderstatus - Look up your order status\n"
-        "/reportproblem - Report an issue with your order\n\n"
-    )
-
-    # Add admin commands only for admins
-    if user_is_admin:
-        help_text += (
-            "Admin Commands:\n"
-            "/setcurrentgb <id or name> - Set current GB\n"
-            "/clearcurrentgb - Clear GB setting\n"
-            "/setdeadline <date> - Set deadline\n"
-            "/cleardeadline - Clear deadline\n"
-            "/setvendors <names> - Set vendors\n"
-            "/clearvendors - Clear vendors\n"
-            "/setstatus <text> - Set status\n"
-            "/clearstatus - Clear status\n"
-            "/refresh - Refresh cached data\n"
-            "/addadmin - Add a bot admin\n"
-            "/removeadmin <id> - Remove an admin\n"
-            "/listadmins - List all admins\n"
-            "/listallforms - List all JotForm forms\n"
-            "/addformtolist <id> - Add form to public list\n"
-            "/removeformfromlist <id> - Remove form from list\n\n"
-        )
-
-    help_text += (
-        "Reminders:\n"
-        "/subscribe - Subscribe to deadline reminders\n"
-        "/unsubscribe - Unsubscribe from reminders\n\n"
-        "Or just ask me questions like:\n"
-        "- 'What's the price of Retatrutide?'\n"
-        "- 'How do I place an order?'"
-    )
-
-    # Add analytics command for admins
-    if user_is_admin:
-        help_text = help_text.replace(
-            "Reminders:",
-            "Analytics:\n"
-            "/analytics - View bot usage statistics\n"
-            "/broadcast <msg> - Send message to all subscribers\n\n"
-            "Reminders:"
-        )
-
-    await update.message.reply_text(help_text)
+    await update.message.reply_text(ADMIN_HELP_TEXT if user_is_admin else HELP_TEXT)
 
 async def faq_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Show list of FAQ topics."""
-    faq_topics = [
-        "- What is a Group Buy?",
-        "- How do I place an order?",
-        "- How do I pay?",
-        "- How long does shipping take?",
-        "- What if my package is seized?",
-        "- What's the refund policy?",
-        "- What's the minimum order?",
-        "- How do I contact an admin?",
-        "- What are the group rules?",
-        "- When is the next GB?"
-    ]
-    await update.message.reply_text(
-        "Frequently Asked Questions:\n\n" +
-        "\n".join(faq_topics) +
-        "\n\nJust ask me any of these questions for more details!"
-    )
+    await update.message.reply_text(FAQ_TOPICS_TEXT)
 
 async def refresh_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Admin command to refresh cached data."""
-    jotform_helper.clear_all_caches()
+    # Mark JotForm data stale rather than deleting it: each form is refetched in the
+    # background on its next use while users keep getting the current data
+    jotform_helper.mark_all_stale()
+    gb_analysis_cache.clear()
+    form_choice_semantic_cache.clear()
+    answer_cache.clear()
+    current_gb_cache.clear()
     await update.message.reply_text(
-        "Cache cleared! Fresh data will be fetched on the next request.\n"
+        "Cache refreshed! Each form is refetched in the background on its next use; "
+        "answers switch to the fresh data once it has loaded.\n"
         f"Cache TTL is set to {CACHE_TTL_SECONDS} seconds."
     )
 
+async def refreshform_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Admin command to refresh one form's cached products and metadata."""
+    user = update.effective_user
+
+    if not await is_admin(user.id):
+        await update.message.reply_text("Only admins can refresh form data.")
+        return
+
+    if not context.args:
+        await update.message.reply_text(
+            "Usage: /refreshform <form_id>\n\n"
+            "Use /listallforms to see form IDs."
+        )
+        return
+
+    form_id = context.args[0].strip()
+    jotform_helper.invalidate_form(form_id)
+    await update.message.reply_text(
+        f"Form {form_id} marked for refresh. Its data is refetched in the background on "
+        "the next request and used from then on."
+    )
+
 
 # =============================================================================
 # CURRENT GB HELPER FUNCTION
 # =============================================================================
 
-async def get_current_gb_form_id():
+# The manually set current GB (or None) as last read from the database. Almost every
+# command and message needs it; /setcurrentgb and /clearcurrentgb drop the entry, so
+# the TTL only bounds how long a change made outside this process goes unseen
+current_gb_cache = TTLCache(max_entries=1, ttl_seconds=CURRENT_GB_CACHE_SECONDS)
+
+
+async def get_manual_current_gb():
+    """Get the admin-set current GB form ID (None if not set), cached briefly."""
+    manual_gb = current_gb_cache.get('manual', TTLCache.MISSING)
+    if manual_gb is TTLCache.MISSING:
+        manual_gb = await get_current_gb()
+        current_gb_cache.set('manual', manual_gb)
+    return manual_gb
+
+
+async def get_current_gb_form_id(forms=None):
     """
     Get the current GB form ID.
     First checks if admin has manually set one, otherwise falls back to auto-detection.
+    Callers that already fetched the forms pass them in to skip another lookup.
     Returns tuple of (form_id, is_manual) where is_manual indicates if it was set by admin.
     """
     # Check if there's a manually set current GB
-    manual_gb = await get_current_gb()
+    manual_gb = await get_manual_current_gb()
     if manual_gb:
-        print(f"[DEBUG] get_current_gb_form_id - Using manually set GB: {manual_gb}")
+        logger.debug("get_current_gb_form_id - Using manually set GB: %s", manual_gb)
         return manual_gb, True
 
     # Fall back to auto-detection (most recent submission activity)
-    forms = jotform_helper.get_all_forms()
+    if forms is None:
+        forms = await run_jotform(jotform_helper.get_all_forms)
     if not forms:
         return None, False
 
     # Sort by latest submission date
-    sorted_forms = sorted(
-        forms.items(),
-        key=lambda x: x[1].get('latest_submission', x[1].get('created', '')),
-        reverse=True
-    )
+    sorted_forms = jotform_helper.get_sorted_forms(forms)
 
     if sorted_forms:
         form_id = sorted_forms[0][0]
-        print(f"[DEBUG] get_current_gb_form_id - Auto-detected current GB: {form_id}")
+        logger.debug("get_current_gb_form_id - Auto-detected current GB: %s", form_id)
         return form_id, False
 
     return None, False
@@ -2072,6 +3667,22 @@ async def get_current_gb_form_id():
 # PHASE 2 COMMANDS
 # =============================================================================
 
+@lru_cache(maxsize=8)
+def render_listforms_text(forms, current_gb_id):
+    """
+    Render the /listforms reply for ((form_id, form_title), ...) with the current GB marked.
+    A pure function of its arguments, so repeat calls with an unchanged list are one lookup.
+    """
+    lines = ["Available Order Forms:\n"]
+    for idx, (form_id, title) in enumerate(forms, 1):
+        marker = " [CURRENT]" if form_id == current_gb_id else ""
+        jotform_url = f"https://form.jotform.com/{form_id}"
+        lines.append(f"{idx}. {title}{marker}\n   {jotform_url}")
+
+    lines.append("\nClick a link to place your order!")
+    return "\n".join(lines)
+
+
 async def listforms_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """List forms from the curated list (open GBs managed by admins)."""
     try:
@@ -2088,19 +3699,11 @@ async def listforms_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         # Get current GB to mark it
         current_gb_id, is_manual = await get_current_gb_form_id()
 
-        lines = ["Available Order Forms:\n"]
-        for idx, form in enumerate(forms_list, 1):
-            form_id = form['form_id']
-            title = form['form_title']
-            marker = " [CURRENT]" if form_id == current_gb_id else ""
-            jotform_url = f"https://form.jotform.com/{form_id}"
-            lines.append(f"{idx}. {title}{marker}\n   {jotform_url}")
-
-        lines.append("\nClick a link to place your order!")
-        await update.message.reply_text("\n".join(lines))
+        forms = tuple((form['form_id'], form['form_title']) for form in forms_list)
+        await update.message.reply_text(render_listforms_text(forms, current_gb_id))
 
     except Exception as e:
-        print(f"[ERROR] listforms_command: {e}")
+        logger.error("listforms_command: %s", e)
         await update.message.reply_text("Error retrieving forms. Please try again.")
 
 
@@ -2121,7 +3724,7 @@ async def setcurrentgb_command(update: Update, context: ContextTypes.DEFAULT_TYP
         return
 
     search_term = " ".join(context.args)
-    forms = jotform_helper.get_all_forms()
+    forms = await run_jotform(jotform_helper.get_all_forms)
 
     # Try to find the form
     found_form_id = None
@@ -2133,13 +3736,7 @@ async def setcurrentgb_command(update: Update, context: ContextTypes.DEFAULT_TYP
         found_form_title = forms[search_term].get('title', 'Unknown')
     else:
         # Search by title (case-insensitive)
-        search_lower = search_term.lower()
-        for form_id, form_data in forms.items():
-            title = form_data.get('title', '').lower()
-            if search_lower in title:
-                found_form_id = form_id
-                found_form_title = form_data.get('title', 'Unknown')
-                break
+        found_form_id, found_form_title = jotform_helper.find_form_by_title(search_term, forms)
 
     if found_form_id:
         # Save to database
@@ -2148,6 +3745,7 @@ async def setcurrentgb_command(update: Update, context: ContextTypes.DEFAULT_TYP
             user_id=user.id,
             username=user.username or user.first_name
         )
+        current_gb_cache.clear()
         await update.message.reply_text(
             f"Current GB set to:\n"
             f"{found_form_title}\n"
@@ -2164,6 +3762,7 @@ async def setcurrentgb_command(update: Update, context: ContextTypes.DEFAULT_TYP
 async def clearcurrentgb_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Admin command to clear the manual current GB setting."""
     await clear_current_gb()
+    current_gb_cache.clear()
     await update.message.reply_text(
         "Current GB setting cleared.\n"
         "The bot will now auto-detect the current GB based on latest submission activity."
@@ -2173,7 +3772,8 @@ async def clearcurrentgb_command(update: Update, context: ContextTypes.DEFAULT_T
 async def currentgb_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Show information about the current Group Buy."""
     try:
-        form_id, _ = await get_current_gb_form_id()
+        forms = await run_jotform(jotform_helper.get_all_forms)
+        form_id, _ = await get_current_gb_form_id(forms)
 
         if not form_id:
             await update.message.reply_text(
@@ -2182,7 +3782,6 @@ async def currentgb_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
             return
 
         # Get form info
-        forms = jotform_helper.get_all_forms()
         form_data = forms.get(form_id, {})
         form_title = form_data.get('title', 'Unknown')
 
@@ -2191,7 +3790,7 @@ async def currentgb_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         vendors = await get_vendors() or "Not set"
 
         # Get product count
-        products = jotform_helper.get_products(form_id)
+        products = await run_jotform(jotform_helper.get_products, form_id)
         product_count = len(products) if products else 0
 
         response = (
@@ -2205,10 +3804,41 @@ async def currentgb_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         await update.message.reply_text(response)
 
     except Exception as e:
-        print(f"[ERROR] currentgb_command: {e}")
+        logger.error("currentgb_command: %s", e)
         await update.message.reply_text("Error retrieving current GB info. Please try again.")
 
 
+# Telegram rejects messages longer than this many characters
+TELEGRAM_MESSAGE_MAX_LENGTH = 4096
+
+
+def split_message_lines(lines, max_length=TELEGRAM_MESSAGE_MAX_LENGTH):
+    """
+    Join lines with newlines into as few messages as possible, each at most max_length
+    characters, breaking only between lines (a single over-long line is cut).
+    """
+    chunks = []
+    current = []
+    current_length = 0
+    for line in lines:
+        while len(line) > max_length:
+            if current:
+                chunks.append("\n".join(current))
+                current, current_length = [], 0
+            chunks.append(line[:max_length])
+            line = line[max_length:]
+        added_length = len(line) + (1 if current else 0)
+        if current and current_length + added_length > max_length:
+            chunks.append("\n".join(current))
+            current, current_length = [], 0
+            added_length = len(line)
+        current.append(line)
+        current_length += added_length
+    if current:
+        chunks.append("\n".join(current))
+    return chunks
+
+
 async def products_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """List all products in the current Group Buy."""
     try:
@@ -2224,7 +3854,7 @@ async def products_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
             return
 
         # Get products
-        products = jotform_helper.get_products(form_id)
+        products = await run_jotform(jotform_helper.get_products, form_id)
 
         if not products:
             await update.message.reply_text("No products found for the current GB.")
@@ -2232,10 +3862,10 @@ async def products_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
         # Filter products if search term provided
         if search_filter:
-            filtered_products = [
-                p for p in products
-                if search_filter in p.get('name', '').lower()
-            ]
+            filtered_products = jotform_helper.search_products(form_id, search_filter, products)
+            if not filtered_products:
+                # Nothing contains the term as typed - allow for typos and word order
+                filtered_products = jotform_helper.fuzzy_search_products(form_id, search_filter, products)
             if not filtered_products:
                 await update.message.reply_text(
                     f"No products matching '{search_filter}' found.\n"
@@ -2252,22 +3882,19 @@ async def products_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
             price = product.get('price', 'N/A')
             lines.append(f"{idx}. {name} - ${price}")
 
-            # Stop if message gets too long (Telegram limit ~4096 chars)
-            if len("\n".join(lines)) > 3200:
-                lines.append(f"\n... and {len(products) - idx} more products.")
-                lines.append("Use /products <search> to filter (e.g., /products reta)")
-                break
-
         if search_filter:
             lines.append(f"\nShowing {len(products)} products matching '{search_filter}'")
 
         # Add helpful footer
         lines.append("\nUse /jotform to place an order, or ask me about specific products for details on MOQ, testing, and more!")
 
-        await update.message.reply_text("\n".join(lines))
+        # Long lists go out as several messages (Telegram's limit is 4096 chars)
+        # instead of being cut off
+        for chunk in split_message_lines(lines):
+            await update.message.reply_text(chunk)
 
     except Exception as e:
-        print(f"[ERROR] products_command: {e}")
+        logger.error("products_command: %s", e)
         await update.message.reply_text("Error retrieving products. Please try again.")
 
 
@@ -2295,7 +3922,7 @@ async def deadline_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
             )
 
     except Exception as e:
-        print(f"[ERROR] deadline_command: {e}")
+        logger.error("deadline_command: %s", e)
         await update.message.reply_text("Error retrieving deadline. Please try again.")
 
 
@@ -2347,7 +3974,8 @@ async def cleardeadline_command(update: Update, context: ContextTypes.DEFAULT_TY
 async def vendors_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Show the vendors for the current Group Buy."""
     try:
-        form_id, _ = await get_current_gb_form_id()
+        forms = await run_jotform(jotform_helper.get_all_forms)
+        form_id, _ = await get_current_gb_form_id(forms)
 
         if not form_id:
             await update.message.reply_text(
@@ -2356,7 +3984,6 @@ async def vendors_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
             return
 
         # Get form info
-        forms = jotform_helper.get_all_forms()
         form_title = forms.get(form_id, {}).get('title', 'the current GB')
 
         # Check database for manually set vendors
@@ -2375,7 +4002,7 @@ async def vendors_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
             )
 
     except Exception as e:
-        print(f"[ERROR] vendors_command: {e}")
+        logger.error("vendors_command: %s", e)
         await update.message.reply_text("Error retrieving vendors. Please try again.")
 
 
@@ -2448,7 +4075,7 @@ async def status_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
             )
 
     except Exception as e:
-        print(f"[ERROR] status_command: {e}")
+        logger.error("status_command: %s", e)
         await update.message.reply_text("Error retrieving status. Please try again.")
 
 
@@ -2500,7 +4127,8 @@ async def clearstatus_command(update: Update, context: ContextTypes.DEFAULT_TYPE
 async def jotform_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Show the JotForm link for the current Group Buy."""
     try:
-        form_id, is_manual = await get_current_gb_form_id()
+        forms = await run_jotform(jotform_helper.get_all_forms)
+        form_id, is_manual = await get_current_gb_form_id(forms)
 
         if not form_id:
             await update.message.reply_text(
@@ -2509,7 +4137,6 @@ async def jotform_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
             return
 
         # Get form info
-        forms = jotform_helper.get_all_forms()
         form_title = forms.get(form_id, {}).get('title', 'Current GB')
 
         # JotForm URLs follow this pattern
@@ -2522,7 +4149,7 @@ async def jotform_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         )
 
     except Exception as e:
-        print(f"[ERROR] jotform_command: {e}")
+        logger.error("jotform_command: %s", e)
         await update.message.reply_text("Error retrieving form link. Please try again.")
 
 
@@ -2538,9 +4165,9 @@ async def getorderstatus_command(update: Update, context: ContextTypes.DEFAULT_T
 
         if not forms_list:
             # Fallback to all forms if no curated list
-            all_forms = jotform_helper.get_all_forms()
-            forms_list = [{'form_id': fid, 'form_title': fdata.get('title', 'Unknown')}
-                          for fid, fdata in all_forms.items()]
+            all_forms = await run_jotform(jotform_helper.get_all_forms)
+            forms_list = [{'form_id': fid, 'form_title': title}
+                          for fid, title, _ in jotform_helper.get_form_titles(all_forms)]
 
         if not forms_list:
             await update.message.reply_text(
@@ -2572,7 +4199,7 @@ async def getorderstatus_command(update: Update, context: ContextTypes.DEFAULT_T
         return STATUS_WAITING_FORM
 
     except Exception as e:
-        print(f"[ERROR] getorderstatus_command: {e}")
+        logger.error("getorderstatus_command: %s", e)
         await update.message.reply_text(
             "I encountered an error. Please try again later or "
             f"DM @{ADMIN_USERNAME} for assistance."
@@ -2593,7 +4220,7 @@ async def status_form_selected(update: Update, context: ContextTypes.DEFAULT_TYP
     form_id = query.data.replace("status_form_", "")
 
     # Get form title
-    forms = jotform_helper.get_all_forms()
+    forms = await run_jotform(jotform_helper.get_all_forms)
     form_title = forms.get(form_id, {}).get('title', 'Selected Group Buy')
 
     # Store in user context
@@ -2628,7 +4255,7 @@ async def status_receive_identifier(update: Update, context: ContextTypes.DEFAUL
 
     try:
         # Search for the submission
-        result = jotform_helper.search_submission_in_form(form_id, search_value, form_title)
+        result = await run_jotform(jotform_helper.search_submission_in_form, form_id, search_value, form_title)
 
         if result and result.get('found'):
             # Format the order display (plain text to avoid HTML parse errors)
@@ -2645,7 +4272,7 @@ async def status_receive_identifier(update: Update, context: ContextTypes.DEFAUL
             )
 
     except Exception as e:
-        print(f"[ERROR] status_receive_identifier: {e}")
+        logger.error("status_receive_identifier: %s", e)
         await update.message.reply_text(
             "I encountered an error while looking up your order.\n"
             f"Please try again later or DM @{ADMIN_USERNAME} for assistance."
@@ -2709,8 +4336,7 @@ def format_order_display(order_data):
         for i, product in enumerate(products, 1):
             name = str(product.get('name', 'Unknown Item'))
             # Strip any HTML tags from name
-            import re
-            name = re.sub(r'<[^>]+>', '', name)
+            name = HTML_TAG_RE.sub('', name)
 
             quantity = str(product.get('quantity', ''))
             price = str(product.get('price', ''))
@@ -2828,7 +4454,7 @@ async def submit_problem_report(update: Update, context: ContextTypes.DEFAULT_TY
     order_details = ""
     try:
         # Search for the order across all forms
-        result = jotform_helper.search_submission_by_invoice(invoice_id)
+        result = await run_jotform(jotform_helper.search_submission_by_invoice, invoice_id)
         if result and result.get('found'):
             order_details = (
                 f"\n📦 ORDER DETAILS FOUND:\n"
@@ -2840,15 +4466,14 @@ async def submit_problem_report(update: Update, context: ContextTypes.DEFAULT_TY
             if products:
                 order_details += "Products:\n"
                 for p in products[:5]:  # Limit to 5 products
-                    import re
-                    name = re.sub(r'<[^>]+>', '', str(p.get('name', 'Unknown')))
+                    name = HTML_TAG_RE.sub('', str(p.get('name', 'Unknown')))
                     qty = p.get('quantity', '')
                     order_details += f"  - {name}"
                     if qty:
                         order_details += f" (x{qty})"
                     order_details += "\n"
     except Exception as e:
-        print(f"[DEBUG] submit_problem_report - Could not look up order: {e}")
+        logger.debug("submit_problem_report - Could not look up order: %s", e)
         order_details = "\n⚠️ Could not look up order details automatically.\n"
 
     # Format the report message
@@ -2883,9 +4508,9 @@ async def submit_problem_report(update: Update, context: ContextTypes.DEFAULT_TY
                 )
             sent_count += 1
             admin_notified = True
-            print(f"[DEBUG] submit_problem_report - Sent to ADMIN_CHAT_ID: {ADMIN_CHAT_ID}")
+            logger.debug("submit_problem_report - Sent to ADMIN_CHAT_ID: %s", ADMIN_CHAT_ID)
         except Exception as e:
-            print(f"[ERROR] submit_problem_report - Failed to send to ADMIN_CHAT_ID: {e}")
+            logger.error("submit_problem_report - Failed to send to ADMIN_CHAT_ID: %s", e)
 
     # Also send to all registered admins
     try:
@@ -2908,15 +4533,15 @@ async def submit_problem_report(update: Update, context: ContextTypes.DEFAULT_TY
                     )
                 sent_count += 1
                 admin_notified = True
-                print(f"[DEBUG] submit_problem_report - Sent to admin: {admin_id}")
+                logger.debug("submit_problem_report - Sent to admin: %s", admin_id)
             except Exception as e:
-                print(f"[DEBUG] submit_problem_report - Failed to send to admin {admin_id}: {e}")
+                logger.debug("submit_problem_report - Failed to send to admin %s: %s", admin_id, e)
     except Exception as e:
-        print(f"[ERROR] submit_problem_report - Failed to get admins: {e}")
+        logger.error("submit_problem_report - Failed to get admins: %s", e)
 
     # Log if no admins were notified
     if not admin_notified:
-        print(f"[WARNING] submit_problem_report - No admins were notified! Check ADMIN_CHAT_ID or add admins with /addadmin")
+        logger.warning("submit_problem_report - No admins were notified! Check ADMIN_CHAT_ID or add admins with /addadmin")
 
     # Store the report in the database for record keeping
     try:
@@ -2932,7 +4557,7 @@ async def submit_problem_report(update: Update, context: ContextTypes.DEFAULT_TY
             username=user.username
         )
     except Exception as e:
-        print(f"[ERROR] submit_problem_report - Failed to log event: {e}")
+        logger.error("submit_problem_report - Failed to log event: %s", e)
 
     # Send confirmation to user
     confirmation_msg = (
@@ -2982,7 +4607,7 @@ def check_out_of_scope_request(message_text):
     Check if the user's message is asking for something outside the bot's scope.
     Returns a tuple of (is_out_of_scope, response_message).
     """
-    message_lower = message_text.lower()
+    message_lower = as_message_context(message_text).lower
 
     # Pricing change requests
     pricing_keywords = [
@@ -3169,7 +4794,7 @@ async def addformtolist_command(update: Update, context: ContextTypes.DEFAULT_TY
         return
 
     search_term = " ".join(context.args)
-    forms = jotform_helper.get_all_forms()
+    forms = await run_jotform(jotform_helper.get_all_forms)
 
     # Try to find the form
     found_form_id = None
@@ -3181,13 +4806,7 @@ async def addformtolist_command(update: Update, context: ContextTypes.DEFAULT_TY
         found_form_title = forms[search_term].get('title', 'Unknown')
     else:
         # Search by title (case-insensitive)
-        search_lower = search_term.lower()
-        for form_id, form_data in forms.items():
-            title = form_data.get('title', '').lower()
-            if search_lower in title:
-                found_form_id = form_id
-                found_form_title = form_data.get('title', 'Unknown')
-                break
+        found_form_id, found_form_title = jotform_helper.find_form_by_title(search_term, forms)
 
     if found_form_id:
         # Check if already in list
@@ -3285,24 +4904,20 @@ async def listallforms_command(update: Update, context: ContextTypes.DEFAULT_TYP
         return
 
     try:
-        forms = jotform_helper.get_all_forms()
+        forms = await run_jotform(jotform_helper.get_all_forms)
         if not forms:
             await update.message.reply_text("No forms found in JotForm.")
             return
 
         # Sort by latest submission date
-        sorted_forms = sorted(
-            forms.items(),
-            key=lambda x: x[1].get('latest_submission', x[1].get('created', '')),
-            reverse=True
-        )
+        sorted_forms = jotform_helper.get_sorted_forms(forms)
 
         # Get current forms list to mark which are already added
         forms_list = await get_forms_list()
         forms_in_list = {f['form_id'] for f in forms_list}
 
         # Get current GB to mark it
-        current_gb_id, is_manual = await get_current_gb_form_id()
+        current_gb_id, is_manual = await get_current_gb_form_id(forms)
 
         lines = ["All JotForm Forms:\n"]
         for idx, (form_id, form_data) in enumerate(sorted_forms, 1):
@@ -3319,7 +4934,7 @@ async def listallforms_command(update: Update, context: ContextTypes.DEFAULT_TYP
         await update.message.reply_text("\n".join(lines))
 
     except Exception as e:
-        print(f"[ERROR] listallforms_command: {e}")
+        logger.error("listallforms_command: %s", e)
         await update.message.reply_text("Error retrieving forms. Please try again.")
 
 
@@ -3373,7 +4988,7 @@ async def analytics_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         await update.message.reply_text("\n".join(lines))
 
     except Exception as e:
-        print(f"[ERROR] analytics_command: {e}")
+        logger.error("analytics_command: %s", e)
         await update.message.reply_text("Error retrieving analytics. Please try again.")
 
 
@@ -3407,7 +5022,7 @@ async def subscribe_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         )
 
     except Exception as e:
-        print(f"[ERROR] subscribe_command: {e}")
+        logger.error("subscribe_command: %s", e)
         await update.message.reply_text("Error subscribing. Please try again.")
 
 
@@ -3435,7 +5050,7 @@ async def unsubscribe_command(update: Update, context: ContextTypes.DEFAULT_TYPE
         )
 
     except Exception as e:
-        print(f"[ERROR] unsubscribe_command: {e}")
+        logger.error("unsubscribe_command: %s", e)
         await update.message.reply_text("Error unsubscribing. Please try again.")
 
 
@@ -3495,7 +5110,7 @@ async def broadcast_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
                 )
                 sent_count += 1
             except Exception as e:
-                print(f"[DEBUG] broadcast_command - Failed to send to {subscriber['user_id']}: {e}")
+                logger.debug("broadcast_command - Failed to send to %s: %s", subscriber['user_id'], e)
                 failed_count += 1
 
         # Log the broadcast
@@ -3508,7 +5123,7 @@ async def broadcast_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         )
 
     except Exception as e:
-        print(f"[ERROR] broadcast_command: {e}")
+        logger.error("broadcast_command: %s", e)
         await update.message.reply_text("Error sending broadcast. Please try again.")
 
 
@@ -3529,7 +5144,8 @@ async def sendreminder_command(update: Update, context: ContextTypes.DEFAULT_TYP
 
     try:
         # Get current GB and deadline
-        form_id, _ = await get_current_gb_form_id()
+        forms = await run_jotform(jotform_helper.get_all_forms)
+        form_id, _ = await get_current_gb_form_id(forms)
         deadline = await get_deadline()
 
         if not form_id:
@@ -3545,7 +5161,6 @@ async def sendreminder_command(update: Update, context: ContextTypes.DEFAULT_TYP
             return
 
         # Get form info
-        forms = jotform_helper.get_all_forms()
         form_title = forms.get(form_id, {}).get('title', 'Current GB')
 
         # Build reminder message
@@ -3581,7 +5196,7 @@ async def sendreminder_command(update: Update, context: ContextTypes.DEFAULT_TYP
                 )
                 sent_count += 1
             except Exception as e:
-                print(f"[DEBUG] sendreminder_command - Failed to send to {subscriber['user_id']}: {e}")
+                logger.debug("sendreminder_command - Failed to send to %s: %s", subscriber['user_id'], e)
                 failed_count += 1
 
         # Log the reminder
@@ -3594,7 +5209,7 @@ async def sendreminder_command(update: Update, context: ContextTypes.DEFAULT_TYP
         )
 
     except Exception as e:
-        print(f"[ERROR] sendreminder_command: {e}")
+        logger.error("sendreminder_command: %s", e)
         await update.message.reply_text("Error sending reminder. Please try again.")
 
 
@@ -3613,7 +5228,7 @@ async def conversation_timeout(update: Update, context: ContextTypes.DEFAULT_TYP
                      "Please start again with the appropriate command."
             )
         except Exception as e:
-            print(f"[DEBUG] conversation_timeout - Failed to send timeout message: {e}")
+            logger.debug("conversation_timeout - Failed to send timeout message: %s", e)
 
     # Clear conversation handler data but preserve general conversation context
     if context and context.user_data:
@@ -3629,19 +5244,179 @@ async def conversation_timeout(update: Update, context: ContextTypes.DEFAULT_TYP
     return ConversationHandler.END
 
 
+# Strong references to fire-and-forget tasks so they aren't garbage collected mid-run
+_background_tasks = set()
+
+
+def spawn_background_task(coro):
+    """Run a coroutine in the background without awaiting it."""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+
+async def fetch_form_details(form_id):
+    """Fetch a form's products and metadata in parallel. Returns (form_id, products, vendor_info)."""
+    products, vendor_info = await asyncio.gather(
+        run_jotform(jotform_helper.get_products, form_id),
+        run_jotform(jotform_helper.get_form_metadata, form_id)
+    )
+    return form_id, products, vendor_info
+
+
+async def prefetch_current_gb_details():
+    """Warm the products/metadata caches of the current GB form; errors are only logged."""
+    try:
+        form_id, _ = await get_current_gb_form_id()
+        if form_id:
+            await fetch_form_details(form_id)
+    except Exception as e:
+        logger.debug("prefetch_current_gb_details - Prefetch failed: %s", e)
+
+
+async def prefetch_hot_products_job(context: ContextTypes.DEFAULT_TYPE):
+    """JobQueue callback: refresh busy forms' products in the background before they expire."""
+    queued = jotform_helper.prefetch_hot_products()
+    if queued:
+        logger.debug("prefetch_hot_products_job - Queued %s product refreshes", queued)
+
+
+async def send_typing_action(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Show the "typing..." indicator; failures are logged and never interrupt the reply."""
+    try:
+        await context.bot.send_chat_action(chat_id=update.effective_chat.id, action=ChatAction.TYPING)
+    except Exception as e:
+        logger.debug("send_typing_action - Could not send typing action: %s", e)
+
+
+# Streamed answers: the first text is sent as soon as it arrives and the message is then
+# edited as more comes in. An edit waits for STREAM_EDIT_MIN_CHARS new characters and the
+# current interval, which starts at STREAM_EDIT_MIN_INTERVAL seconds and grows by half
+# after every edit (up to the max) so long answers cost only a few edits.
+# The edits run in their own task, so a rate-limited edit never holds up the OpenAI
+# stream (or its concurrency slot). Group chats get a single final message instead,
+# since Telegram allows only ~20 messages per minute there.
+STREAM_EDIT_MIN_CHARS = 24
+STREAM_EDIT_MIN_INTERVAL = 0.8
+STREAM_EDIT_MAX_INTERVAL = 3.0
+STREAM_INCOMPLETE_NOTE = "\n\n⚠️ This answer was cut off—please ask again for the full reply."
+
+
+class StreamingReply:
+    """Progressively shows a streamed answer as one Telegram reply that is edited in place."""
+
+    def __init__(self, message, live=True):
+        self._message = message  # the user's message being answered
+        self._live = live  # False: send only the final answer
+        self._reply = None  # our reply, once sent
+        self._pending = ''  # latest text received from the stream
+        self._shown = ''
+        self._last_edit = 0.0
+        self._interval = STREAM_EDIT_MIN_INTERVAL
+        self._wake = asyncio.Event()
+        self._closed = asyncio.Event()
+        self._task = None
+        self._finished = False
+
+    def update(self, text):
+        """Record partial text; the edit task shows it when the edit throttle allows."""
+        self._pending = text
+        if not self._live:
+            return
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        self._wake.set()
+
+    async def finish(self, text):
+        """
+        Show the complete answer: edit it into the reply, or send it if nothing was shown
+        yet. Answers over Telegram's limit continue in further messages. If the final
+        edit fails the answer is sent again as new messages; send errors propagate so
+        the caller's error reply still runs.
+        """
+        await self._stop()
+        if not text.strip():
+            raise ExternalServiceError("Streamed answer was empty")
+        chunks = split_message_lines(text.split('\n'))
+        if self._reply is not None:
+            first, rest = chunks[0], chunks[1:]
+            try:
+                if first != self._shown:
+                    await self._reply.edit_text(first)
+                    self._shown = first
+                chunks = rest
+            except Exception as e:
+                logger.warning("StreamingReply - Could not edit in the final answer, sending it instead: %s", e)
+        for chunk in chunks:
+            await self._message.reply_text(chunk)
+        self._finished = True
+
+    async def abort(self):
+        """
+        Mark a partly shown answer as cut off after a failure. Returns False when nothing
+        was shown or the answer was already complete, so the caller sends its own error message.
+        """
+        await self._stop()
+        if self._reply is None or self._finished:
+            return False
+        text = (self._pending or self._shown)[:TELEGRAM_MESSAGE_MAX_LENGTH - len(STREAM_INCOMPLETE_NOTE)]
+        return await self._show(text + STREAM_INCOMPLETE_NOTE)
+
+    async def _stop(self):
+        self._closed.set()
+        self._wake.set()
+        if self._task is not None:
+            await self._task
+
+    async def _run(self):
+        while True:
+            await self._wake.wait()
+            self._wake.clear()
+            if self._closed.is_set():
+                return
+            if len(self._pending) > TELEGRAM_MESSAGE_MAX_LENGTH:
+                return  # too long for one message; finish() sends the rest
+            if self._reply is not None:
+                if len(self._pending) - len(self._shown) < STREAM_EDIT_MIN_CHARS:
+                    continue
+                wait = self._interval - (time.monotonic() - self._last_edit)
+                if wait > 0:
+                    try:
+                        await asyncio.wait_for(self._closed.wait(), timeout=wait)
+                        return
+                    except asyncio.TimeoutError:
+                        pass
+                self._interval = min(self._interval * 1.5, STREAM_EDIT_MAX_INTERVAL)
+            await self._show(self._pending)
+
+    async def _show(self, text):
+        """Send or edit in partial text; returns whether it was shown (errors are only logged)."""
+        if not text.strip():
+            return False
+        try:
+            if self._reply is None:
+                self._reply = await self._message.reply_text(text)
+            else:
+                await self._reply.edit_text(text)
+            self._shown = text
+            self._last_edit = time.monotonic()
+            return True
+        except Exception as e:
+            logger.debug("StreamingReply - Could not show streamed text: %s", e)
+            return False
+
+
 async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
     text = update.message.text
-    text_lower = text.lower().strip()
+    # Normalize once; every matcher below reuses this instead of re-lowercasing the text
+    msg = build_message_context(text)
+    text_lower = msg.lower.strip()
     user = update.effective_user
 
     # Handle greetings and casual messages quickly (no API calls needed)
-    greetings = ['hello', 'hi', 'hey', 'howdy', 'hola', 'yo', 'sup', 'whats up', "what's up",
-                 'good morning', 'good afternoon', 'good evening', 'greetings']
-    thanks = ['thanks', 'thank you', 'thx', 'ty', 'appreciate it', 'appreciated']
-
     # Check for simple greetings
-    if any(text_lower == g or text_lower.startswith(g + ' ') or text_lower.startswith(g + '!')
-           or text_lower.startswith(g + ',') for g in greetings):
+    if text_lower in GREETINGS or text_lower.startswith(GREETING_PREFIXES):
         await track_event(EVENT_GREETING, user, {'type': 'greeting'})
         await update.message.reply_text(
             "Hello! I'm Bohemia's Steward. How can I help you today?\n\n"
@@ -3650,45 +5425,37 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return
 
     # Check for thanks
-    if any(t in text_lower for t in thanks):
+    if any(t in text_lower for t in THANKS_PHRASES):
         await track_event(EVENT_GREETING, user, {'type': 'thanks'})
         await update.message.reply_text("You're welcome! Let me know if you need anything else.")
         return
 
     # Check for goodbye
-    if text_lower in ['bye', 'goodbye', 'see ya', 'later', 'cya']:
+    if text_lower in GOODBYES:
         await track_event(EVENT_GREETING, user, {'type': 'goodbye'})
         await update.message.reply_text("Goodbye! Feel free to reach out anytime.")
         return
 
     # Check if this is a COA/test result question - redirect to admins
-    if check_for_coa_test_question(text):
-        print(f"[DEBUG] handle_message - COA/test question detected, redirecting to admins")
+    if check_for_coa_test_question(msg):
+        logger.debug("handle_message - COA/test question detected, redirecting to admins")
         await update.message.reply_text(get_admin_redirect_message())
         return
 
     # Check for out-of-scope requests (pricing, exceptions, negotiations)
-    is_out_of_scope, boundary_response = check_out_of_scope_request(text)
+    is_out_of_scope, boundary_response = check_out_of_scope_request(msg)
     if is_out_of_scope:
-        print(f"[DEBUG] handle_message - Out-of-scope request detected")
+        logger.debug("handle_message - Out-of-scope request detected")
         await update.message.reply_text(boundary_response)
         return
 
     # Check if user is asking for the JotForm link / order form
-    jotform_keywords = [
-        'jotform', 'jot form', 'order form', 'ordering form', 'form link',
-        'where is the form', "where's the form", 'link to form', 'link to order',
-        'get the form', 'give me the form', 'send me the form', 'need the form',
-        'where can i order', 'where do i order', 'where to order',
-        'form for the gb', 'form for the current', 'form for current gb',
-        'current gb form', 'gb form', 'group buy form'
-    ]
-    if any(keyword in text_lower for keyword in jotform_keywords):
-        print(f"[DEBUG] handle_message - JotForm link request detected")
+    if any(keyword in text_lower for keyword in JOTFORM_LINK_KEYWORDS):
+        logger.debug("handle_message - JotForm link request detected")
         try:
-            form_id, is_manual = await get_current_gb_form_id()
+            forms = await run_jotform(jotform_helper.get_all_forms)
+            form_id, is_manual = await get_current_gb_form_id(forms)
             if form_id:
-                forms = jotform_helper.get_all_forms()
                 form_title = forms.get(form_id, {}).get('title', 'Current GB')
                 jotform_url = f"https://form.jotform.com/{form_id}"
                 await update.message.reply_text(
@@ -3702,29 +5469,23 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
                 )
             return
         except Exception as e:
-            print(f"[ERROR] handle_message - JotForm link lookup failed: {e}")
+            logger.error("handle_message - JotForm link lookup failed: %s", e)
             await update.message.reply_text(
                 "I had trouble fetching the form link. Try /jotform or ask an admin."
             )
             return
 
     # Check FAQ database first (fast, no API calls needed)
-    faq_answer = check_faq_match(text)
+    faq_answer = check_faq_match(msg)
     if faq_answer:
-        print(f"[DEBUG] handle_message - FAQ match found, returning static answer")
+        logger.debug("handle_message - FAQ match found, returning static answer")
         await track_event(EVENT_FAQ_MATCH, user, {'query': text[:100]})
         await update.message.reply_text(faq_answer)
         return
 
-    # Handle timeline questions
-    if 'how long' in text_lower or 'timeline' in text_lower or 'timeframe' in text_lower:
-        await update.message.reply_text(
-            "Due to the volume of GBs, standard production times, shipping speeds, and custom processing timeframes, we estimate that you will receive your items in 4-8 weeks. This timeframe is subject to change if any of the following scenarios apply:\n"
-            "- Custom made batches\n"
-            "- Package Seizures/Reships\n"
-            "- International Shipping\n\n"
-            "Please DM an admin if you have any further questions."
-        )
+    # Handle timeline questions (matched by the same routing scan as COA and FAQ)
+    if is_timeline_question(msg):
+        await update.message.reply_text(TIMELINE_TEXT)
         return
 
     # ==========================================================================
@@ -3732,21 +5493,25 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
     # ==========================================================================
     # Get existing conversation context (remembers what was discussed before)
     conv_context = get_conversation_context(context)
-    print(f"[DEBUG] handle_message - Conversation context: {conv_context}")
+    logger.debug("handle_message - Conversation context: %s", conv_context)
 
     # Check if this is a follow-up question
     is_followup = is_followup_question(text)
-    print(f"[DEBUG] handle_message - Is follow-up question: {is_followup}")
+    logger.debug("handle_message - Is follow-up question: %s", is_followup)
 
     # Extract what topic the user is asking about
     current_topic = extract_topic_from_message(text)
-    print(f"[DEBUG] handle_message - Current topic: {current_topic}")
+    logger.debug("handle_message - Current topic: %s", current_topic)
 
     # Try to identify which form the user is asking about using ChatGPT
+    # JotForm and OpenAI clients are blocking, so every call below runs in a worker
+    # thread via run_jotform/asyncio.to_thread and the event loop stays free for other users
+    # Answers are streamed into this reply (edited live only in private chats)
+    streaming_reply = StreamingReply(update.message, live=update.effective_chat.type == ChatType.PRIVATE)
     try:
         # Get all available forms
-        available_forms = jotform_helper.get_all_forms()
-        print(f"\n[DEBUG] handle_message - Retrieved {len(available_forms)} forms from JotFormHelper")
+        available_forms = await run_jotform(jotform_helper.get_all_forms)
+        logger.debug("handle_message - Retrieved %s forms from JotFormHelper", len(available_forms))
 
         # ==========================================================================
         # FOLLOW-UP QUESTION HANDLING
@@ -3756,31 +5521,41 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
         use_context = False
 
         if is_followup and conv_context.get('form_id'):
-            # This is a follow-up - use the previously discussed form
+            # This is a follow-up - use the previously discussed form. Nothing to
+            # analyze, so show "typing..." without waiting for Telegram and go
+            # straight to fetching the form data and generating the answer
+            spawn_background_task(send_typing_action(update, context))
             form_result = conv_context.get('form_id')
             use_context = True
-            print(f"[DEBUG] handle_message - Using context form_id: {form_result}")
+            logger.debug("handle_message - Using context form_id: %s", form_result)
         else:
-            # Not a follow-up or no context - analyze the message to identify the form
-            form_result = analyze_message_for_gb(text, available_forms)
-            print(f"[DEBUG] handle_message - analyze_message_for_gb returned: {form_result}")
+            # Not a follow-up or no context - analyze the message to identify the form,
+            # showing "typing..." while the (possibly ChatGPT-backed) analysis runs.
+            # Meanwhile speculatively warm the current GB's caches (the most likely answer);
+            # if the analysis picks another form the warmed entries simply go unused.
+            spawn_background_task(prefetch_current_gb_details())
+            _, form_result = await asyncio.gather(
+                send_typing_action(update, context),
+                analyze_message_for_gb(msg, available_forms)
+            )
+            logger.debug("handle_message - analyze_message_for_gb returned: %s", form_result)
 
         # ==========================================================================
         # HANDLE MULTIPLE FORMS
         # ==========================================================================
         if isinstance(form_result, list) and len(form_result) > 1:
             # Multiple forms match - fetch products from all of them
-            print(f"[DEBUG] handle_message - Multiple forms detected: {form_result}")
+            logger.debug("handle_message - Multiple forms detected: %s", form_result)
+
+            # Fetch products and metadata for every matching form in parallel
+            logger.debug("handle_message - Fetching products and metadata for form_ids: %s", form_result)
+            form_details = await asyncio.gather(*(fetch_form_details(fid) for fid in form_result))
 
             forms_data = []
             all_products = []
-            for fid in form_result:
-                print(f"[DEBUG] handle_message - Fetching products for form_id: {fid}")
-                products = jotform_helper.get_products(fid)
-
+            for fid, products, vendor_info in form_details:
                 if products:
                     form_title = available_forms.get(fid, {}).get('title', 'Group Buy')
-                    vendor_info = jotform_helper.get_form_metadata(fid)
 
                     forms_data.append({
                         'form_id': fid,
@@ -3789,15 +5564,21 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
                         'vendor_info': vendor_info
                     })
                     all_products.extend(products)
-                    print(f"[DEBUG] handle_message - Form {fid} ({form_title}): {len(products)} products")
+                    logger.debug("handle_message - Form %s (%s): %s products", fid, form_title, len(products))
 
             if forms_data:
-                print(f"[DEBUG] handle_message - Generating multi-form answer with {len(forms_data)} forms")
-                answer = await generate_answer_with_multi_form_context_async(text, forms_data, conv_context if use_context else None)
-                await update.message.reply_text(answer)
+                logger.debug("handle_message - Generating multi-form answer with %s forms", len(forms_data))
+                answer = await generate_answer_with_multi_form_context_async(
+                    text, forms_data, conv_context if use_context else None, on_partial=streaming_reply.update
+                )
+                await streaming_reply.finish(answer)
 
                 # Update conversation context - store multiple form info
-                products_mentioned = [p.get('name') for p in all_products if text_lower in p.get('name', '').lower()][:3]
+                products_mentioned = [
+                    p.get('name')
+                    for form_info in forms_data
+                    for p in jotform_helper.search_products(form_info['form_id'], text_lower, form_info['products'])
+                ][:3]
                 update_conversation_context(
                     context,
                     form_id=form_result[0],  # Store first form as primary
@@ -3825,29 +5606,31 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
             products = None
             if use_context and conv_context.get('form_id') == form_id and conv_context.get('cached_products'):
                 products = conv_context.get('cached_products')
-                print(f"[DEBUG] handle_message - Using cached products from context ({len(products)} products)")
+                logger.debug("handle_message - Using cached products from context (%s products)", len(products))
+                logger.debug("handle_message - Fetching form metadata for vendor info")
+                vendor_info = await run_jotform(jotform_helper.get_form_metadata, form_id)
             else:
-                # Fetch fresh products
-                print(f"[DEBUG] handle_message - Fetching products for form_id: {form_id}")
-                products = jotform_helper.get_products(form_id)
-                print(f"[DEBUG] handle_message - Retrieved {len(products) if products else 0} products")
+                # Fetch fresh products and the form metadata (vendor info) in parallel
+                logger.debug("handle_message - Fetching products and metadata for form_id: %s", form_id)
+                _, products, vendor_info = await fetch_form_details(form_id)
+                logger.debug("handle_message - Retrieved %s products", len(products) if products else 0)
 
             if products:
-                # Get form title and metadata (including vendor info)
+                # Get form title (metadata including vendor info was fetched above)
                 form_title = available_forms.get(form_id, {}).get('title', 'Group Buy')
 
-                print(f"[DEBUG] handle_message - Fetching form metadata for vendor info")
-                vendor_info = jotform_helper.get_form_metadata(form_id)
+                logger.debug("handle_message - Generating conversational answer with ChatGPT (context-aware)")
 
-                print(f"[DEBUG] handle_message - Generating conversational answer with ChatGPT (context-aware)")
-
-                # Use the async context-aware function to generate the answer
+                # Use the async context-aware function to generate the answer, streaming
+                # it into the reply as it is generated
                 answer = await generate_answer_with_context_async(
                     text,
                     form_title,
                     products,
                     vendor_info,
-                    conversation_context=conv_context if use_context else None
+                    conversation_context=conv_context if use_context else None,
+                    form_id=form_id,
+                    on_partial=streaming_reply.update
                 )
 
                 # Track the product search
@@ -3858,8 +5641,8 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
                     'is_followup': is_followup
                 })
 
-                print(f"[DEBUG] handle_message - Sending answer to user")
-                await update.message.reply_text(answer)
+                logger.debug("handle_message - Sending answer to user")
+                await streaming_reply.finish(answer)
 
                 # ==========================================================================
                 # UPDATE CONVERSATION CONTEXT
@@ -3896,21 +5679,23 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
             # Check if we can use context to answer
             if conv_context.get('form_id') and conv_context.get('cached_products'):
                 # We have context - try to answer using cached data
-                print(f"[DEBUG] handle_message - No form identified but have context, using cached data")
+                logger.debug("handle_message - No form identified but have context, using cached data")
                 form_id = conv_context['form_id']
                 form_title = conv_context.get('form_title', 'Group Buy')
                 products = conv_context.get('cached_products', [])
 
                 if products:
-                    vendor_info = jotform_helper.get_form_metadata(form_id)
+                    vendor_info = await run_jotform(jotform_helper.get_form_metadata, form_id)
                     answer = await generate_answer_with_context_async(
                         text,
                         form_title,
                         products,
                         vendor_info,
-                        conversation_context=conv_context
+                        conversation_context=conv_context,
+                        form_id=form_id,
+                        on_partial=streaming_reply.update
                     )
-                    await update.message.reply_text(answer)
+                    await streaming_reply.finish(answer)
 
                     # Update context
                     update_conversation_context(
@@ -3921,8 +5706,9 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
                     return
 
             # No context available - ask for clarification
-            forms_names = [f"• {form_data['title']}" for fid, form_data in available_forms.items()]
-            forms_text = "\n".join(forms_names[:5])  # Show up to 5 forms
+            forms_text = "\n".join(  # Show up to 5 forms
+                f"• {title}" for _, title, _ in jotform_helper.get_form_titles(available_forms)[:5]
+            )
 
             await update.message.reply_text(
                 f"I'm not sure which Group Buy you're asking about. Could you please be more specific?\n\n"
@@ -3931,22 +5717,22 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
             )
     except ExternalServiceError as e:
         log_error("handle_message - External service failure", e, {"user_message": text})
-        await update.message.reply_text(
-            "I'm having trouble reaching the data source—please try again."
-        )
+        if not await streaming_reply.abort():
+            await update.message.reply_text(
+                "I'm having trouble reaching the data source—please try again."
+            )
     except Exception as e:
-        log_error("handle_message - Unexpected error", e, {"user_message": text})
-        import traceback
-        traceback.print_exc()
-        await update.message.reply_text(
-            "Sorry, I encountered an error processing your request. Please try again later."
-        )
+        log_error("handle_message - Unexpected error", e, {"user_message": text}, exc_info=True)
+        if not await streaming_reply.abort():
+            await update.message.reply_text(
+                "Sorry, I encountered an error processing your request. Please try again later."
+            )
 
 async def post_init(application):
     """Initialize database and other startup tasks."""
-    print("[STARTUP] Initializing database...")
+    logger.info("Initializing database...")
     await init_db()
-    print("[STARTUP] Database initialized.")
+    logger.info("Database initialized.")
 
     # Register bot commands with Telegram (shows in command menu when user types '/')
     # Only register user-facing commands - admin commands are hidden from menu
@@ -3967,12 +5753,69 @@ async def post_init(application):
         BotCommand("unsubscribe", "Unsubscribe from reminders"),
     ]
     await application.bot.set_my_commands(commands)
-    print("[STARTUP] Bot commands registered with Telegram.")
+    logger.info("Bot commands registered with Telegram.")
+
+
+def configure_logging():
+    """
+    Route all log records through a queue so the event loop never blocks on console I/O;
+    a QueueListener thread does the actual writing. Returns the started listener.
+    """
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s"))
+
+    root_logger = logging.getLogger()
+    root_logger.addHandler(QueueHandler(log_queue))
+    # Third-party libraries stay at WARNING; LOG_LEVEL controls the bot's own loggers
+    root_logger.setLevel(logging.WARNING)
+    logger.setLevel(LOG_LEVEL)
+
+    listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    listener.start()
+    return listener
+
+
+def install_uvloop():
+    """Use uvloop's faster event loop when it is installed; otherwise keep asyncio's default."""
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
 
 
 def main():
+    log_listener = configure_logging()
+    if install_uvloop():
+        logger.info("Using uvloop event loop")
+
     # Build application with post_init callback
-    app = Application.builder().token(TOKEN).post_init(post_init).build()
+    # concurrent_updates lets one user's slow JotForm/OpenAI lookup run alongside others.
+    # The rate limiter throttles every outgoing Bot API call (replies, broadcasts, reminders)
+    # to Telegram's global and per-group limits and retries RetryAfter (429) responses.
+    rate_limiter = AIORateLimiter(
+        overall_max_rate=TELEGRAM_MAX_MESSAGES_PER_SECOND,
+        overall_time_period=1,
+        group_max_rate=TELEGRAM_GROUP_MAX_MESSAGES_PER_MINUTE,
+        group_time_period=60,
+        max_retries=TELEGRAM_RATE_LIMIT_RETRIES
+    )
+    app = (
+        Application.builder()
+        .token(TOKEN)
+        .post_init(post_init)
+        .concurrent_updates(True)
+        .rate_limiter(rate_limiter)
+        .build()
+    )
+
+    # Keep busy forms' products warm (the job queue needs the [job-queue] extra)
+    if PREFETCH_INTERVAL_SECONDS > 0 and app.job_queue is not None:
+        app.job_queue.run_repeating(
+            prefetch_hot_products_job, interval=PREFETCH_INTERVAL_SECONDS, first=PREFETCH_INTERVAL_SECONDS
+        )
 
     # Register command handlers - General
     app.add_handler(CommandHandler("start", start))
@@ -4049,6 +5892,7 @@ def main():
     app.add_handler(CommandHandler("setstatus", setstatus_command))
     app.add_handler(CommandHandler("clearstatus", clearstatus_command))
     app.add_handler(CommandHandler("refresh", refresh_command))
+    app.add_handler(CommandHandler("refreshform", refreshform_command))
     app.add_handler(CommandHandler("addadmin", addadmin_command))
     app.add_handler(CommandHandler("removeadmin", removeadmin_command))
     app.add_handler(CommandHandler("listadmins", listadmins_command))
@@ -4064,8 +5908,21 @@ def main():
     # Register message handler for non-command messages
     app.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, handle_message))
 
-    print(f"Bot is running... (Cache TTL: {CACHE_TTL_SECONDS}s)")
-    app.run_polling()
+    logger.info("Bot is running... (Cache TTL: %ss)", CACHE_TTL_SECONDS)
+    try:
+        if WEBHOOK_URL:
+            logger.info("Receiving updates by webhook at %s (listening on %s:%s)", WEBHOOK_URL, WEBHOOK_LISTEN, WEBHOOK_PORT)
+            app.run_webhook(
+                listen=WEBHOOK_LISTEN,
+                port=WEBHOOK_PORT,
+                url_path=urlparse(WEBHOOK_URL).path.lstrip('/'),
+                webhook_url=WEBHOOK_URL,
+                secret_token=WEBHOOK_SECRET_TOKEN
+            )
+        else:
+            app.run_polling()
+    finally:
+        log_listener.stop()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,58 @@
+"""Regression checks for the typo-tolerant FAQ fallback in bot/main.py."""
+import os
+import sys
+import unittest
+
+# Keep the import from reading or writing a JotForm disk cache
+os.environ['JOTFORM_CACHE_PATH'] = ''
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'bot'))
+
+import main  # noqa: E402
+
+
+def faq_topic(message):
+    """The FAQ_DATABASE key whose answer check_faq_match returns, or None."""
+    answer = main.check_faq_match(message)
+    for topic, faq_data in main.FAQ_DATABASE.items():
+        if faq_data['answer'] == answer:
+            return topic
+    return None
+
+
+@unittest.skipIf(main.Levenshtein is None, "the FAQ typo fallback needs rapidfuzz")
+class FuzzyFaqMatchTests(unittest.TestCase):
+    def setUp(self):
+        main.jotform_helper.clear_all_caches()
+
+    def tearDown(self):
+        main.jotform_helper.clear_all_caches()
+
+    def test_typos_get_the_faq_answer(self):
+        self.assertEqual(faq_topic("shippng to canada?"), faq_topic("shipping to canada?"))
+        self.assertEqual(faq_topic("how do i refnd"), faq_topic("how do i get refund"))
+        self.assertEqual(faq_topic("whats the paymnt method"), faq_topic("payment method"))
+        self.assertEqual(faq_topic("trackng number please"), faq_topic("tracking"))
+        self.assertIsNotNone(faq_topic("shippng to canada?"))
+
+    def test_real_words_near_a_keyword_are_not_typos(self):
+        for message in ("is this custom batch ready", "any shopping deals",
+                        "is this same as last gb", "whats the contract"):
+            with self.subTest(message=message):
+                self.assertIsNone(main.check_faq_match(message))
+
+    def test_messages_naming_a_product_are_left_to_form_routing(self):
+        main.jotform_helper._set_catalog_words('1', ['Retatrutide 30mg'])
+        self.assertIsNone(main.check_faq_match("retatrutide shippng"))
+
+    def test_edit_distance_is_capped_for_short_keywords(self):
+        # "customs" (7 characters) allows one missing letter
+        self.assertIsNotNone(main.check_faq_match("custms"))
+        self.assertIsNone(main.check_faq_match("cstms"))
+
+    def test_extra_or_changed_letters_are_not_typos(self):
+        self.assertIsNone(main.check_faq_match("cusstoms"))
+        self.assertIsNone(main.check_faq_match("shipoing to canada"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+"""Regression checks for recency and title routing in bot/main.py."""
+import os
+import sys
+import unittest
+
+# Keep the import from reading or writing a JotForm disk cache
+os.environ['JOTFORM_CACHE_PATH'] = ''
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'bot'))
+
+import main  # noqa: E402
+
+FORMS = {
+    '1': {'title': 'October GB (CLOSED)', 'latest_submission': '2025-10-01'},
+    '2': {'title': 'Halloween Special GB', 'latest_submission': '2025-10-20'},
+    '3': {'title': 'November GB - VendorX', 'latest_submission': '2025-11-20'},
+}
+
+
+class RecencyQueryTests(unittest.TestCase):
+    def test_recency_words(self):
+        self.assertTrue(main.is_recency_query("what's in the current gb"))
+        self.assertTrue(main.is_recency_query("gb for this month"))
+
+    def test_words_that_only_contain_a_recency_word(self):
+        self.assertFalse(main.is_recency_query("is reta currently in the gb"))
+        self.assertFalse(main.is_recency_query("what gb did i recently order from"))
+
+
+class TitleRuleTests(unittest.TestCase):
+    def test_distinctive_title_word_picks_the_form(self):
+        self.assertEqual(main.match_form_by_title_rules("halloween gb deadline", FORMS), '2')
+        self.assertEqual(main.match_form_by_title_rules("vendorx products", FORMS), '3')
+
+    def test_status_words_do_not_pick_a_form(self):
+        self.assertIsNone(main.match_form_by_title_rules("when is the gb closed", FORMS))
+        self.assertIsNone(main.match_form_by_title_rules("any special deals in the gb", FORMS))
+
+
+if __name__ == '__main__':
+    unittest.main()